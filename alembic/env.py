@@ -25,6 +25,7 @@ from wxcloudrun.models.growth import GrowthRecord
 from wxcloudrun.models.session import UserSession
 from wxcloudrun.models.invitation import Invitation
 from wxcloudrun.models.wechat_token import WeChatAccessToken
+from wxcloudrun.models.daily_summary import BabyDailySummary
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,109 @@
+"""store feeding_sequence as a JSON column with generated summary columns
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 与 wxcloudrun/models/feeding.py 中的生成列表达式保持一致
+SEQUENCE_COUNT_SQL = "JSON_LENGTH(feeding_sequence)"
+SEQUENCE_LAST_SIDE_SQL = (
+    "CASE WHEN JSON_LENGTH(feeding_sequence) > 0 THEN JSON_UNQUOTE(JSON_EXTRACT("
+    "feeding_sequence, CONCAT('$[', JSON_LENGTH(feeding_sequence) - 1, '].side'))) END"
+)
+
+# 回填时每批处理的 id 范围（每批单独提交，避免长事务锁住整张表）
+BACKFILL_BATCH_SIZE = 2000
+
+
+def _columns() -> dict:
+    insp = sa.inspect(op.get_bind())
+    return {column['name']: column for column in insp.get_columns('feeding_records')}
+
+
+def _copy_in_batches(target: str, expression: str) -> None:
+    """按 id 分批把 feeding_sequence 转换后写入 target 列"""
+    bind = op.get_bind()
+    max_id = bind.execute(sa.text("SELECT COALESCE(MAX(id), 0) FROM feeding_records")).scalar()
+    with op.get_context().autocommit_block():
+        for low in range(0, max_id + 1, BACKFILL_BATCH_SIZE):
+            bind.execute(
+                sa.text(
+                    f"UPDATE feeding_records SET {target} = {expression} "
+                    "WHERE id >= :low AND id < :high AND feeding_sequence IS NOT NULL"
+                ),
+                {"low": low, "high": low + BACKFILL_BATCH_SIZE},
+            )
+
+
+def upgrade() -> None:
+    columns = _columns()
+
+    # 由 sql/tables/04_feeding_records.sql 建表的数据库已经是 JSON 列
+    if not isinstance(columns['feeding_sequence']['type'], sa.JSON):
+        op.add_column(
+            'feeding_records',
+            sa.Column('feeding_sequence_json', sa.JSON(), nullable=True, comment='喂养序列(母乳交替记录)'),
+        )
+        # 无法解析的旧数据（空字符串等）置为 NULL，与此前读取时的处理一致
+        _copy_in_batches(
+            'feeding_sequence_json',
+            "CASE WHEN JSON_VALID(feeding_sequence) THEN CAST(feeding_sequence AS JSON) END",
+        )
+        op.drop_column('feeding_records', 'feeding_sequence')
+        op.alter_column(
+            'feeding_records', 'feeding_sequence_json',
+            new_column_name='feeding_sequence',
+            existing_type=sa.JSON(),
+            existing_nullable=True,
+            existing_comment='喂养序列(母乳交替记录)',
+        )
+        columns = _columns()
+
+    if 'sequence_last_side' not in columns:
+        op.add_column(
+            'feeding_records',
+            sa.Column('sequence_last_side', sa.String(length=8), sa.Computed(SEQUENCE_LAST_SIDE_SQL, persisted=True),
+                      comment='喂养序列最后一段的侧别(生成列)'),
+        )
+    if 'sequence_count' not in columns:
+        op.add_column(
+            'feeding_records',
+            sa.Column('sequence_count', sa.SmallInteger(), sa.Computed(SEQUENCE_COUNT_SQL, persisted=True),
+                      comment='喂养序列分段数(生成列)'),
+        )
+
+
+def downgrade() -> None:
+    columns = _columns()
+    if 'sequence_count' in columns:
+        op.drop_column('feeding_records', 'sequence_count')
+    if 'sequence_last_side' in columns:
+        op.drop_column('feeding_records', 'sequence_last_side')
+
+    op.add_column(
+        'feeding_records',
+        sa.Column('feeding_sequence_text', mysql.TEXT(), nullable=True, comment='喂养序列JSON(母乳交替记录)'),
+    )
+    _copy_in_batches('feeding_sequence_text', "CAST(feeding_sequence AS CHAR)")
+    op.drop_column('feeding_records', 'feeding_sequence')
+    op.alter_column(
+        'feeding_records', 'feeding_sequence_text',
+        new_column_name='feeding_sequence',
+        existing_type=mysql.TEXT(),
+        existing_nullable=True,
+        existing_comment='喂养序列JSON(母乳交替记录)',
+    )
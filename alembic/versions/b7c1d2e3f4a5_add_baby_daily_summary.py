@@ -0,0 +1,112 @@
+"""add baby_daily_summary table
+
+Revision ID: b7c1d2e3f4a5
+Revises: ac8e83d68ac9
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c1d2e3f4a5'
+down_revision: Union[str, None] = 'ac8e83d68ac9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _count_column(name: str, comment: str) -> sa.Column:
+    return sa.Column(name, sa.Integer(), nullable=False, server_default='0', comment=comment)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'baby_daily_summary',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column('baby_id', sa.Integer(), sa.ForeignKey('babies.id', ondelete='CASCADE'), nullable=False, comment='宝宝ID'),
+        sa.Column('summary_date', sa.Date(), nullable=False, comment='日期'),
+        _count_column('feed_count', '喂养次数'),
+        _count_column('breast_left_seconds', '母乳左侧时长(秒)'),
+        _count_column('breast_right_seconds', '母乳右侧时长(秒)'),
+        _count_column('bottle_ml', '奶瓶奶量(ml)'),
+        _count_column('sleep_count', '睡眠记录数'),
+        _count_column('sleep_completed_count', '已完成睡眠记录数'),
+        _count_column('sleep_minutes', '睡眠时长(分钟)'),
+        _count_column('wake_count', '夜醒次数'),
+        _count_column('pee_count', '仅排尿次数'),
+        _count_column('poop_count', '仅排便次数'),
+        _count_column('both_count', '排尿+排便次数'),
+        _count_column('pumping_count', '吸奶次数'),
+        _count_column('pumped_ml', '吸奶总量(ml)'),
+        _count_column('pumped_left_ml', '左侧吸奶量(ml)'),
+        _count_column('pumped_right_ml', '右侧吸奶量(ml)'),
+        sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False, comment='更新时间'),
+        sa.UniqueConstraint('baby_id', 'summary_date', name='uk_baby_date'),
+        mysql_engine='InnoDB',
+        mysql_default_charset='utf8mb4',
+        mysql_collate='utf8mb4_unicode_ci',
+    )
+
+    # 从已有记录回填汇总（口径与 crud/daily_summary.py 保持一致）
+    op.execute("""
+        INSERT INTO baby_daily_summary (baby_id, summary_date, feed_count, breast_left_seconds, breast_right_seconds, bottle_ml)
+        SELECT baby_id, DATE(start_time), COUNT(id),
+               COALESCE(SUM(CASE WHEN feeding_type = 'breast' THEN duration_left ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN feeding_type = 'breast' THEN duration_right ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN feeding_type = 'formula' THEN amount ELSE 0 END), 0)
+        FROM feeding_records
+        GROUP BY baby_id, DATE(start_time)
+        ON DUPLICATE KEY UPDATE
+            feed_count = VALUES(feed_count),
+            breast_left_seconds = VALUES(breast_left_seconds),
+            breast_right_seconds = VALUES(breast_right_seconds),
+            bottle_ml = VALUES(bottle_ml)
+    """)
+    op.execute("""
+        INSERT INTO baby_daily_summary (baby_id, summary_date, sleep_count, sleep_completed_count, sleep_minutes, wake_count)
+        SELECT baby_id, DATE(start_time), COUNT(id),
+               COALESCE(SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN status = 'completed' THEN duration ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN status = 'completed' THEN wake_count ELSE 0 END), 0)
+        FROM sleep_records
+        GROUP BY baby_id, DATE(start_time)
+        ON DUPLICATE KEY UPDATE
+            sleep_count = VALUES(sleep_count),
+            sleep_completed_count = VALUES(sleep_completed_count),
+            sleep_minutes = VALUES(sleep_minutes),
+            wake_count = VALUES(wake_count)
+    """)
+    op.execute("""
+        INSERT INTO baby_daily_summary (baby_id, summary_date, pee_count, poop_count, both_count)
+        SELECT baby_id, DATE(record_time),
+               COALESCE(SUM(CASE WHEN diaper_type = 'pee' THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN diaper_type = 'poop' THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN diaper_type = 'both' THEN 1 ELSE 0 END), 0)
+        FROM diaper_records
+        GROUP BY baby_id, DATE(record_time)
+        ON DUPLICATE KEY UPDATE
+            pee_count = VALUES(pee_count),
+            poop_count = VALUES(poop_count),
+            both_count = VALUES(both_count)
+    """)
+    op.execute("""
+        INSERT INTO baby_daily_summary (baby_id, summary_date, pumping_count, pumped_ml, pumped_left_ml, pumped_right_ml)
+        SELECT baby_id, DATE(record_time), COUNT(id),
+               COALESCE(SUM(total_amount), 0),
+               COALESCE(SUM(left_amount), 0),
+               COALESCE(SUM(right_amount), 0)
+        FROM pumping_records
+        GROUP BY baby_id, DATE(record_time)
+        ON DUPLICATE KEY UPDATE
+            pumping_count = VALUES(pumping_count),
+            pumped_ml = VALUES(pumped_ml),
+            pumped_left_ml = VALUES(pumped_left_ml),
+            pumped_right_ml = VALUES(pumped_right_ml)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('baby_daily_summary')
@@ -0,0 +1,86 @@
+"""convert JSON null feeding_sequence to SQL NULL, make generated columns array-only
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8c9d0e1f2a3'
+down_revision: Union[str, None] = 'a7b8c9d0e1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 与 wxcloudrun/models/feeding.py 中的生成列表达式保持一致（不是数组时为 NULL）
+SEQUENCE_COUNT_SQL = "CASE WHEN JSON_TYPE(feeding_sequence) = 'ARRAY' THEN JSON_LENGTH(feeding_sequence) END"
+SEQUENCE_LAST_SIDE_SQL = (
+    "CASE WHEN JSON_TYPE(feeding_sequence) = 'ARRAY' AND JSON_LENGTH(feeding_sequence) > 0 THEN "
+    "JSON_UNQUOTE(JSON_EXTRACT(feeding_sequence, CONCAT('$[', JSON_LENGTH(feeding_sequence) - 1, '].side'))) END"
+)
+
+# a7b8c9d0e1f2 中的表达式（降级时恢复）
+OLD_SEQUENCE_COUNT_SQL = "JSON_LENGTH(feeding_sequence)"
+OLD_SEQUENCE_LAST_SIDE_SQL = (
+    "CASE WHEN JSON_LENGTH(feeding_sequence) > 0 THEN JSON_UNQUOTE(JSON_EXTRACT("
+    "feeding_sequence, CONCAT('$[', JSON_LENGTH(feeding_sequence) - 1, '].side'))) END"
+)
+
+# 每批处理的 id 范围（每批单独提交，避免长事务锁住整张表）
+BACKFILL_BATCH_SIZE = 2000
+
+
+def _columns() -> set[str]:
+    insp = sa.inspect(op.get_bind())
+    return {column['name'] for column in insp.get_columns('feeding_records')}
+
+
+def _replace_generated_columns(count_sql: str, last_side_sql: str) -> None:
+    columns = _columns()
+    if 'sequence_count' in columns:
+        op.drop_column('feeding_records', 'sequence_count')
+    if 'sequence_last_side' in columns:
+        op.drop_column('feeding_records', 'sequence_last_side')
+    op.add_column(
+        'feeding_records',
+        sa.Column('sequence_last_side', sa.String(length=8), sa.Computed(last_side_sql, persisted=True),
+                  comment='喂养序列最后一段的侧别(生成列)'),
+    )
+    op.add_column(
+        'feeding_records',
+        sa.Column('sequence_count', sa.SmallInteger(), sa.Computed(count_sql, persisted=True),
+                  comment='喂养序列分段数(生成列)'),
+    )
+
+
+def upgrade() -> None:
+    # 先删除生成列，转换数据时不必逐行重算
+    columns = _columns()
+    if 'sequence_count' in columns:
+        op.drop_column('feeding_records', 'sequence_count')
+    if 'sequence_last_side' in columns:
+        op.drop_column('feeding_records', 'sequence_last_side')
+
+    # 此前未传喂养序列的记录写入了 JSON null，统一改为 SQL NULL
+    bind = op.get_bind()
+    max_id = bind.execute(sa.text("SELECT COALESCE(MAX(id), 0) FROM feeding_records")).scalar()
+    with op.get_context().autocommit_block():
+        for low in range(0, max_id + 1, BACKFILL_BATCH_SIZE):
+            bind.execute(
+                sa.text(
+                    "UPDATE feeding_records SET feeding_sequence = NULL "
+                    "WHERE id >= :low AND id < :high AND JSON_TYPE(feeding_sequence) = 'NULL'"
+                ),
+                {"low": low, "high": low + BACKFILL_BATCH_SIZE},
+            )
+
+    _replace_generated_columns(SEQUENCE_COUNT_SQL, SEQUENCE_LAST_SIDE_SQL)
+
+
+def downgrade() -> None:
+    _replace_generated_columns(OLD_SEQUENCE_COUNT_SQL, OLD_SEQUENCE_LAST_SIDE_SQL)
@@ -0,0 +1,77 @@
+"""add composite indexes for hot query shapes
+
+Revision ID: c3d4e5f6a7b8
+Revises: b7c1d2e3f4a5
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b8'
+down_revision: Union[str, None] = 'b7c1d2e3f4a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (表名, 索引名, 列)
+INDEXES = [
+    # 黄疸记录列表/最新一条：此前 baby_id 上没有任何索引
+    ('jaundice_records', 'idx_baby_record_date', ['baby_id', 'record_date']),
+    # 相册列表按创建时间倒序分页
+    ('album_records', 'idx_baby_created_at', ['baby_id', 'created_at']),
+    # 按 (宝宝, 疫苗) 查接种记录
+    ('vaccination_records', 'idx_baby_vaccine', ['baby_id', 'vaccine_id']),
+    # 批量附加创建者信息，覆盖 (user_id, baby_id) 过滤、关系字段与按 id 排序
+    ('baby_family', 'idx_user_baby_relation', ['user_id', 'baby_id', 'relation', 'relation_display']),
+    # 进行中的睡眠
+    ('sleep_records', 'idx_baby_status_start_time', ['baby_id', 'status', 'start_time']),
+    # 宝宝当前有效的邀请码
+    ('invitations', 'idx_baby_status_expire', ['baby_id', 'status', 'expire_at']),
+]
+
+# 被新的复合索引（最左前缀相同）取代的单列索引
+REDUNDANT_INDEXES = [
+    ('album_records', 'ix_album_records_baby_id', ['baby_id']),
+]
+
+
+def _existing_indexes(insp, table: str) -> set[str] | None:
+    """表的索引名集合；表不存在时返回 None"""
+    if not insp.has_table(table):
+        return None
+    return {index['name'] for index in insp.get_indexes(table)}
+
+
+def upgrade() -> None:
+    insp = sa.inspect(op.get_bind())
+
+    # 部分表（黄疸/相册/疫苗）没有建表迁移，由 scripts/migrate.py 的 create_all 创建（自带模型上的索引），
+    # 因此表不存在或索引已存在时跳过
+    for table, name, columns in INDEXES:
+        existing = _existing_indexes(insp, table)
+        if existing is not None and name not in existing:
+            op.create_index(name, table, columns, unique=False)
+
+    for table, name, _ in REDUNDANT_INDEXES:
+        existing = _existing_indexes(insp, table)
+        if existing is not None and name in existing:
+            op.drop_index(name, table_name=table)
+
+
+def downgrade() -> None:
+    insp = sa.inspect(op.get_bind())
+
+    for table, name, columns in REDUNDANT_INDEXES:
+        existing = _existing_indexes(insp, table)
+        if existing is not None and name not in existing:
+            op.create_index(name, table, columns, unique=False)
+
+    for table, name, _ in reversed(INDEXES):
+        existing = _existing_indexes(insp, table)
+        if existing is not None and name in existing:
+            op.drop_index(name, table_name=table)
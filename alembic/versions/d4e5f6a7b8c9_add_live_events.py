@@ -0,0 +1,39 @@
+"""add live_events table
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, None] = 'c3d4e5f6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'live_events',
+        sa.Column('id', sa.BigInteger(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column('baby_id', sa.Integer(), nullable=False, comment='宝宝ID'),
+        sa.Column('event', sa.String(length=32), nullable=False, comment='事件类型'),
+        sa.Column('payload', sa.JSON(), nullable=True, comment='事件数据'),
+        sa.Column('origin', sa.String(length=64), nullable=False, comment='发布事件的进程标识'),
+        sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False, comment='创建时间'),
+        mysql_engine='InnoDB',
+        mysql_default_charset='utf8mb4',
+        mysql_collate='utf8mb4_unicode_ci',
+    )
+    op.create_index('idx_created_at', 'live_events', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_created_at', table_name='live_events')
+    op.drop_table('live_events')
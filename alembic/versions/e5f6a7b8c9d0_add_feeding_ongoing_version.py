@@ -0,0 +1,44 @@
+"""add version column to feeding_ongoing
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _columns(table: str) -> set[str] | None:
+    """表的列名集合；表不存在时返回 None"""
+    insp = sa.inspect(op.get_bind())
+    if not insp.has_table(table):
+        return None
+    return {column['name'] for column in insp.get_columns(table)}
+
+
+def upgrade() -> None:
+    # feeding_ongoing 没有建表迁移（由 scripts/migrate.py 的 create_all 或 sql/create_feeding_ongoing.sql 创建），
+    # 表不存在时由 create_all 按模型建表（已包含该列）
+    columns = _columns('feeding_ongoing')
+    if columns is not None and 'version' not in columns:
+        op.add_column(
+            'feeding_ongoing',
+            sa.Column('version', sa.Integer(), nullable=False, server_default='0',
+                      comment='版本号（每次状态切换+1，用于并发控制）'),
+        )
+
+
+def downgrade() -> None:
+    columns = _columns('feeding_ongoing')
+    if columns is not None and 'version' in columns:
+        op.drop_column('feeding_ongoing', 'version')
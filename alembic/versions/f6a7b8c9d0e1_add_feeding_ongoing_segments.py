@@ -0,0 +1,39 @@
+"""add feeding_ongoing_segments table
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'feeding_ongoing_segments',
+        sa.Column('id', sa.BigInteger(), primary_key=True, autoincrement=True, nullable=False),
+        sa.Column('ongoing_id', sa.Integer(), nullable=False, comment='所属计时ID'),
+        sa.Column('baby_id', sa.Integer(), nullable=False, comment='宝宝ID'),
+        sa.Column('side', sa.Enum('left', 'right', 'paused', name='ongoing_segment_side_enum'), nullable=False, comment='切换后的状态'),
+        sa.Column('action_time', sa.TIMESTAMP(), nullable=False, comment='操作时间'),
+        sa.ForeignKeyConstraint(['baby_id'], ['babies.id'], ondelete='CASCADE'),
+        mysql_engine='InnoDB',
+        mysql_default_charset='utf8mb4',
+        mysql_collate='utf8mb4_unicode_ci',
+    )
+    op.create_index('idx_ongoing_time', 'feeding_ongoing_segments', ['ongoing_id', 'action_time'], unique=False)
+    op.create_index('idx_baby', 'feeding_ongoing_segments', ['baby_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table('feeding_ongoing_segments')
@@ -0,0 +1,44 @@
+"""
+gunicorn 生产环境配置
+启动: gunicorn -c gunicorn.conf.py wxcloudrun:app
+
+所有参数来自 wxcloudrun.core.config.Settings（可通过环境变量 / .env 覆盖）：
+WEB_HOST、WEB_PORT、WEB_WORKERS、WEB_PRELOAD、WEB_MAX_REQUESTS 等
+"""
+from wxcloudrun.core.config import get_settings, prepare_prometheus_multiproc_dir
+
+settings = get_settings()
+
+# Prometheus 多进程指标目录：各工作进程写入同一目录，/metrics 汇总输出
+# 须在加载应用（导入 prometheus_client）之前设置环境变量，并清空上次运行遗留的指标文件
+if settings.metrics_enabled:
+    prepare_prometheus_multiproc_dir(settings)
+
+bind = f"{settings.web_host}:{settings.web_port}"
+workers = settings.worker_count
+# uvicorn 工作进程，事件循环使用 uvloop、HTTP 解析使用 httptools
+worker_class = "wxcloudrun.core.worker.UvicornWorker"
+
+preload_app = settings.web_preload
+max_requests = settings.web_max_requests
+max_requests_jitter = settings.web_max_requests_jitter
+timeout = settings.web_timeout
+graceful_timeout = settings.web_graceful_timeout
+keepalive = settings.web_keepalive
+
+accesslog = "-"
+errorlog = "-"
+loglevel = "info"
+
+
+def post_fork(server, worker):
+    """预加载模式下，子进程丢弃从主进程继承的连接池，避免多个进程共用同一连接"""
+    from wxcloudrun.core.database import engine
+    engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    """工作进程退出时清理其进行中请求数等 live 指标"""
+    if settings.metrics_enabled:
+        from wxcloudrun.core.metrics import mark_process_dead
+        mark_process_dead(worker.pid)
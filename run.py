@@ -1,19 +1,42 @@
 """
-本地开发启动脚本
-生产环境请使用 uvicorn 命令启动
+启动脚本
+
+开发环境（ENV=development）或 WEB_RELOAD=true：单进程 + 热重载
+其他环境：按 WEB_WORKERS 启动多进程（uvloop + httptools）
+生产环境推荐使用 gunicorn -c gunicorn.conf.py wxcloudrun:app
 """
 import sys
 import uvicorn
+from wxcloudrun.core.config import get_settings, prepare_prometheus_multiproc_dir
 
 if __name__ == '__main__':
+    settings = get_settings()
+
     # 支持命令行参数：python run.py <host> <port>
-    host = sys.argv[1] if len(sys.argv) > 1 else "0.0.0.0"
-    port = int(sys.argv[2]) if len(sys.argv) > 2 else 80
+    host = sys.argv[1] if len(sys.argv) > 1 else settings.web_host
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else settings.web_port
 
-    uvicorn.run(
-        "wxcloudrun:app",
-        host=host,
-        port=port,
-        reload=True,  # 开发环境启用热重载
-        log_level="info"
-    )
+    if settings.web_reload or settings.env == "development":
+        uvicorn.run(
+            "wxcloudrun:app",
+            host=host,
+            port=port,
+            reload=True,  # 开发环境启用热重载
+            log_level="info"
+        )
+    else:
+        if settings.metrics_enabled and settings.worker_count > 1:
+            # 多进程时各工作进程把指标写入同一目录，/metrics 才能汇总全部进程（工作进程继承环境变量）
+            prepare_prometheus_multiproc_dir(settings)
+        uvicorn.run(
+            "wxcloudrun:app",
+            host=host,
+            port=port,
+            workers=settings.worker_count,
+            loop="uvloop",
+            http="httptools",
+            limit_max_requests=settings.web_max_requests or None,
+            timeout_graceful_shutdown=settings.web_graceful_timeout,
+            timeout_keep_alive=settings.web_keepalive,
+            log_level="info"
+        )
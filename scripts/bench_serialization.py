@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+首页时间线响应序列化微基准
+
+用 500 条（六类记录合计）内存中的 ORM 对象构造 /api/home 的响应，对比：
+    legacy : 逐条 model_validate -> FastAPI 按 response_model=dict 二次校验/编码 -> JSONResponse(json)
+    orjson : 同上，但用 ORJSONResponse 渲染（仅替换默认响应类的收益）
+    adapter: 预构建 TypeAdapter 批量校验并由 pydantic-core 直接输出 JSON 字节（当前实现）
+
+不连接数据库，也不启动服务，只测序列化本身；同时校验三种方式输出的 JSON 内容一致。
+
+用法:
+    python scripts/bench_serialization.py
+    python scripts/bench_serialization.py --records 500 --rounds 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+
+from wxcloudrun.crud.home import TIMELINE_SOURCES  # noqa: E402
+from wxcloudrun.schemas.home import HomeTimelineResponse  # noqa: E402
+from wxcloudrun.schemas.user import CreatorInfo  # noqa: E402
+from wxcloudrun.utils.serialization import dump_json  # noqa: E402
+
+# 各类记录所需的字段（其余字段为空）
+KIND_FIELDS = {
+    'feeding': lambda t: {'feeding_type': 'formula', 'start_time': t, 'end_time': t + timedelta(minutes=15),
+                          'amount': 120, 'amount_unit': 'ml', 'bottle_content': 'formula', 'notes': '吃得很好'},
+    'diaper': lambda t: {'diaper_type': 'both', 'record_time': t, 'poop_amount': '适中', 'poop_color': '黄色'},
+    'sleep': lambda t: {'start_time': t, 'end_time': t + timedelta(hours=1), 'duration': 3600,
+                        'status': 'completed', 'source': 'manual', 'wake_count': 0},
+    'growth': lambda t: {'record_date': t, 'height': Decimal('62.5'), 'weight': Decimal('6.35')},
+    'jaundice': lambda t: {'record_date': t, 'value': Decimal('8.6'), 'measure_part': 'forehead'},
+    'pumping': lambda t: {'total_amount': 90, 'left_amount': 40, 'right_amount': 50, 'record_time': t},
+}
+# 时间线中各类记录的大致占比
+KIND_WEIGHTS = {'feeding': 40, 'diaper': 30, 'sleep': 20, 'growth': 3, 'jaundice': 2, 'pumping': 5}
+
+
+def build_grouped(total: int) -> dict[str, list]:
+    """构造按类型分组的内存 ORM 对象"""
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    creator = CreatorInfo(user_id=1, nickname='妈妈', relation='mother', relation_display='妈妈')
+    weight_sum = sum(KIND_WEIGHTS.values())
+    grouped = {}
+    next_id = 1
+    for kind, weight in KIND_WEIGHTS.items():
+        model, _ = TIMELINE_SOURCES[kind]
+        rows = []
+        for i in range(max(1, total * weight // weight_sum)):
+            t = now - timedelta(minutes=37 * next_id)
+            columns = {
+                name: value for name, value in KIND_FIELDS[kind](t).items()
+                if hasattr(model, name)
+            }
+            row = model(id=next_id, baby_id=1, user_id=1, created_at=t, updated_at=t, **columns)
+            if kind != 'jaundice':
+                row.created_by = creator
+            rows.append(row)
+            next_id += 1
+        grouped[kind] = rows
+    return grouped
+
+
+_loop = asyncio.new_event_loop()
+
+
+def render_legacy(grouped: dict, field, response_class) -> bytes:
+    """改造前的路径：逐条 model_validate，FastAPI 按 response_model 再校验编码，最后渲染"""
+    content = {
+        kind: [
+            HomeTimelineResponse.model_fields[kind].annotation.__args__[0].model_validate(r, from_attributes=True)
+            for r in rows
+        ]
+        for kind, rows in grouped.items()
+    }
+    content['next_cursor'] = None
+    encoded = _loop.run_until_complete(serialize_response(field=field, response_content=content, is_coroutine=True))
+    return response_class(encoded).body
+
+
+def render_adapter(grouped: dict) -> bytes:
+    """当前路径：TypeAdapter 批量校验并直接输出 JSON 字节"""
+    return dump_json(HomeTimelineResponse, {**grouped, 'next_cursor': None})
+
+
+def bench(fn, rounds: int) -> dict:
+    fn()  # 预热（构建 schema 等一次性开销不计入）
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        'mean': statistics.fmean(samples),
+        'p50': samples[len(samples) // 2],
+        'p95': samples[int(len(samples) * 0.95) - 1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="首页时间线响应序列化微基准")
+    parser.add_argument("--records", type=int, default=500, help="记录总数（六类合计）")
+    parser.add_argument("--rounds", type=int, default=100, help="每种方式的重复次数")
+    args = parser.parse_args()
+
+    grouped = build_grouped(args.records)
+    total = sum(len(rows) for rows in grouped.values())
+    field = create_model_field(name="Response_home", type_=dict, mode="serialization")
+
+    cases = {
+        'legacy': lambda: render_legacy(grouped, field, JSONResponse),
+        'orjson': lambda: render_legacy(grouped, field, ORJSONResponse),
+        'adapter': lambda: render_adapter(grouped),
+    }
+
+    # 输出内容必须一致
+    outputs = {name: json.loads(fn()) for name, fn in cases.items()}
+    if not (outputs['legacy'] == outputs['orjson'] == outputs['adapter']):
+        print("❌ 三种方式输出的 JSON 不一致")
+        return 1
+
+    print("=" * 60)
+    print(f"📦 记录数: {total}，响应大小: {len(cases['adapter']())} 字节，重复 {args.rounds} 次")
+    print("-" * 60)
+    print(f"{'方式':<10}{'mean(ms)':>12}{'p50(ms)':>12}{'p95(ms)':>12}{'加速':>10}")
+    baseline = None
+    for name, fn in cases.items():
+        r = bench(fn, args.rounds)
+        baseline = baseline or r['mean']
+        print(f"{name:<10}{r['mean']:>12.2f}{r['p50']:>12.2f}{r['p95']:>12.2f}{baseline / r['mean']:>9.1f}x")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
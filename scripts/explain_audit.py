@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+查询索引审计脚本
+
+对本地（已灌入测试数据的）MySQL 逐个执行 CRUD 层的读查询形态，捕获实际发出的 SELECT，
+再对每条语句执行 EXPLAIN，标记全表扫描（type=ALL）与全索引扫描（type=index）。
+存在未在白名单中的全扫描时返回非零退出码。
+
+注意：表中数据过少时优化器可能直接选择全表扫描，请先灌入足量数据再审计。
+
+用法:
+    python scripts/explain_audit.py                       # 自动选取一个宝宝及其家庭成员
+    python scripts/explain_audit.py --baby-id 1 --user-id 1
+    python scripts/explain_audit.py --verbose             # 输出每条语句的 EXPLAIN
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, select  # noqa: E402
+
+from wxcloudrun.core.database import SessionLocal, engine  # noqa: E402
+from wxcloudrun.crud import (  # noqa: E402
+    album, baby, diaper, feeding, growth, home, invitation, jaundice,
+    policy, pumping, session, sleep, user, user_preference, vaccine,
+)
+from wxcloudrun.models.baby import BabyFamily  # noqa: E402
+from wxcloudrun.models.user import User  # noqa: E402
+
+# 允许全表扫描的表：数据量很小的配置表
+ALLOWED_FULL_SCANS = {
+    'vaccines',   # 疫苗目录，几十行
+    'policies',   # 协议/政策，按类型列出全部版本
+}
+
+
+def query_shapes(ctx: dict) -> dict:
+    """查询形态：名称 -> fn(db)"""
+    baby_id, user_id, openid = ctx['baby_id'], ctx['user_id'], ctx['openid']
+    now = datetime.now()
+    week_ago = (now - timedelta(days=7)).replace(hour=0, minute=0, second=0, microsecond=0)
+    day_end = now.replace(hour=23, minute=59, second=59, microsecond=0)
+    partial_start = now - timedelta(hours=36)
+    cursor = (now - timedelta(days=3), 2 ** 31 - 1)
+
+    shapes = {
+        # 鉴权 / 用户
+        'user.get_user_by_openid': lambda db: user.get_user_by_openid(db, openid),
+        'session.get_session_by_openid': lambda db: session.get_session_by_openid(db, openid),
+        'session.get_session_by_user_id': lambda db: session.get_session_by_user_id(db, user_id),
+        'baby.is_family_member': lambda db: baby.is_family_member(db, baby_id, user_id),
+        'baby.is_admin': lambda db: baby.is_admin(db, baby_id, user_id),
+        'baby.get_babies_by_user': lambda db: baby.get_babies_by_user(db, user_id),
+        'baby.get_family_members': lambda db: baby.get_family_members(db, baby_id),
+        'user_preference.get_preferences_dict': lambda db: user_preference.get_preferences_dict(db, user_id),
+        'invitation.get_active_invitation_by_baby': lambda db: invitation.get_active_invitation_by_baby(db, baby_id),
+        'policy.get_current_policy': lambda db: policy.get_current_policy(db, 'privacy', None),
+        # 首页
+        'home.get_home_timeline': lambda db: home.get_home_timeline(db, baby_id, limit=100),
+        'home.get_home_timeline(cursor)': lambda db: home.get_home_timeline(
+            db, baby_id, limit=100, cursor=(cursor[0], 'feeding', cursor[1])
+        ),
+        # 记录列表（offset 与游标两种形态，附加创建者信息）
+        'feeding.get_feeding_records_by_baby': lambda db: feeding.get_feeding_records_by_baby(db, baby_id, limit=101),
+        'feeding.get_feeding_records_by_baby(cursor)': lambda db: feeding.get_feeding_records_by_baby(
+            db, baby_id, limit=101, cursor=cursor
+        ),
+        'sleep.get_sleep_records_by_baby': lambda db: sleep.get_sleep_records_by_baby(db, baby_id, limit=101),
+        'sleep.get_sleep_records_by_baby(cursor)': lambda db: sleep.get_sleep_records_by_baby(
+            db, baby_id, limit=101, cursor=cursor
+        ),
+        'diaper.get_diaper_records_by_baby': lambda db: diaper.get_diaper_records_by_baby(db, baby_id, limit=101),
+        'diaper.get_diaper_records_by_baby(cursor)': lambda db: diaper.get_diaper_records_by_baby(
+            db, baby_id, limit=101, cursor=cursor
+        ),
+        'growth.get_growth_records_by_baby': lambda db: growth.get_growth_records_by_baby(db, baby_id, limit=101),
+        'pumping.get_pumping_records_by_baby': lambda db: pumping.get_pumping_records_by_baby(db, baby_id, limit=101),
+        'jaundice.get_jaundice_records_by_baby': lambda db: jaundice.get_jaundice_records_by_baby(db, baby_id, limit=101),
+        'jaundice.get_jaundice_records_by_baby(cursor)': lambda db: jaundice.get_jaundice_records_by_baby(
+            db, baby_id, limit=101, cursor=cursor
+        ),
+        'album.get_album_records_by_baby': lambda db: album.get_album_records_by_baby(db, baby_id, limit=21),
+        'album.get_album_records_by_baby(cursor)': lambda db: album.get_album_records_by_baby(
+            db, baby_id, limit=21, cursor=cursor
+        ),
+        # 最新一条 / 进行中
+        'feeding.get_latest_feeding': lambda db: feeding.get_latest_feeding(db, baby_id),
+        'growth.get_latest_growth': lambda db: growth.get_latest_growth(db, baby_id),
+        'jaundice.get_latest_jaundice': lambda db: jaundice.get_latest_jaundice(db, baby_id),
+        'sleep.get_active_sleep_records_by_baby': lambda db: sleep.get_active_sleep_records_by_baby(db, baby_id),
+        # 统计（整天范围走汇总表，非整天范围走原始记录）
+        'feeding.get_daily_feeding_stats': lambda db: feeding.get_daily_feeding_stats(db, baby_id, now),
+        'sleep.get_sleep_stats_by_date': lambda db: sleep.get_sleep_stats_by_date(db, baby_id, week_ago, day_end, 'day'),
+        'sleep.get_sleep_stats_by_date(raw)': lambda db: sleep.get_sleep_stats_by_date(db, baby_id, partial_start, now),
+        'diaper.get_diaper_count_by_date': lambda db: diaper.get_diaper_count_by_date(db, baby_id, week_ago, day_end, 'day'),
+        'diaper.get_diaper_count_by_date(raw)': lambda db: diaper.get_diaper_count_by_date(db, baby_id, partial_start, now),
+        'pumping.get_pumping_stats_by_date': lambda db: pumping.get_pumping_stats_by_date(db, baby_id, week_ago, day_end, 'day'),
+        'growth.get_growth_curve_data': lambda db: growth.get_growth_curve_data(db, baby_id),
+        # 疫苗
+        'vaccine.get_vaccines': lambda db: vaccine.get_vaccines(db),
+        'vaccine.get_baby_vaccination_records': lambda db: vaccine.get_baby_vaccination_records(db, baby_id),
+        'vaccine.get_vaccination_record': lambda db: vaccine.get_vaccination_record(db, baby_id, 1),
+        'vaccine.get_vaccine_config': lambda db: vaccine.get_vaccine_config(db, baby_id),
+    }
+    return shapes
+
+
+def pick_context(db, baby_id, user_id) -> dict:
+    """选取审计使用的宝宝/用户（未指定时取最早的一条家庭成员关系）"""
+    if baby_id is None or user_id is None:
+        query = select(BabyFamily.baby_id, BabyFamily.user_id)
+        if baby_id is not None:
+            query = query.where(BabyFamily.baby_id == baby_id)
+        if user_id is not None:
+            query = query.where(BabyFamily.user_id == user_id)
+        row = db.execute(query.order_by(BabyFamily.id).limit(1)).first()
+        if row is None:
+            raise RuntimeError("baby_family 中没有数据，请先灌入测试数据")
+        baby_id, user_id = row.baby_id, row.user_id
+    openid = db.execute(select(User.openid).where(User.id == user_id)).scalar() or ''
+    return {'baby_id': baby_id, 'user_id': user_id, 'openid': openid}
+
+
+def capture_selects(fn, db) -> list[tuple[str, object]]:
+    """执行查询形态，返回其发出的全部 SELECT (语句, 参数)"""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+            captured.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        fn(db)
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+        db.rollback()
+    return captured
+
+
+def explain(statement: str, parameters) -> list[dict]:
+    with engine.connect() as conn:
+        result = conn.exec_driver_sql('EXPLAIN ' + statement, parameters)
+        return [dict(row._mapping) for row in result]
+
+
+def full_scans(plan: list[dict]) -> list[dict]:
+    """计划中对实体表的全表/全索引扫描（派生表、UNION 结果等 <...> 不计）"""
+    return [
+        row for row in plan
+        if row.get('type') in ('ALL', 'index')
+        and row.get('table')
+        and not row['table'].startswith('<')
+        and row['table'] not in ALLOWED_FULL_SCANS
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CRUD 查询形态 EXPLAIN 审计")
+    parser.add_argument("--baby-id", type=int, default=None, help="审计使用的宝宝ID")
+    parser.add_argument("--user-id", type=int, default=None, help="审计使用的用户ID")
+    parser.add_argument("--verbose", action="store_true", help="输出每条语句的 EXPLAIN")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        ctx = pick_context(db, args.baby_id, args.user_id)
+        print("=" * 78)
+        print(f"🔍 EXPLAIN 审计  宝宝={ctx['baby_id']} 用户={ctx['user_id']}")
+        print("=" * 78)
+
+        flagged = 0
+        statements = 0
+        for name, fn in query_shapes(ctx).items():
+            try:
+                captured = capture_selects(fn, db)
+            except Exception as e:
+                print(f"⚠️  {name}: 执行失败 {e}")
+                continue
+            problems = []
+            for statement, parameters in captured:
+                statements += 1
+                plan = explain(statement, parameters)
+                if args.verbose:
+                    print(f"--- {name}\n{statement}")
+                    for row in plan:
+                        print(
+                            f"    {row.get('table')}: type={row.get('type')} key={row.get('key')} "
+                            f"rows={row.get('rows')} extra={row.get('Extra')}"
+                        )
+                for row in full_scans(plan):
+                    problems.append((statement, row))
+            if problems:
+                flagged += 1
+                print(f"❌ {name}")
+                for statement, row in problems:
+                    print(
+                        f"    表 {row['table']}: type={row['type']} key={row.get('key')} "
+                        f"rows={row.get('rows')} extra={row.get('Extra')}"
+                    )
+                    print(f"    SQL: {' '.join(statement.split())[:300]}")
+            else:
+                print(f"✅ {name} ({len(captured)} 条语句)")
+
+        print("=" * 78)
+        print(f"📊 查询形态 {len(query_shapes(ctx))} 个，语句 {statements} 条，存在全扫描的形态 {flagged} 个")
+        return 1 if flagged else 0
+    except Exception as e:
+        print(f"❌ 审计失败: {e}")
+        return 1
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
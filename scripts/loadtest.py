@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+API 压测脚本（按线上流量比例回放）
+
+每个虚拟用户从账号清单（scripts/seed_data.py 生成）中取一个账号，按权重循环执行以下场景：
+    home      首页时间线
+    ongoing   母乳计时：查询 -> 开始左侧 -> 切换右侧 -> 暂停 -> 结束
+    scroll    记录列表滚动（按 X-Next-Cursor 连续翻三页）
+    stats     睡眠/排便区间统计 + 当日喂养统计
+    album     相册列表（临时链接走微信桩服务）
+    login     登录（code 即 openid，由微信桩服务原样返回）
+    babies    我的宝宝列表
+
+每次运行按接口输出 p50/p95/p99，并把报告写入 --report-dir；目录中已有报告时，
+与上一次报告对比并输出变化。
+
+准备:
+    1. 本地 MySQL 容器：docker run -d --name baby-mysql -e MYSQL_ROOT_PASSWORD=root \\
+           -e MYSQL_DATABASE=baby_record -p 3306:3306 mysql:8.0
+    2. 建表并灌数据：python scripts/migrate.py && python scripts/seed_data.py --families 2000
+    3. 微信桩服务：python scripts/wechat_stub.py --port 9000 --latency-ms 50
+    4. 启动后端：WX_API_BASE_URL=http://127.0.0.1:9000 gunicorn -c gunicorn.conf.py wxcloudrun:app
+
+用法:
+    python scripts/loadtest.py --base-url http://127.0.0.1:80 --users 100 --duration 120
+    python scripts/loadtest.py --users 200 --duration 300 --label after-index
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import httpx
+
+from loadtest_db_modes import percentile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 场景 -> 权重（按线上接口调用占比估算）
+SCENARIO_WEIGHTS = {
+    'home': 30,
+    'ongoing': 10,
+    'scroll': 20,
+    'stats': 15,
+    'album': 10,
+    'login': 5,
+    'babies': 10,
+}
+
+
+class VirtualUser:
+    """一个虚拟用户：固定账号，按权重随机执行场景并记录每个请求的耗时"""
+
+    def __init__(self, client: httpx.AsyncClient, account: dict, samples: dict, rng: random.Random):
+        self.client = client
+        self.openid = account['openid']
+        self.baby_ids = account['baby_ids']
+        self.samples = samples
+        self.rng = rng
+        self.headers = {'X-Wx-Openid': self.openid}
+
+    async def request(self, name: str, method: str, url: str, **kwargs) -> httpx.Response | None:
+        started = time.perf_counter()
+        try:
+            resp = await self.client.request(method, url, headers=self.headers, **kwargs)
+            ok = resp.status_code < 400
+        except httpx.HTTPError:
+            resp, ok = None, False
+        self.samples[name].append(((time.perf_counter() - started) * 1000, ok))
+        return resp
+
+    @property
+    def baby_id(self) -> int:
+        return self.rng.choice(self.baby_ids)
+
+    async def home(self):
+        await self.request('GET /api/home/baby/{id}', 'GET', f'/api/home/baby/{self.baby_id}', params={'limit': 50})
+
+    async def ongoing(self):
+        baby_id = self.baby_id
+        await self.request('GET /api/feeding/ongoing/{id}', 'GET', f'/api/feeding/ongoing/{baby_id}')
+        for action in ('start_left', 'start_right', 'pause'):
+            await self.request('POST /api/feeding/ongoing/action', 'POST', '/api/feeding/ongoing/action',
+                               json={'baby_id': baby_id, 'action': action})
+        await self.request('POST /api/feeding/ongoing/finish/{id}', 'POST', f'/api/feeding/ongoing/finish/{baby_id}')
+
+    async def scroll(self):
+        # 同一个宝宝连续翻页（游标只对签发它的宝宝有效）
+        baby_id = self.baby_id
+        kind = self.rng.choice(['feeding', 'diaper', 'sleep'])
+        params = {'limit': 20}
+        for _ in range(3):
+            resp = await self.request(f'GET /api/{kind}/baby/{{id}}', 'GET', f'/api/{kind}/baby/{baby_id}',
+                                      params=params)
+            next_cursor = resp.headers.get('X-Next-Cursor') if resp is not None else None
+            if not next_cursor:
+                break
+            params = {'limit': 20, 'cursor': next_cursor}
+
+    async def stats(self):
+        baby_id = self.baby_id
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        week = {
+            'start_date': (today - timedelta(days=6)).isoformat(),
+            'end_date': (today + timedelta(days=1) - timedelta(seconds=1)).isoformat(),
+            'group_by': 'day',
+        }
+        await self.request('GET /api/sleep/baby/{id}/stats', 'GET', f'/api/sleep/baby/{baby_id}/stats', params=week)
+        await self.request('GET /api/diaper/baby/{id}/stats', 'GET', f'/api/diaper/baby/{baby_id}/stats', params=week)
+        await self.request('GET /api/feeding/stats/daily', 'GET', '/api/feeding/stats/daily',
+                           params={'baby_id': baby_id})
+
+    async def album(self):
+        await self.request('GET /api/album/baby/{id}', 'GET', f'/api/album/baby/{self.baby_id}', params={'limit': 20})
+
+    async def login(self):
+        await self.request('POST /api/users/login', 'POST', '/api/users/login', json={'code': self.openid})
+
+    async def babies(self):
+        await self.request('GET /api/babies/my', 'GET', '/api/babies/my')
+
+    async def run(self, deadline: float):
+        names = list(SCENARIO_WEIGHTS)
+        weights = list(SCENARIO_WEIGHTS.values())
+        while time.perf_counter() < deadline:
+            await getattr(self, self.rng.choices(names, weights=weights)[0])()
+
+
+def summarize(samples: dict, elapsed: float) -> dict:
+    endpoints = {}
+    for name, values in sorted(samples.items()):
+        latencies = sorted(v[0] for v in values)
+        endpoints[name] = {
+            'requests': len(values),
+            'errors': sum(1 for v in values if not v[1]),
+            'rps': len(values) / elapsed if elapsed else 0.0,
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95),
+            'p99': percentile(latencies, 99),
+        }
+    all_latencies = sorted(v[0] for values in samples.values() for v in values)
+    total = {
+        'requests': len(all_latencies),
+        'errors': sum(e['errors'] for e in endpoints.values()),
+        'rps': len(all_latencies) / elapsed if elapsed else 0.0,
+        'p50': percentile(all_latencies, 50),
+        'p95': percentile(all_latencies, 95),
+        'p99': percentile(all_latencies, 99),
+    }
+    return {'endpoints': endpoints, 'total': total}
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def latest_report(report_dir: str) -> dict | None:
+    if not os.path.isdir(report_dir):
+        return None
+    names = sorted(name for name in os.listdir(report_dir) if name.endswith('.json'))
+    if not names:
+        return None
+    with open(os.path.join(report_dir, names[-1]), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _delta(current: float, previous: float | None) -> str:
+    if not previous:
+        return ''
+    return f"{(current - previous) / previous * 100:+.0f}%"
+
+
+def print_report(report: dict, previous: dict | None):
+    prev_endpoints = previous['summary']['endpoints'] if previous else {}
+    print("=" * 110)
+    if previous:
+        meta = previous['meta']
+        print(f"📎 对比上一次: {meta['started_at']} {meta.get('label') or ''} (git {meta.get('git') or '-'})")
+    print(f"{'接口':<40}{'请求':>8}{'错误':>6}{'RPS':>8}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'Δp95':>8}{'Δp99':>8}")
+    print("-" * 110)
+    rows = list(report['summary']['endpoints'].items()) + [('TOTAL', report['summary']['total'])]
+    for name, r in rows:
+        prev = previous['summary']['total'] if name == 'TOTAL' and previous else prev_endpoints.get(name, {})
+        print(
+            f"{name:<40}{r['requests']:>8}{r['errors']:>6}{r['rps']:>8.1f}"
+            f"{r['p50']:>10.1f}{r['p95']:>10.1f}{r['p99']:>10.1f}"
+            f"{_delta(r['p95'], prev.get('p95')):>8}{_delta(r['p99'], prev.get('p99')):>8}"
+        )
+    print("=" * 110)
+
+
+async def main_async(args) -> int:
+    with open(args.accounts, encoding='utf-8') as f:
+        accounts = [a for a in json.load(f) if a['baby_ids']]
+    if not accounts:
+        print(f"❌ 账号清单为空: {args.accounts}")
+        return 1
+
+    rng = random.Random(args.seed)
+    samples: dict[str, list] = defaultdict(list)
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=args.timeout) as client:
+        users = [
+            VirtualUser(client, account, samples, random.Random(rng.random()))
+            for account in rng.sample(accounts, min(args.users, len(accounts)))
+        ]
+        # 预热：按需加载路由、建立连接、填充缓存（不计入结果）
+        warmup = asyncio.get_running_loop().time()
+        await asyncio.gather(*(u.home() for u in users[:10]))
+        samples.clear()
+        print(f"🔥 预热完成 ({(asyncio.get_running_loop().time() - warmup) * 1000:.0f} ms)，"
+              f"{len(users)} 个虚拟用户压测 {args.duration}s ...")
+
+        started_at = datetime.now()
+        started = time.perf_counter()
+        await asyncio.gather(*(u.run(started + args.duration) for u in users))
+        elapsed = time.perf_counter() - started
+
+    report = {
+        'meta': {
+            'started_at': started_at.isoformat(timespec='seconds'),
+            'label': args.label,
+            'git': git_revision(),
+            'base_url': args.base_url,
+            'users': len(users),
+            'duration': round(elapsed, 1),
+            'weights': SCENARIO_WEIGHTS,
+        },
+        'summary': summarize(samples, elapsed),
+    }
+    previous = latest_report(args.report_dir)
+    print_report(report, previous)
+
+    os.makedirs(args.report_dir, exist_ok=True)
+    suffix = f"-{args.label}" if args.label else ''
+    path = os.path.join(args.report_dir, f"{started_at.strftime('%Y%m%d-%H%M%S')}{suffix}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"📝 报告已写入: {path}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="按线上流量比例回放的 API 压测")
+    parser.add_argument("--base-url", default="http://127.0.0.1:80", help="服务地址")
+    parser.add_argument("--accounts", default="loadtest/accounts.json", help="账号清单（seed_data.py 生成）")
+    parser.add_argument("--users", type=int, default=50, help="并发虚拟用户数")
+    parser.add_argument("--duration", type=float, default=60, help="压测时长（秒）")
+    parser.add_argument("--timeout", type=float, default=30.0, help="单请求超时（秒）")
+    parser.add_argument("--report-dir", default="loadtest/reports", help="报告目录")
+    parser.add_argument("--label", default="", help="本次运行的标签（写入报告文件名）")
+    parser.add_argument("--seed", type=int, default=7, help="随机种子")
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
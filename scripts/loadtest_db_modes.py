@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+同步/异步数据库路径的并发压测对比
+
+分别压测一个走同步引擎的 def 路由（在线程池中执行）和一个走异步引擎的 async def 路由，
+在相同并发下输出 p50/p95/p99 延迟与吞吐，用于对比两种模式。
+
+用法:
+    python scripts/loadtest_db_modes.py --base-url http://127.0.0.1:80 --openid <已登录用户的 openid>
+    python scripts/loadtest_db_modes.py --openid xxx --concurrency 50 100 200 --requests 2000
+
+默认对比:
+    sync : GET /api/users/me                （def 路由 + 同步引擎）
+    async: GET /api/users/me/preferences    （async def 路由 + 异步引擎）
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+import httpx
+
+SCENARIOS = {
+    "sync": "/api/users/me",
+    "async": "/api/users/me/preferences",
+}
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """最近秩法计算百分位"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(p / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client: httpx.AsyncClient, path: str, concurrency: int, total: int) -> dict:
+    """以固定并发发送 total 个请求，返回延迟统计（毫秒）"""
+    latencies: list[float] = []
+    errors = 0
+    remaining = total
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                resp = await client.get(path)
+                if resp.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+    }
+
+
+async def main_async(args) -> int:
+    headers = {"X-Wx-Openid": args.openid}
+    limits = httpx.Limits(max_connections=max(args.concurrency), max_keepalive_connections=max(args.concurrency))
+    async with httpx.AsyncClient(base_url=args.base_url, headers=headers, limits=limits, timeout=args.timeout) as client:
+        # 预热：建立连接、填充缓存
+        for path in SCENARIOS.values():
+            await run_scenario(client, path, concurrency=min(10, args.requests), total=min(50, args.requests))
+
+        print("=" * 78)
+        print(f"{'模式':<8}{'并发':>6}{'请求数':>8}{'错误':>6}{'RPS':>10}{'p50(ms)':>12}{'p95(ms)':>12}{'p99(ms)':>12}")
+        print("-" * 78)
+        for concurrency in args.concurrency:
+            for mode, path in SCENARIOS.items():
+                r = await run_scenario(client, path, concurrency, args.requests)
+                print(
+                    f"{mode:<8}{concurrency:>6}{r['requests']:>8}{r['errors']:>6}{r['rps']:>10.1f}"
+                    f"{r['p50']:>12.2f}{r['p95']:>12.2f}{r['p99']:>12.2f}"
+                )
+        print("=" * 78)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="同步/异步数据库路径并发压测对比")
+    parser.add_argument("--base-url", default="http://127.0.0.1:80", help="服务地址")
+    parser.add_argument("--openid", required=True, help="已登录用户的 openid（作为 X-Wx-Openid 请求头）")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 50, 100], help="并发数，可传多个")
+    parser.add_argument("--requests", type=int, default=1000, help="每个场景的请求数")
+    parser.add_argument("--timeout", type=float, default=30.0, help="单请求超时（秒）")
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+数据库迁移脚本（部署时显式执行，应用启动时不再建表）
+
+- 全新数据库（无 alembic_version）：按当前模型建表，并将版本标记为 head
+- 已有数据库：执行 alembic upgrade head，再补建尚未纳入迁移脚本的表（只建缺失的表，不修改已有表）
+
+用法:
+    python scripts/migrate.py
+"""
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from alembic import command
+from alembic.config import Config
+from wxcloudrun.core.config import get_settings
+from wxcloudrun.core.database import Base, engine
+from wxcloudrun.core.schema import current_heads, expected_heads
+import wxcloudrun.models  # noqa: F401  注册模型
+import wxcloudrun.models.album  # noqa: F401
+import wxcloudrun.models.feeding_ongoing  # noqa: F401
+import wxcloudrun.models.jaundice  # noqa: F401
+import wxcloudrun.models.policy  # noqa: F401
+import wxcloudrun.models.user_preference  # noqa: F401
+
+
+def main():
+    settings = get_settings()
+    config = Config(os.path.join(PROJECT_ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(PROJECT_ROOT, "alembic"))
+
+    print("=" * 60)
+    print("🗄️  开始数据库迁移...")
+    print(f"📌 环境: {settings.env.upper()}")
+    print(f"🔗 数据库地址: {settings.mysql_address}")
+    print(f"📊 数据库名称: {settings.mysql_database}")
+    print("=" * 60)
+
+    try:
+        current = current_heads(engine)
+        if not current:
+            print("\n✓ 未找到 alembic_version，按当前模型建表...")
+            Base.metadata.create_all(bind=engine)
+            command.stamp(config, "heads")
+        else:
+            print(f"\n✓ 当前版本: {', '.join(sorted(current))}，执行 alembic upgrade head...")
+            command.upgrade(config, "heads")
+            print("\n✓ 补建缺失的表...")
+            Base.metadata.create_all(bind=engine)
+
+        print(f"\n✅ 迁移完成，当前版本: {', '.join(sorted(expected_heads()))}")
+        return 0
+    except Exception as e:
+        print(f"\n❌ 数据库迁移失败: {str(e)}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
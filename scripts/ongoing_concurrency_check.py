@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+母乳计时并发切换检查
+
+多个线程（各自独立的数据库会话，模拟多位家庭成员同时点击）对同一个宝宝反复切换左右侧，
+结束后校验时长既没有丢失也没有重复累计：
+    - 只切换左右侧（不暂停）时，左右累计时长之和 == 最后操作时间 - 开始时间
+    - version == 成功的状态切换次数
+    - 结束计时生成的记录：左右时长之和 == 结束时间 - 开始时间，且喂养序列首尾相接、与左右时长一致
+检查结束后删除生成的喂养记录。需要本地（已灌入测试数据的）MySQL，且所选宝宝当前没有进行中的计时。
+
+用法:
+    python scripts/ongoing_concurrency_check.py
+    python scripts/ongoing_concurrency_check.py --baby-id 1 --threads 20 --taps 15
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select  # noqa: E402
+
+from wxcloudrun.core.database import SessionLocal  # noqa: E402
+from wxcloudrun.crud import feeding as feeding_crud  # noqa: E402
+from wxcloudrun.crud import feeding_ongoing as ongoing_crud  # noqa: E402
+from wxcloudrun.models.baby import BabyFamily  # noqa: E402
+from wxcloudrun.models.feeding_ongoing import FeedingOngoing  # noqa: E402
+
+
+def pick_baby(db, baby_id):
+    """选取没有进行中计时的宝宝，返回 (baby_id, user_id)"""
+    query = select(BabyFamily.baby_id, BabyFamily.user_id).where(
+        BabyFamily.baby_id.not_in(select(FeedingOngoing.baby_id))
+    )
+    if baby_id is not None:
+        query = query.where(BabyFamily.baby_id == baby_id)
+    row = db.execute(query.order_by(BabyFamily.id).limit(1)).first()
+    if row is None:
+        raise RuntimeError("没有可用的宝宝（不存在或已有进行中的计时）")
+    return row.baby_id, row.user_id
+
+
+def tap_worker(baby_id: int, taps: int, max_sleep: float, seed: int, counters: dict, lock: threading.Lock):
+    rng = random.Random(seed)
+    db = SessionLocal()
+    try:
+        for _ in range(taps):
+            time.sleep(rng.uniform(0, max_sleep))
+            try:
+                ongoing_crud.apply_ongoing_action(db, baby_id, rng.choice(['start_left', 'start_right']))
+                key = 'ok'
+            except ongoing_crud.OngoingConflictError:
+                key = 'conflict'
+            with lock:
+                counters[key] += 1
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="母乳计时并发切换检查")
+    parser.add_argument("--baby-id", type=int, default=None, help="使用的宝宝ID")
+    parser.add_argument("--threads", type=int, default=16, help="并发线程数")
+    parser.add_argument("--taps", type=int, default=10, help="每个线程的点击次数")
+    parser.add_argument("--max-sleep-ms", type=int, default=400, help="两次点击之间的最大随机间隔（毫秒）")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        baby_id, user_id = pick_baby(db, args.baby_id)
+    except Exception as e:
+        print(f"❌ {e}")
+        return 1
+    finally:
+        db.close()
+
+    print("=" * 60)
+    print(f"🧪 宝宝 {baby_id}: {args.threads} 个线程 x {args.taps} 次切换")
+    print("=" * 60)
+
+    counters = {'ok': 0, 'conflict': 0}
+    lock = threading.Lock()
+    threads = [
+        threading.Thread(target=tap_worker, args=(baby_id, args.taps, args.max_sleep_ms / 1000, i, counters, lock))
+        for i in range(args.threads)
+    ]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    print(f"⏱️  耗时 {time.perf_counter() - started:.1f}s，成功 {counters['ok']} 次，冲突放弃 {counters['conflict']} 次")
+
+    failures = []
+    db = SessionLocal()
+    try:
+        state = ongoing_crud.get_ongoing_state(db, baby_id)
+        elapsed = int((state['last_action_time'] - state['start_time']).total_seconds())
+        accumulated = state['accumulated_left'] + state['accumulated_right']
+        print(f"📊 左 {state['accumulated_left']}s + 右 {state['accumulated_right']}s = {accumulated}s，"
+              f"开始至最后操作 {elapsed}s，version={state['version']}")
+        if accumulated != elapsed:
+            failures.append(f"累计时长 {accumulated}s != 开始至最后操作 {elapsed}s")
+        # 第一次成功的操作创建计时，其余每次成功的操作追加一个分段（version +1）
+        if state['version'] != counters['ok'] - 1:
+            failures.append(f"version {state['version']} != 成功切换次数 {counters['ok'] - 1}")
+        db.rollback()
+
+        time.sleep(1.2)
+        record = ongoing_crud.finish_ongoing(db, baby_id, user_id)
+        total = record.duration_left + record.duration_right
+        span = int((record.end_time - record.start_time).total_seconds())
+        print(f"📝 结束记录 #{record.id}: 左 {record.duration_left}s + 右 {record.duration_right}s = {total}s，时间跨度 {span}s")
+        if total != span:
+            failures.append(f"记录时长 {total}s != 时间跨度 {span}s")
+        sequence = record.feeding_sequence
+        cursor = record.start_time
+        for item in sequence:
+            start = datetime.fromisoformat(item['start_time'])
+            if start != cursor:
+                failures.append(f"喂养序列不连续：{start} != {cursor}")
+                break
+            cursor = start + timedelta(seconds=item['duration_seconds'])
+        for side in ('left', 'right'):
+            seconds = sum(item['duration_seconds'] for item in sequence if item['side'] == side)
+            if seconds != getattr(record, f'duration_{side}'):
+                failures.append(f"喂养序列{side}侧 {seconds}s != 记录时长 {getattr(record, f'duration_{side}')}s")
+        print(f"🧩 喂养序列 {len(sequence)} 段")
+        feeding_crud.delete_feeding_record(db, record.id)
+    finally:
+        db.close()
+
+    print("=" * 60)
+    for failure in failures:
+        print(f"❌ {failure}")
+    if failures:
+        return 1
+    print("✅ 没有丢失或重复累计的时长")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+冷启动分析脚本
+
+1. 导入耗时：在全新进程中执行 python -X importtime -c "import wxcloudrun"，
+   输出累计耗时最高的模块；超过 --budget-ms 时返回非零退出码（可用于 CI 卡口）
+2. 启动耗时：在全新进程中依次测量 导入应用 -> 启动事件 -> 首个请求（默认 /health 与首屏接口），
+   首屏接口会触发按需加载路由，未登录返回 401 也计入
+
+用法:
+    python scripts/profile_startup.py
+    python scripts/profile_startup.py --budget-ms 1200 --top 30
+    python scripts/profile_startup.py --path /health --path /api/home/baby/1 --path /api/babies/
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STARTUP_SNIPPET = r"""
+import json, sys, time
+t0 = time.perf_counter()
+from wxcloudrun import app
+t1 = time.perf_counter()
+from fastapi.testclient import TestClient
+result = {"import_ms": (t1 - t0) * 1000, "requests": []}
+with TestClient(app) as client:
+    t2 = time.perf_counter()
+    result["startup_ms"] = (t2 - t1) * 1000
+    for path in sys.argv[1:]:
+        s = time.perf_counter()
+        status = client.get(path).status_code
+        first = (time.perf_counter() - s) * 1000
+        s = time.perf_counter()
+        client.get(path)
+        second = (time.perf_counter() - s) * 1000
+        result["requests"].append({"path": path, "status": status, "first_ms": first, "second_ms": second})
+print("__RESULT__" + json.dumps(result))
+"""
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    # 不连接数据库，只测应用自身的开销
+    env.setdefault("SCHEMA_CHECK", "off")
+    env["PYTHONPATH"] = PROJECT_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def import_profile(top: int) -> tuple[float, list[tuple[int, int, str]]]:
+    """返回 (总导入耗时 ms, [(self_us, cumulative_us, module)])"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import wxcloudrun"],
+        cwd=PROJECT_ROOT, env=_env(), capture_output=True, text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    total = next((cum for _, cum, name in reversed(rows) if name.strip() == "wxcloudrun"), 0)
+    rows.sort(key=lambda r: r[1], reverse=True)
+    return total / 1000, rows[:top]
+
+
+def startup_profile(paths: list[str]) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", STARTUP_SNIPPET, *paths],
+        cwd=PROJECT_ROOT, env=_env(), capture_output=True, text=True,
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith("__RESULT__"):
+            return json.loads(line[len("__RESULT__"):])
+    raise RuntimeError(proc.stderr[-2000:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="冷启动（导入/启动/首个请求）耗时分析")
+    parser.add_argument("--budget-ms", type=float, default=None, help="导入耗时预算（毫秒），超出返回 1")
+    parser.add_argument("--top", type=int, default=25, help="输出累计耗时最高的模块数")
+    parser.add_argument("--path", action="append", default=None, help="首个请求的路径，可传多个")
+    args = parser.parse_args()
+    paths = args.path or ["/health", "/api/home/baby/1"]
+
+    total_ms, rows = import_profile(args.top)
+    print("=" * 78)
+    print(f"📦 import wxcloudrun: {total_ms:.1f} ms")
+    print("-" * 78)
+    print(f"{'cumulative(ms)':>15}{'self(ms)':>10}  module")
+    for self_us, cumulative_us, name in rows:
+        print(f"{cumulative_us / 1000:>15.1f}{self_us / 1000:>10.1f}  {name}")
+
+    result = startup_profile(paths)
+    print("=" * 78)
+    print(f"🚀 导入应用: {result['import_ms']:.1f} ms")
+    print(f"🚀 启动事件: {result['startup_ms']:.1f} ms")
+    for item in result["requests"]:
+        print(
+            f"🌐 GET {item['path']} [{item['status']}] 首次 {item['first_ms']:.1f} ms / 再次 {item['second_ms']:.1f} ms"
+        )
+    print("=" * 78)
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"❌ 导入耗时 {total_ms:.1f} ms 超出预算 {args.budget_ms:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+接口 SQL 语句数预算检查
+
+对本地（已灌入测试数据的）MySQL 逐个请求主要的读接口，按 X-Query-Count 响应头检查
+每个接口发出的语句数是否超出预算，用于发现 N+1 查询与重复的鉴权查询。
+每个接口请求前清空登录态缓存，预算包含鉴权查询（最坏情况）。
+
+用法:
+    python scripts/query_budget.py                       # 自动选取一个宝宝及其家庭成员
+    python scripts/query_budget.py --baby-id 1 --user-id 1
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SCHEMA_CHECK", "off")
+os.environ["QUERY_METRICS"] = "true"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from explain_audit import pick_context  # noqa: E402
+from wxcloudrun import app  # noqa: E402
+from wxcloudrun.core.database import SessionLocal  # noqa: E402
+from wxcloudrun.core.query_metrics import assert_route_max_queries  # noqa: E402
+from wxcloudrun.utils.cache import auth_cache  # noqa: E402
+
+
+def route_budgets(baby_id: int) -> list[tuple[str, dict, int]]:
+    """(路径, 查询参数, 语句数上限)"""
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    week = {
+        'start_date': (today - timedelta(days=6)).isoformat(),
+        'end_date': (today + timedelta(days=1) - timedelta(seconds=1)).isoformat(),
+        'group_by': 'day',
+    }
+    return [
+        ('/api/users/me', {}, 3),
+        ('/api/users/me/preferences', {}, 3),
+        ('/api/babies/my', {}, 4),
+        (f'/api/babies/{baby_id}', {}, 4),
+        (f'/api/babies/{baby_id}/family', {}, 5),
+        (f'/api/home/baby/{baby_id}', {'limit': 50}, 13),
+        (f'/api/feeding/baby/{baby_id}', {'limit': 20}, 6),
+        (f'/api/feeding/baby/{baby_id}/latest', {}, 4),
+        ('/api/feeding/stats/daily', {'baby_id': baby_id}, 5),
+        (f'/api/feeding/ongoing/{baby_id}', {}, 4),
+        (f'/api/sleep/baby/{baby_id}', {'limit': 20}, 6),
+        (f'/api/sleep/baby/{baby_id}/active', {}, 4),
+        (f'/api/sleep/baby/{baby_id}/stats', week, 5),
+        (f'/api/diaper/baby/{baby_id}', {'limit': 20}, 6),
+        (f'/api/diaper/baby/{baby_id}/stats', week, 5),
+        (f'/api/growth/baby/{baby_id}', {'limit': 20}, 6),
+        (f'/api/growth/baby/{baby_id}/curve', {}, 4),
+        (f'/api/pumping/baby/{baby_id}', {'limit': 20}, 6),
+        (f'/api/pumping/baby/{baby_id}/stats', week, 5),
+        (f'/api/jaundice/baby/{baby_id}', {'limit': 20}, 6),
+        (f'/api/album/baby/{baby_id}', {'limit': 20}, 6),
+        (f'/api/babies/{baby_id}/vaccines', {}, 5),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="接口 SQL 语句数预算检查")
+    parser.add_argument("--baby-id", type=int, default=None, help="使用的宝宝ID")
+    parser.add_argument("--user-id", type=int, default=None, help="使用的用户ID")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        ctx = pick_context(db, args.baby_id, args.user_id)
+    except Exception as e:
+        print(f"❌ 选取测试数据失败: {e}")
+        return 1
+    finally:
+        db.close()
+
+    print("=" * 78)
+    print(f"🔍 接口语句数预算检查  宝宝={ctx['baby_id']} 用户={ctx['user_id']}")
+    print("=" * 78)
+
+    failed = 0
+    with TestClient(app) as client:
+        client.headers['X-Wx-Openid'] = ctx['openid']
+        for path, params, budget in route_budgets(ctx['baby_id']):
+            auth_cache.clear()
+            try:
+                resp = assert_route_max_queries(client, 'GET', path, budget, params=params)
+            except AssertionError as e:
+                failed += 1
+                print(f"❌ {e}")
+                continue
+            status = '✅' if resp.status_code < 400 else '⚠️ '
+            print(f"{status} GET {path}: {resp.headers['X-Query-Count']}/{budget} 条语句 (HTTP {resp.status_code})")
+
+    print("=" * 78)
+    print(f"📊 接口 {len(route_budgets(ctx['baby_id']))} 个，超出预算 {failed} 个")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
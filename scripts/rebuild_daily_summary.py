@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+每日汇总重建脚本
+从原始记录重新计算 baby_daily_summary，用于回填或修复汇总数据
+
+用法:
+    python scripts/rebuild_daily_summary.py                       # 重建全部
+    python scripts/rebuild_daily_summary.py --baby-id 1           # 只重建某个宝宝
+    python scripts/rebuild_daily_summary.py --start 2026-01-01 --end 2026-01-31
+"""
+import argparse
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wxcloudrun.core.database import SessionLocal
+from wxcloudrun.crud.daily_summary import rebuild_daily_summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="重建宝宝每日汇总表")
+    parser.add_argument("--baby-id", type=int, default=None, help="只重建指定宝宝")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="开始日期 YYYY-MM-DD")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="结束日期 YYYY-MM-DD")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🔄 开始重建每日汇总...")
+    print(f"👶 宝宝: {args.baby_id if args.baby_id is not None else '全部'}")
+    print(f"📅 范围: {args.start or '不限'} ~ {args.end or '不限'}")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        count = rebuild_daily_summary(db, baby_id=args.baby_id, start_day=args.start, end_day=args.end)
+        print(f"✅ 重建完成，当前汇总行数: {count}")
+        return 0
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 重建失败: {str(e)}")
+        return 1
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+压测数据生成脚本
+
+按真实使用习惯批量生成合成数据：每个家庭 2~3 位成员、1~2 个宝宝，每个宝宝默认两年历史，
+每天约 15 次喂养、10 次换尿布、5 段睡眠，以及吸奶、生长、黄疸、相册记录；
+同时为每位成员生成长期有效的登录态，并输出账号清单供 scripts/loadtest.py 使用。
+
+生成的用户 openid 以 --openid-prefix 开头，可与真实数据区分；写入完成后重建每日汇总表。
+
+用法:
+    python scripts/seed_data.py --families 2000
+    python scripts/seed_data.py --families 100 --days 90 --accounts loadtest/accounts.json
+    python scripts/seed_data.py --families 500 --start-family 2000   # 追加一批
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from wxcloudrun.core.database import SessionLocal, engine  # noqa: E402
+from wxcloudrun.crud.daily_summary import rebuild_daily_summary  # noqa: E402
+from wxcloudrun.models.album import AlbumRecord  # noqa: E402
+from wxcloudrun.models.baby import Baby, BabyFamily  # noqa: E402
+from wxcloudrun.models.diaper import DiaperRecord  # noqa: E402
+from wxcloudrun.models.feeding import FeedingRecord  # noqa: E402
+from wxcloudrun.models.growth import GrowthRecord  # noqa: E402
+from wxcloudrun.models.jaundice import JaundiceRecord  # noqa: E402
+from wxcloudrun.models.pumping import PumpingRecord  # noqa: E402
+from wxcloudrun.models.session import UserSession  # noqa: E402
+from wxcloudrun.models.sleep import SleepRecord  # noqa: E402
+from wxcloudrun.models.user import User  # noqa: E402
+
+# (relation, relation_display, 是否管理员)
+MEMBERS = [('mom', '妈妈', 1), ('dad', '爸爸', 0), ('grandma', '奶奶', 0)]
+
+
+class RecordGenerator:
+    """按天生成一个宝宝的各类记录（纯内存，返回可直接批量 INSERT 的字典）"""
+
+    def __init__(self, rng: random.Random, feedings_per_day: int, diapers_per_day: int):
+        self.rng = rng
+        self.feedings_per_day = feedings_per_day
+        self.diapers_per_day = diapers_per_day
+
+    def _times(self, day: datetime, count: int, jitter_minutes: int) -> list[datetime]:
+        """一天内大致均匀分布的 count 个时间点"""
+        step = 24 * 60 / count
+        return [
+            (day + timedelta(minutes=max(0, min(24 * 60 - 1, i * step + self.rng.uniform(0, jitter_minutes)))))
+            .replace(microsecond=0)
+            for i in range(count)
+        ]
+
+    def feedings(self, baby_id: int, user_ids: list[int], day: datetime, age_days: int) -> list[dict]:
+        rows = []
+        count = max(1, self.feedings_per_day + self.rng.randint(-2, 2))
+        for start in self._times(day, count, 40):
+            user_id = self.rng.choice(user_ids)
+            kind = self.rng.random()
+            row = {
+                'baby_id': baby_id, 'user_id': user_id, 'start_time': start,
+                'created_at': start, 'updated_at': start,
+            }
+            if age_days > 180 and kind < 0.15:
+                row.update(feeding_type='solid', food_name=self.rng.choice(['米粉', '南瓜泥', '苹果泥', '蛋黄']),
+                           amount=self.rng.randint(20, 120), amount_unit='g',
+                           end_time=start + timedelta(minutes=self.rng.randint(10, 25)))
+            elif kind < 0.6:
+                left, right = self.rng.randint(180, 900), self.rng.randint(180, 900)
+                sequence = [
+                    {'side': 'left', 'duration_seconds': left, 'start_time': start.isoformat()},
+                    {'side': 'right', 'duration_seconds': right,
+                     'start_time': (start + timedelta(seconds=left)).isoformat()},
+                ]
+                row.update(feeding_type='breast', feeding_sequence=sequence,
+                           duration_left=left, duration_right=right,
+                           end_time=start + timedelta(seconds=left + right))
+            else:
+                row.update(feeding_type='formula', bottle_content=self.rng.choice(['formula', 'breast']),
+                           amount=self.rng.randrange(60, 210, 10), amount_unit='ml',
+                           end_time=start + timedelta(minutes=self.rng.randint(8, 20)))
+            rows.append(row)
+        return rows
+
+    def diapers(self, baby_id: int, user_ids: list[int], day: datetime) -> list[dict]:
+        rows = []
+        count = max(1, self.diapers_per_day + self.rng.randint(-2, 2))
+        for t in self._times(day, count, 60):
+            diaper_type = self.rng.choices(['pee', 'poop', 'both'], weights=[6, 2, 2])[0]
+            row = {
+                'baby_id': baby_id, 'user_id': self.rng.choice(user_ids), 'diaper_type': diaper_type,
+                'record_time': t, 'created_at': t, 'updated_at': t,
+            }
+            if diaper_type != 'pee':
+                row.update(poop_amount=self.rng.choice(['少量', '适中', '大量']),
+                           poop_color=self.rng.choice(['黄色', '绿色', '褐色']),
+                           poop_texture=self.rng.choice(['稀', '正常', '干燥']))
+            rows.append(row)
+        return rows
+
+    def sleeps(self, baby_id: int, user_ids: list[int], day: datetime) -> list[dict]:
+        rows = []
+        for start in self._times(day, self.rng.randint(4, 6), 60):
+            minutes = self.rng.randint(30, 180)
+            end = start + timedelta(minutes=minutes)
+            rows.append({
+                'baby_id': baby_id, 'user_id': self.rng.choice(user_ids), 'status': 'completed', 'source': 'manual',
+                'start_time': start, 'end_time': end, 'duration': minutes,
+                'quality': self.rng.choice(['good', 'normal', 'poor']),
+                'position': self.rng.choice(['left', 'middle', 'right']),
+                'wake_count': self.rng.randint(0, 2), 'created_at': end, 'updated_at': end,
+            })
+        return rows
+
+    def pumpings(self, baby_id: int, user_ids: list[int], day: datetime) -> list[dict]:
+        rows = []
+        count = self.rng.randint(0, 3)
+        for t in self._times(day, count, 90) if count else []:
+            left, right = self.rng.randint(20, 90), self.rng.randint(20, 90)
+            rows.append({
+                'baby_id': baby_id, 'user_id': self.rng.choice(user_ids), 'left_amount': left,
+                'right_amount': right, 'total_amount': left + right, 'record_time': t,
+                'created_at': t, 'updated_at': t,
+            })
+        return rows
+
+    def growth(self, baby_id: int, user_id: int, day: datetime, age_days: int) -> dict:
+        months = age_days / 30
+        t = day + timedelta(hours=10)
+        return {
+            'baby_id': baby_id, 'user_id': user_id, 'record_date': t,
+            'weight': round(3.3 + 0.7 * min(months, 4) + 0.35 * max(0, months - 4) + self.rng.uniform(-0.2, 0.2), 2),
+            'height': round(50 + 3 * min(months, 4) + 1.2 * max(0, months - 4) + self.rng.uniform(-0.5, 0.5), 2),
+            'head_circumference': round(34 + 1.5 * min(months, 4) + 0.4 * max(0, months - 4), 2),
+            'created_at': t, 'updated_at': t,
+        }
+
+    def jaundice(self, baby_id: int, user_id: int, day: datetime, age_days: int) -> dict:
+        t = day + timedelta(hours=9)
+        return {
+            'baby_id': baby_id, 'user_id': user_id, 'record_date': t,
+            'value': round(max(2.0, 12 - abs(age_days - 4) * 1.1 + self.rng.uniform(-1, 1)), 2),
+            'created_at': t, 'updated_at': t,
+        }
+
+    def album(self, baby_id: int, user_id: int, day: datetime) -> dict:
+        t = day + timedelta(hours=self.rng.randint(8, 21), minutes=self.rng.randint(0, 59))
+        return {
+            'baby_id': baby_id, 'user_id': user_id, 'media_type': 'image',
+            'file_id': f"cloud://seed-env.seed/album/{baby_id}/{int(t.timestamp())}.jpg",
+            'created_at': t, 'updated_at': t,
+        }
+
+
+def _bulk_insert(conn, table, rows: list[dict], batch_size: int) -> int:
+    for i in range(0, len(rows), batch_size):
+        conn.execute(insert(table), rows[i:i + batch_size])
+    return len(rows)
+
+
+def seed_family(conn, gen: RecordGenerator, rng: random.Random, args, family_no: int, now: datetime) -> dict:
+    """生成一个家庭，返回账号信息"""
+    member_count = rng.choice([2, 2, 3])
+    openids = [f"{args.openid_prefix}-{family_no}-{i}" for i in range(member_count)]
+    user_ids = []
+    for i, openid in enumerate(openids):
+        user_id = conn.execute(insert(User.__table__).values(
+            openid=openid, nickname=f"{MEMBERS[i][1]}{family_no}", created_at=now, updated_at=now,
+        )).inserted_primary_key[0]
+        conn.execute(insert(UserSession.__table__).values(
+            user_id=user_id, openid=openid, session_key=f"seed-session-{family_no}-{i}",
+            expires_at=now + timedelta(days=365), created_at=now, updated_at=now,
+        ))
+        user_ids.append(user_id)
+
+    counts = {}
+    baby_ids = []
+    for b in range(rng.choice([1, 1, 1, 2])):
+        days = args.days if b == 0 else max(1, args.days // 3)
+        birthday = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+        baby_id = conn.execute(insert(Baby.__table__).values(
+            name=f"宝宝{family_no}-{b}", gender=rng.choice(['male', 'female']), birthday=birthday,
+            birth_weight=rng.randint(2800, 4000), birth_height=rng.randint(47, 53),
+            created_by=user_ids[0], created_at=birthday, updated_at=birthday,
+        )).inserted_primary_key[0]
+        baby_ids.append(baby_id)
+        conn.execute(insert(BabyFamily.__table__), [
+            {'baby_id': baby_id, 'user_id': user_id, 'relation': MEMBERS[i][0],
+             'relation_display': MEMBERS[i][1], 'is_admin': MEMBERS[i][2], 'created_at': birthday}
+            for i, user_id in enumerate(user_ids)
+        ])
+
+        rows: dict = {t: [] for t in (FeedingRecord, DiaperRecord, SleepRecord, PumpingRecord,
+                                      GrowthRecord, JaundiceRecord, AlbumRecord)}
+        for age_days in range(days):
+            day = birthday + timedelta(days=age_days)
+            rows[FeedingRecord] += gen.feedings(baby_id, user_ids, day, age_days)
+            rows[DiaperRecord] += gen.diapers(baby_id, user_ids, day)
+            rows[SleepRecord] += gen.sleeps(baby_id, user_ids, day)
+            rows[PumpingRecord] += gen.pumpings(baby_id, user_ids, day)
+            if age_days % 7 == 0:
+                rows[GrowthRecord].append(gen.growth(baby_id, user_ids[0], day, age_days))
+            if age_days < 14:
+                rows[JaundiceRecord].append(gen.jaundice(baby_id, user_ids[0], day, age_days))
+            if rng.random() < 0.7:
+                rows[AlbumRecord].append(gen.album(baby_id, rng.choice(user_ids), day))
+        for model, model_rows in rows.items():
+            counts[model.__tablename__] = counts.get(model.__tablename__, 0) + _bulk_insert(
+                conn, model.__table__, model_rows, args.batch_size
+            )
+    return {'openids': openids, 'baby_ids': baby_ids, 'counts': counts}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="生成压测用的合成数据")
+    parser.add_argument("--families", type=int, default=1000, help="家庭数")
+    parser.add_argument("--start-family", type=int, default=0, help="家庭编号起点（追加生成时避免 openid 冲突）")
+    parser.add_argument("--days", type=int, default=730, help="每个家庭第一个宝宝的历史天数")
+    parser.add_argument("--feedings-per-day", type=int, default=15, help="每天喂养次数（±2 浮动）")
+    parser.add_argument("--diapers-per-day", type=int, default=10, help="每天换尿布次数（±2 浮动）")
+    parser.add_argument("--openid-prefix", default="seed", help="生成用户的 openid 前缀")
+    parser.add_argument("--batch-size", type=int, default=5000, help="批量 INSERT 的行数")
+    parser.add_argument("--seed", type=int, default=42, help="随机种子（相同参数生成相同数据）")
+    parser.add_argument("--accounts", default="loadtest/accounts.json", help="账号清单输出路径")
+    parser.add_argument("--skip-summary", action="store_true", help="不重建每日汇总表")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    gen = RecordGenerator(rng, args.feedings_per_day, args.diapers_per_day)
+    now = datetime.now().replace(microsecond=0)
+
+    print("=" * 60)
+    print(f"🌱 生成数据: 家庭 {args.families} 个（编号从 {args.start_family} 开始），历史 {args.days} 天")
+    print("=" * 60)
+
+    first_openid = f"{args.openid_prefix}-{args.start_family}-0"
+    with engine.connect() as conn:
+        if conn.execute(select(User.id).where(User.openid == first_openid)).first():
+            print(f"❌ 用户 {first_openid} 已存在，请调整 --start-family 或 --openid-prefix")
+            return 1
+
+    accounts = []
+    totals: dict[str, int] = {}
+    started = time.perf_counter()
+    for family_no in range(args.start_family, args.start_family + args.families):
+        # 每个家庭一个事务，中途失败时已完成的家庭保留
+        with engine.begin() as conn:
+            result = seed_family(conn, gen, rng, args, family_no, now)
+        for table, count in result['counts'].items():
+            totals[table] = totals.get(table, 0) + count
+        accounts += [{'openid': openid, 'baby_ids': result['baby_ids']} for openid in result['openids']]
+        done = family_no - args.start_family + 1
+        if done % 50 == 0 or done == args.families:
+            elapsed = time.perf_counter() - started
+            print(f"⏳ {done}/{args.families} 个家庭，耗时 {elapsed:.0f}s，"
+                  f"记录 {sum(totals.values())} 条（{sum(totals.values()) / elapsed:.0f} 条/秒）")
+
+    if not args.skip_summary:
+        print("🔄 重建每日汇总...")
+        db = SessionLocal()
+        try:
+            for baby_id in sorted({baby_id for a in accounts for baby_id in a['baby_ids']}):
+                rebuild_daily_summary(db, baby_id=baby_id)
+        finally:
+            db.close()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.accounts)), exist_ok=True)
+    existing = []
+    if os.path.exists(args.accounts):
+        with open(args.accounts, encoding="utf-8") as f:
+            existing = json.load(f)
+    with open(args.accounts, "w", encoding="utf-8") as f:
+        json.dump(existing + accounts, f, ensure_ascii=False)
+
+    print("=" * 60)
+    for table, count in sorted(totals.items()):
+        print(f"📊 {table}: {count}")
+    print(f"👤 账号清单: {args.accounts}（{len(existing) + len(accounts)} 个账号）")
+    print(f"✅ 完成，总耗时 {time.perf_counter() - started:.0f}s")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+微信开放接口桩服务（压测用）
+
+实现后端用到的微信接口，返回固定格式的成功响应，可注入延迟与错误率，
+配合 WX_API_BASE_URL=http://127.0.0.1:9000 使用，避免压测时访问真实微信接口。
+
+登录时 js_code 直接作为 openid 返回，压测脚本用种子数据中的 openid 作为 code 即可登录已有用户。
+
+用法:
+    python scripts/wechat_stub.py --port 9000
+    python scripts/wechat_stub.py --port 9000 --latency-ms 80 --error-rate 0.01
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import random
+import sys
+import time
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+# 1x1 透明 PNG，作为小程序码返回
+PNG_1X1 = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+
+def create_app(latency_ms: float, error_rate: float) -> FastAPI:
+    app = FastAPI(title="wechat-stub", docs_url=None, redoc_url=None, openapi_url=None)
+    stats = {"requests": 0, "errors": 0}
+
+    async def simulate() -> dict | None:
+        """模拟网络延迟与偶发错误；返回非空时为错误响应"""
+        stats["requests"] += 1
+        if latency_ms:
+            await asyncio.sleep(random.uniform(0.5, 1.5) * latency_ms / 1000)
+        if error_rate and random.random() < error_rate:
+            stats["errors"] += 1
+            return {"errcode": -1, "errmsg": "system error (stub)"}
+        return None
+
+    @app.get("/sns/jscode2session")
+    async def jscode2session(js_code: str):
+        if error := await simulate():
+            return error
+        return {
+            "openid": js_code,
+            "session_key": base64.b64encode(hashlib.md5(js_code.encode()).digest()).decode(),
+        }
+
+    @app.get("/cgi-bin/token")
+    async def token():
+        if error := await simulate():
+            return error
+        return {"access_token": f"stub-token-{int(time.time())}", "expires_in": 7200}
+
+    @app.get("/wxa/checksession")
+    async def checksession():
+        return await simulate() or {"errcode": 0, "errmsg": "ok"}
+
+    @app.get("/wxa/resetusersessionkey")
+    async def resetusersessionkey(openid: str):
+        if error := await simulate():
+            return error
+        return {
+            "errcode": 0, "errmsg": "ok", "openid": openid,
+            "session_key": base64.b64encode(hashlib.md5(f"{openid}{time.time()}".encode()).digest()).decode(),
+        }
+
+    @app.post("/wxa/getwxacodeunlimit")
+    async def getwxacodeunlimit():
+        if error := await simulate():
+            return error
+        return Response(content=PNG_1X1, media_type="image/png")
+
+    @app.post("/cgi-bin/message/subscribe/send")
+    async def subscribe_send():
+        return await simulate() or {"errcode": 0, "errmsg": "ok"}
+
+    @app.post("/tcb/batchdownloadfile")
+    async def batchdownloadfile(request: Request):
+        if error := await simulate():
+            return error
+        body = await request.json()
+        return {
+            "errcode": 0,
+            "errmsg": "ok",
+            "file_list": [
+                {
+                    "fileid": item["fileid"],
+                    "temp_file_url": "https://stub.example.com/" + item["fileid"].split("/", 3)[-1],
+                    "status": 0,
+                    "errmsg": "ok",
+                }
+                for item in body.get("file_list", [])
+            ],
+        }
+
+    @app.get("/_stats")
+    async def get_stats():
+        return stats
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="微信开放接口桩服务")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency-ms", type=float, default=0, help="平均响应延迟（毫秒，±50% 随机）")
+    parser.add_argument("--error-rate", type=float, default=0, help="返回错误码的比例（0~1）")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"🧪 微信接口桩服务: http://{args.host}:{args.port}")
+    print(f"⏱️  延迟: {args.latency_ms} ms，错误率: {args.error_rate}")
+    print(f"👉 后端请设置 WX_API_BASE_URL=http://{args.host}:{args.port}")
+    print("=" * 60)
+    uvicorn.run(create_app(args.latency_ms, args.error_rate), host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,12 +3,26 @@ CREATE TABLE IF NOT EXISTS `feeding_ongoing` (
   `id` INT NOT NULL AUTO_INCREMENT COMMENT 'ID',
   `baby_id` INT NOT NULL COMMENT '宝宝ID',
   `start_time` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '本次喂养开始时间',
-  `current_side` ENUM('left', 'right', 'paused') NOT NULL DEFAULT 'paused' COMMENT '当前状态',
-  `last_action_time` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '最后一次操作时间',
-  `accumulated_left` INT NOT NULL DEFAULT 0 COMMENT '左侧累计时长(秒)',
-  `accumulated_right` INT NOT NULL DEFAULT 0 COMMENT '右侧累计时长(秒)',
+  `current_side` ENUM('left', 'right', 'paused') NOT NULL DEFAULT 'paused' COMMENT '开始计时时的状态（之后的切换记录在分段表中）',
+  `last_action_time` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '开始计时时的操作时间',
+  `accumulated_left` INT NOT NULL DEFAULT 0 COMMENT '左侧初始累计时长(秒)',
+  `accumulated_right` INT NOT NULL DEFAULT 0 COMMENT '右侧初始累计时长(秒)',
+  `version` INT NOT NULL DEFAULT 0 COMMENT '初始版本号（当前版本号 = 该值 + 分段数）',
   `updated_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '更新时间',
   PRIMARY KEY (`id`),
   UNIQUE KEY `uk_baby` (`baby_id`),
   CONSTRAINT `fk_ongoing_baby` FOREIGN KEY (`baby_id`) REFERENCES `babies` (`id`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='正在进行的喂养记录';
+
+-- Append-only segment log: one row per side switch / pause
+CREATE TABLE IF NOT EXISTS `feeding_ongoing_segments` (
+  `id` BIGINT NOT NULL AUTO_INCREMENT,
+  `ongoing_id` INT NOT NULL COMMENT '所属计时ID',
+  `baby_id` INT NOT NULL COMMENT '宝宝ID',
+  `side` ENUM('left', 'right', 'paused') NOT NULL COMMENT '切换后的状态',
+  `action_time` TIMESTAMP NOT NULL COMMENT '操作时间',
+  PRIMARY KEY (`id`),
+  KEY `idx_ongoing_time` (`ongoing_id`, `action_time`),
+  KEY `idx_baby` (`baby_id`),
+  CONSTRAINT `fk_ongoing_segment_baby` FOREIGN KEY (`baby_id`) REFERENCES `babies` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='母乳计时分段';
@@ -47,6 +47,12 @@ SOURCE tables/11_pumping_records.sql;
 -- 9. 用户会话表（依赖 users 表）
 SOURCE tables/09_user_sessions.sql;
 
+-- 12. 宝宝每日汇总表（依赖 babies 表）
+SOURCE tables/12_baby_daily_summary.sql;
+
+-- 13. 实时推送事件表（无外键依赖）
+SOURCE tables/13_live_events.sql;
+
 -- ================================================
 -- 初始化完成
 -- ================================================
@@ -16,6 +16,7 @@ CREATE TABLE IF NOT EXISTS `baby_family` (
   UNIQUE KEY `uk_baby_user` (`baby_id`, `user_id`) COMMENT '同一用户在同一家庭中只能有一个角色',
   KEY `idx_baby_relation` (`baby_id`, `relation`),
   KEY `idx_user_id` (`user_id`),
+  KEY `idx_user_baby_relation` (`user_id`, `baby_id`, `relation`, `relation_display`) COMMENT '批量附加创建者信息',
   CONSTRAINT `fk_baby_family_baby` FOREIGN KEY (`baby_id`) REFERENCES `babies` (`id`) ON DELETE CASCADE,
   CONSTRAINT `fk_baby_family_user` FOREIGN KEY (`user_id`) REFERENCES `users` (`id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='宝宝-家庭成员关系表';
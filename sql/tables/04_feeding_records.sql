@@ -10,6 +10,8 @@ CREATE TABLE IF NOT EXISTS `feeding_records` (
 
   -- 母乳喂养字段
   `feeding_sequence` JSON DEFAULT NULL COMMENT '喂养序列(母乳交替记录)',
+  `sequence_last_side` VARCHAR(8) GENERATED ALWAYS AS (CASE WHEN JSON_TYPE(`feeding_sequence`) = 'ARRAY' AND JSON_LENGTH(`feeding_sequence`) > 0 THEN JSON_UNQUOTE(JSON_EXTRACT(`feeding_sequence`, CONCAT('$[', JSON_LENGTH(`feeding_sequence`) - 1, '].side'))) END) STORED COMMENT '喂养序列最后一段的侧别(生成列)',
+  `sequence_count` SMALLINT GENERATED ALWAYS AS (CASE WHEN JSON_TYPE(`feeding_sequence`) = 'ARRAY' THEN JSON_LENGTH(`feeding_sequence`) END) STORED COMMENT '喂养序列分段数(生成列)',
   `breast_side` ENUM('left','right','both','unknown') DEFAULT NULL COMMENT '哺乳侧(用于快速记录模式)',
 
   -- 奶粉/辅食字段
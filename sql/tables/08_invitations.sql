@@ -17,6 +17,7 @@ CREATE TABLE IF NOT EXISTS `invitations` (
   KEY `idx_baby_id` (`baby_id`),
   KEY `idx_status_expire` (`status`, `expire_at`),
   KEY `idx_created_by` (`created_by`),
+  KEY `idx_baby_status_expire` (`baby_id`, `status`, `expire_at`) COMMENT '宝宝当前有效的邀请码',
   CONSTRAINT `fk_invitation_baby` FOREIGN KEY (`baby_id`) REFERENCES `babies` (`id`) ON DELETE CASCADE,
   CONSTRAINT `fk_invitation_creator` FOREIGN KEY (`created_by`) REFERENCES `users` (`id`),
   CONSTRAINT `fk_invitation_user` FOREIGN KEY (`used_by`) REFERENCES `users` (`id`)
@@ -8,6 +8,6 @@ CREATE TABLE `album_records` (
   `created_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
   `updated_at` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '更新时间',
   PRIMARY KEY (`id`),
-  KEY `idx_baby_id` (`baby_id`),
+  KEY `idx_baby_created_at` (`baby_id`, `created_at`) COMMENT '相册列表按创建时间倒序分页',
   KEY `idx_user_id` (`user_id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='成长相册表';
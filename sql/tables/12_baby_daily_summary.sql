@@ -0,0 +1,40 @@
+-- ================================================
+-- 宝宝每日汇总表
+-- 由各记录的增删改增量维护；在已有记录的库上新建此表后，
+-- 执行 python scripts/rebuild_daily_summary.py 回填历史数据
+-- ================================================
+
+CREATE TABLE IF NOT EXISTS `baby_daily_summary` (
+  `id` INT(11) NOT NULL AUTO_INCREMENT,
+  `baby_id` INT(11) NOT NULL COMMENT '宝宝ID',
+  `summary_date` DATE NOT NULL COMMENT '日期',
+
+  -- 喂养（按 start_time 归属日期）
+  `feed_count` INT(11) NOT NULL DEFAULT 0 COMMENT '喂养次数',
+  `breast_left_seconds` INT(11) NOT NULL DEFAULT 0 COMMENT '母乳左侧时长(秒)',
+  `breast_right_seconds` INT(11) NOT NULL DEFAULT 0 COMMENT '母乳右侧时长(秒)',
+  `bottle_ml` INT(11) NOT NULL DEFAULT 0 COMMENT '奶瓶奶量(ml)',
+
+  -- 睡眠（按 start_time 归属日期，时长与夜醒仅统计已完成记录）
+  `sleep_count` INT(11) NOT NULL DEFAULT 0 COMMENT '睡眠记录数',
+  `sleep_completed_count` INT(11) NOT NULL DEFAULT 0 COMMENT '已完成睡眠记录数',
+  `sleep_minutes` INT(11) NOT NULL DEFAULT 0 COMMENT '睡眠时长(分钟)',
+  `wake_count` INT(11) NOT NULL DEFAULT 0 COMMENT '夜醒次数',
+
+  -- 排便/排尿（按 record_time 归属日期）
+  `pee_count` INT(11) NOT NULL DEFAULT 0 COMMENT '仅排尿次数',
+  `poop_count` INT(11) NOT NULL DEFAULT 0 COMMENT '仅排便次数',
+  `both_count` INT(11) NOT NULL DEFAULT 0 COMMENT '排尿+排便次数',
+
+  -- 吸奶（按 record_time 归属日期）
+  `pumping_count` INT(11) NOT NULL DEFAULT 0 COMMENT '吸奶次数',
+  `pumped_ml` INT(11) NOT NULL DEFAULT 0 COMMENT '吸奶总量(ml)',
+  `pumped_left_ml` INT(11) NOT NULL DEFAULT 0 COMMENT '左侧吸奶量(ml)',
+  `pumped_right_ml` INT(11) NOT NULL DEFAULT 0 COMMENT '右侧吸奶量(ml)',
+
+  `updated_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '更新时间',
+
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `uk_baby_date` (`baby_id`, `summary_date`),
+  CONSTRAINT `fk_daily_summary_baby` FOREIGN KEY (`baby_id`) REFERENCES `babies` (`id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='宝宝每日汇总表';
@@ -0,0 +1,16 @@
+-- ================================================
+-- 实时推送事件表
+-- 跨工作进程广播喂养计时/睡眠状态（LIVE_FANOUT=db）用的短期日志，
+-- 各进程按 id 递增拉取，超过 LIVE_EVENT_RETENTION_SECONDS 的事件定期清理
+-- ================================================
+
+CREATE TABLE IF NOT EXISTS `live_events` (
+  `id` BIGINT(20) NOT NULL AUTO_INCREMENT,
+  `baby_id` INT(11) NOT NULL COMMENT '宝宝ID',
+  `event` VARCHAR(32) NOT NULL COMMENT '事件类型',
+  `payload` JSON DEFAULT NULL COMMENT '事件数据',
+  `origin` VARCHAR(64) NOT NULL COMMENT '发布事件的进程标识',
+  `created_at` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '创建时间',
+  PRIMARY KEY (`id`),
+  KEY `idx_created_at` (`created_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='实时推送事件表';
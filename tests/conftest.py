@@ -0,0 +1,201 @@
+"""
+测试公共夹具
+
+测试不依赖 MySQL：模型建在 SQLite 上（内存库或临时文件库），并通过编译钩子与自定义函数
+补齐 SQLite 缺少的 MySQL 语法（ON UPDATE、ON DUPLICATE KEY UPDATE、BIGINT 自增主键、生成列用到的 JSON 函数）。
+"""
+import json
+import os
+
+os.environ["ENV"] = "test"
+os.environ["SCHEMA_CHECK"] = "off"
+os.environ["QUERY_METRICS"] = "true"
+os.environ["LAZY_ROUTERS"] = "false"
+
+from datetime import datetime, timedelta  # noqa: E402
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import BigInteger, create_engine, event  # noqa: E402
+from sqlalchemy.dialects.mysql.dml import OnDuplicateClause  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.ext.compiler import compiles  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import NullPool, StaticPool  # noqa: E402
+from sqlalchemy.schema import CreateColumn, CreateIndex  # noqa: E402
+
+from wxcloudrun.core.database import Base, get_db, get_async_db  # noqa: E402
+from wxcloudrun.core.query_metrics import register_query_events  # noqa: E402
+from wxcloudrun.utils.cache import auth_cache  # noqa: E402
+import wxcloudrun.models  # noqa: E402,F401
+from wxcloudrun.models.user import User  # noqa: E402
+from wxcloudrun.models.session import UserSession  # noqa: E402
+from wxcloudrun.models.baby import Baby, BabyFamily  # noqa: E402
+
+
+# ---------- SQLite 兼容 ----------
+
+@compiles(CreateColumn, "sqlite")
+def _sqlite_column(element, compiler, **kw):
+    # SQLite 不支持 ON UPDATE CURRENT_TIMESTAMP（由 ORM 的 onupdate 或业务代码写入）
+    return compiler.visit_create_column(element, **kw).replace(" ON UPDATE CURRENT_TIMESTAMP", "")
+
+
+@compiles(BigInteger, "sqlite")
+def _sqlite_big_integer(element, compiler, **kw):
+    # 只有 INTEGER PRIMARY KEY 才会自增
+    return "INTEGER"
+
+
+@compiles(CreateIndex, "sqlite")
+def _sqlite_index(element, compiler, **kw):
+    # SQLite 的索引名在整个库内唯一，加表名前缀避免不同表的同名索引冲突
+    index = element.element
+    sql = compiler.visit_create_index(element, **kw)
+    return sql.replace(
+        compiler.preparer.quote(index.name),
+        compiler.preparer.quote(f"{index.table.name}__{index.name}"),
+        1,
+    )
+
+
+@compiles(OnDuplicateClause, "sqlite")
+def _sqlite_on_duplicate(element, compiler, **kw):
+    columns = ", ".join(f"{name} = excluded.{name}" for name in element.update)
+    return f"ON CONFLICT DO UPDATE SET {columns}"
+
+
+def _json_length(value):
+    if value is None:
+        return None
+    decoded = json.loads(value)
+    return len(decoded) if isinstance(decoded, (list, dict)) else 1
+
+
+def _json_type(value):
+    if value is None:
+        return None
+    decoded = json.loads(value)
+    if decoded is None:
+        return "NULL"
+    return {list: "ARRAY", dict: "OBJECT", str: "STRING", bool: "BOOLEAN", int: "INTEGER", float: "DOUBLE"}[type(decoded)]
+
+
+def _json_unquote(value):
+    if isinstance(value, str) and value.startswith('"'):
+        return json.loads(value)
+    return value
+
+
+def _concat(*parts):
+    if any(part is None for part in parts):
+        return None
+    return "".join(str(part) for part in parts)
+
+
+def _register_mysql_functions(dbapi_connection, connection_record):
+    dbapi_connection.create_function("JSON_LENGTH", 1, _json_length, deterministic=True)
+    dbapi_connection.create_function("JSON_TYPE", 1, _json_type, deterministic=True)
+    dbapi_connection.create_function("JSON_UNQUOTE", 1, _json_unquote, deterministic=True)
+    dbapi_connection.create_function("CONCAT", -1, _concat, deterministic=True)
+
+
+def make_engine(url: str = "sqlite://", **kwargs):
+    """建好全部表的 SQLite 引擎（已注册请求级 SQL 统计）"""
+    if url == "sqlite://":
+        # 内存库：所有会话共用同一连接
+        kwargs.setdefault("poolclass", StaticPool)
+    kwargs.setdefault("connect_args", {"check_same_thread": False})
+    engine = create_engine(url, **kwargs)
+    event.listen(engine, "connect", _register_mysql_functions)
+    register_query_events(engine)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+# ---------- 测试数据 ----------
+
+def add_family(db, openid: str = "openid-test", baby_name: str = "测试宝宝") -> tuple[User, Baby]:
+    """创建一个已登录的用户及其宝宝（管理员）"""
+    user = User(openid=openid, nickname="测试家长")
+    db.add(user)
+    db.flush()
+    db.add(UserSession(
+        user_id=user.id,
+        openid=openid,
+        session_key="session-key",
+        expires_at=datetime.now() + timedelta(days=7),
+    ))
+    baby = Baby(name=baby_name, gender="male", birthday=datetime(2024, 1, 1), created_by=user.id)
+    db.add(baby)
+    db.flush()
+    db.add(BabyFamily(baby_id=baby.id, user_id=user.id, relation="爸爸", is_admin=1))
+    db.commit()
+    return user, baby
+
+
+# ---------- 夹具 ----------
+
+@pytest.fixture
+def engine():
+    engine = make_engine()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture(autouse=True)
+def _clear_auth_cache():
+    auth_cache.clear()
+    yield
+    auth_cache.clear()
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    """临时文件库（多个线程 / 同步与异步驱动可同时访问）"""
+    engine = make_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False, "timeout": 30})
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(file_engine):
+    """请求走临时文件库的 TestClient（同步与异步路由共用同一个库）"""
+    from wxcloudrun import app
+
+    session_factory = sessionmaker(bind=file_engine, autocommit=False, autoflush=False)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{file_engine.url.database}", poolclass=NullPool)
+    event.listen(async_engine.sync_engine, "connect", _register_mysql_functions)
+    register_query_events(async_engine.sync_engine)
+    async_session_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with async_session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    try:
+        with TestClient(app) as test_client:
+            yield test_client
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,81 @@
+"""
+工作进程数计算（容器 CPU 配额）与多进程指标目录测试
+"""
+import pytest
+
+from wxcloudrun.core import config
+from wxcloudrun.core.config import Settings, cgroup_cpu_limit, prepare_prometheus_multiproc_dir
+
+
+@pytest.fixture
+def cgroup(tmp_path, monkeypatch):
+    """把 cgroup 文件路径指向临时目录，返回写入函数"""
+    paths = {
+        "v2": tmp_path / "cpu.max",
+        "v1_quota": tmp_path / "cpu.cfs_quota_us",
+        "v1_period": tmp_path / "cpu.cfs_period_us",
+    }
+    monkeypatch.setattr(config, "CGROUP_V2_CPU_MAX", str(paths["v2"]))
+    monkeypatch.setattr(config, "CGROUP_V1_CPU_QUOTA", str(paths["v1_quota"]))
+    monkeypatch.setattr(config, "CGROUP_V1_CPU_PERIOD", str(paths["v1_period"]))
+
+    def write(**contents):
+        for name, content in contents.items():
+            paths[name].write_text(content)
+
+    return write
+
+
+def test_cgroup_v2_quota_rounds_up(cgroup):
+    cgroup(v2="150000 100000\n")
+    assert cgroup_cpu_limit() == 2
+
+
+def test_cgroup_v2_unlimited(cgroup):
+    cgroup(v2="max 100000\n")
+    assert cgroup_cpu_limit() is None
+
+
+def test_cgroup_v1_quota(cgroup):
+    cgroup(v1_quota="400000\n", v1_period="100000\n")
+    assert cgroup_cpu_limit() == 4
+
+
+def test_cgroup_v1_unlimited(cgroup):
+    cgroup(v1_quota="-1\n", v1_period="100000\n")
+    assert cgroup_cpu_limit() is None
+
+
+def test_no_cgroup_files(cgroup):
+    assert cgroup_cpu_limit() is None
+
+
+def test_worker_count_uses_cpu_quota(cgroup, monkeypatch):
+    monkeypatch.setattr(config.os, "sched_getaffinity", lambda pid: set(range(64)), raising=False)
+    cgroup(v2="200000 100000\n")
+    assert Settings(web_workers=0).worker_count == 2
+
+
+def test_worker_count_prefers_web_workers(cgroup):
+    cgroup(v2="200000 100000\n")
+    assert Settings(web_workers=3).worker_count == 3
+
+
+def test_multiproc_dir_keeps_other_files(tmp_path, monkeypatch):
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    (tmp_path / "counter_123.db").write_bytes(b"stale")
+    (tmp_path / "other-app.sock").write_text("keep")
+    (tmp_path / "nested").mkdir()
+
+    path = prepare_prometheus_multiproc_dir(Settings(prometheus_multiproc_dir=str(tmp_path)))
+
+    assert path == str(tmp_path)
+    assert config.os.environ["PROMETHEUS_MULTIPROC_DIR"] == str(tmp_path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["nested", "other-app.sock"]
+
+
+def test_multiproc_dir_prefers_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path / "from-env"))
+    path = prepare_prometheus_multiproc_dir(Settings(prometheus_multiproc_dir=str(tmp_path / "from-settings")))
+    assert path == str(tmp_path / "from-env")
+    assert (tmp_path / "from-env").is_dir() and not (tmp_path / "from-settings").exists()
@@ -0,0 +1,70 @@
+"""
+从已有喂养记录恢复母乳计时：原记录的喂养序列在结束时原样回放
+"""
+from datetime import datetime, timedelta
+
+from conftest import add_family
+from wxcloudrun.crud import feeding_ongoing as ongoing_crud
+from wxcloudrun.models.feeding import FeedingRecord
+
+T0 = datetime(2026, 10, 17, 8, 0, 0)
+
+
+def _record(db, baby_id: int, user_id: int, left: int, right: int, sequence) -> FeedingRecord:
+    record = FeedingRecord(
+        baby_id=baby_id, user_id=user_id, feeding_type='breast', start_time=T0,
+        end_time=T0 + timedelta(minutes=10), duration_left=left, duration_right=right, feeding_sequence=sequence,
+    )
+    db.add(record)
+    db.commit()
+    return record
+
+
+def _item(side: str, seconds: int, start: datetime) -> dict:
+    return {'side': side, 'duration_seconds': seconds, 'start_time': start.isoformat()}
+
+
+def test_resume_replays_original_sequence(db):
+    user, baby = add_family(db)
+    original = [_item('left', 300, T0), _item('right', 200, T0 + timedelta(seconds=400))]
+    record = _record(db, baby.id, user.id, 300, 200, original)
+
+    now = T0 + timedelta(minutes=20)
+    state = ongoing_crud.resume_ongoing(db, record, now)
+    assert state['current_side'] == 'paused'
+    assert (state['accumulated_left'], state['accumulated_right']) == (300, 200)
+    assert db.get(FeedingRecord, record.id) is None
+
+    ongoing_crud.apply_ongoing_action(db, baby.id, 'start_left', now=now)
+    finished = ongoing_crud.finish_ongoing(db, baby.id, user.id, now=now + timedelta(seconds=90))
+
+    assert (finished.start_time, finished.duration_left, finished.duration_right) == (T0, 390, 200)
+    assert finished.feeding_sequence == original + [_item('left', 90, now)]
+
+
+def test_resume_without_sequence_does_not_invent_segments(db):
+    user, baby = add_family(db)
+    record = _record(db, baby.id, user.id, 120, 60, None)
+
+    now = T0 + timedelta(minutes=20)
+    state = ongoing_crud.resume_ongoing(db, record, now)
+    assert (state['accumulated_left'], state['accumulated_right']) == (120, 60)
+
+    ongoing_crud.apply_ongoing_action(db, baby.id, 'start_right', now=now)
+    finished = ongoing_crud.finish_ongoing(db, baby.id, user.id, now=now + timedelta(seconds=30))
+
+    assert (finished.duration_left, finished.duration_right) == (120, 90)
+    assert finished.feeding_sequence == [_item('right', 30, now)]
+
+
+def test_resume_ignores_overlapping_legacy_sequence(db):
+    user, baby = add_family(db)
+    # 早期版本结束计时时把左右侧时长都补在开始时间，两段重叠
+    record = _record(db, baby.id, user.id, 300, 200, [_item('left', 300, T0), _item('right', 200, T0)])
+
+    state = ongoing_crud.resume_ongoing(db, record, T0 + timedelta(minutes=20))
+    assert (state['accumulated_left'], state['accumulated_right']) == (300, 200)
+
+    finished = ongoing_crud.finish_ongoing(db, baby.id, user.id, now=T0 + timedelta(minutes=21))
+    assert (finished.duration_left, finished.duration_right) == (300, 200)
+    assert finished.feeding_sequence == []
@@ -0,0 +1,103 @@
+"""
+母乳计时分段日志的并发切换测试
+
+每次点击追加一条分段，状态由全部分段按时间回放得出。多个线程（各自独立的数据库会话，
+模拟多位家庭成员同时点击）对同一个宝宝切换左右侧，各次点击的时间互不相同，但提交顺序与时间顺序无关。无论提交顺序如何，结果都必须与
+按时间顺序逐个处理这些点击相同：时长既没有丢失也没有重复累计。
+
+SQLite 对写入加库级锁，这里验证的是分段追加 + 回放的正确性；MySQL 上的行锁行为
+可用 scripts/ongoing_concurrency_check.py 对本地库检查。
+"""
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from conftest import add_family
+from wxcloudrun.crud import feeding_ongoing as ongoing_crud
+
+THREADS = 8
+TAPS = 12
+
+
+def _expected_totals(start: datetime, first_side: str, taps: list[tuple[datetime, str]], end: datetime) -> dict:
+    """按时间顺序逐个处理点击得到的左右侧时长"""
+    totals = {'left': 0, 'right': 0}
+    side, last = first_side, start
+    for at, next_side in sorted(taps) + [(end, None)]:
+        totals[side] += int((at - last).total_seconds())
+        side, last = next_side, at
+    return totals
+
+
+def test_parallel_taps_lose_no_seconds(file_engine):
+    session_factory = sessionmaker(bind=file_engine, autocommit=False, autoflush=False)
+    with Session(file_engine) as db:
+        user, baby = add_family(db, openid="openid-ongoing-concurrency")
+        baby_id, user_id = baby.id, user.id
+
+    start = datetime.now().replace(microsecond=0) - timedelta(hours=1)
+    with session_factory() as db:
+        ongoing_crud.apply_ongoing_action(db, baby_id, 'start_left', now=start)
+
+    # 共享时钟：每次点击取一个更晚的时间，取到时间后再去提交（提交顺序与时间顺序不一致）
+    clock = {'now': start}
+    clock_lock = threading.Lock()
+    taps: list[tuple[datetime, str]] = []
+    errors: list[BaseException] = []
+
+    def tap_worker(seed: int) -> None:
+        rng = random.Random(seed)
+        db = session_factory()
+        try:
+            for _ in range(TAPS):
+                action = rng.choice(['start_left', 'start_right'])
+                with clock_lock:
+                    clock['now'] += timedelta(seconds=rng.randint(1, 30))
+                    now = clock['now']
+                time.sleep(rng.uniform(0, 0.005))
+                ongoing_crud.apply_ongoing_action(db, baby_id, action, now=now)
+                with clock_lock:
+                    taps.append((now, 'left' if action == 'start_left' else 'right'))
+        except BaseException as e:  # 在主线程中断言
+            errors.append(e)
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=tap_worker, args=(i,)) for i in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors, errors
+    assert len(taps) == THREADS * TAPS
+
+    last_tap = max(at for at, _ in taps)
+    with session_factory() as db:
+        state = ongoing_crud.get_ongoing_state(db, baby_id)
+    expected = _expected_totals(start, 'left', taps, last_tap)
+    assert state['version'] == THREADS * TAPS
+    assert state['last_action_time'] == last_tap
+    assert state['current_side'] == max(taps)[1]
+    assert (state['accumulated_left'], state['accumulated_right']) == (expected['left'], expected['right'])
+
+    end = last_tap + timedelta(seconds=30)
+    with session_factory() as db:
+        record = ongoing_crud.finish_ongoing(db, baby_id, user_id, now=end)
+        expected = _expected_totals(start, 'left', taps, end)
+        assert (record.duration_left, record.duration_right) == (expected['left'], expected['right'])
+        assert record.duration_left + record.duration_right == int((end - start).total_seconds())
+
+        # 喂养序列首尾相接，且与左右侧时长一致
+        cursor = record.start_time
+        for item in record.feeding_sequence:
+            assert datetime.fromisoformat(item['start_time']) == cursor
+            cursor += timedelta(seconds=item['duration_seconds'])
+        assert cursor == end
+        for side in ('left', 'right'):
+            seconds = sum(item['duration_seconds'] for item in record.feeding_sequence if item['side'] == side)
+            assert seconds == expected[side]
+
+        assert ongoing_crud.get_ongoing_state(db, baby_id) is None
@@ -0,0 +1,54 @@
+"""
+喂养序列生成列：未传喂养序列时存 SQL NULL，生成列只对数组取值
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from conftest import add_family
+from wxcloudrun.crud import feeding as feeding_crud
+from wxcloudrun.schemas.feeding import FeedingRecordCreate
+
+T0 = datetime(2026, 10, 17, 8, 0, 0)
+
+
+def _create(db, baby_id: int, user_id: int, start: datetime, **fields):
+    record = FeedingRecordCreate(baby_id=baby_id, feeding_type='breast', start_time=start, **fields)
+    return feeding_crud.create_feeding_record(db, record, user_id)
+
+
+def test_quick_record_stores_sql_null(db):
+    user, baby = add_family(db)
+    record = _create(db, baby.id, user.id, T0, duration_right=300)
+
+    stored = db.execute(text("SELECT feeding_sequence FROM feeding_records WHERE id = :id"), {"id": record.id}).scalar()
+    assert stored is None
+    assert (record.sequence_count, record.sequence_last_side) == (None, None)
+
+    stats = feeding_crud.get_daily_feeding_stats(db, baby.id, T0)
+    assert stats['last_side'] == 'right'
+
+
+def test_json_null_rows_fall_back_to_durations(db):
+    user, baby = add_family(db)
+    record = _create(db, baby.id, user.id, T0, duration_left=300)
+    # 迁移前写入的 JSON null
+    db.execute(text("UPDATE feeding_records SET feeding_sequence = 'null' WHERE id = :id"), {"id": record.id})
+    db.commit()
+    db.refresh(record)
+
+    assert (record.sequence_count, record.sequence_last_side) == (None, None)
+    assert feeding_crud.get_daily_feeding_stats(db, baby.id, T0)['last_side'] == 'left'
+
+
+def test_sequence_last_side(db):
+    user, baby = add_family(db)
+    sequence = [
+        {'side': 'left', 'duration_seconds': 300, 'start_time': T0.isoformat()},
+        {'side': 'right', 'duration_seconds': 120, 'start_time': (T0 + timedelta(seconds=300)).isoformat()},
+        {'side': 'left', 'duration_seconds': 60, 'start_time': (T0 + timedelta(seconds=420)).isoformat()},
+    ]
+    record = _create(db, baby.id, user.id, T0, feeding_sequence=sequence)
+
+    assert (record.sequence_count, record.sequence_last_side) == (3, 'left')
+    assert feeding_crud.get_daily_feeding_stats(db, baby.id, T0)['last_side'] == 'left'
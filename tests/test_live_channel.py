@@ -0,0 +1,105 @@
+"""
+宝宝实时频道（WebSocket）：鉴权、先快照后推送、心跳，以及其他进程发布的事件经轮询投递
+"""
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+from starlette.websockets import WebSocketDisconnect
+
+from conftest import add_family
+from wxcloudrun.core import live
+from wxcloudrun.core.config import get_settings
+from wxcloudrun.crud import live_event as live_event_crud
+from wxcloudrun.routers import live as live_router
+
+OPENID = "openid-live-channel"
+HEADERS = {"X-Wx-Openid": OPENID}
+
+
+@pytest.fixture
+def baby_id(client, file_engine, monkeypatch):
+    # 频道鉴权、快照与轮询直接使用 SessionLocal，指向测试库
+    session_factory = sessionmaker(bind=file_engine, autocommit=False, autoflush=False)
+    monkeypatch.setattr(live_router, "SessionLocal", session_factory)
+    monkeypatch.setattr(live, "SessionLocal", session_factory)
+    monkeypatch.setattr(get_settings(), "live_poll_interval", 0.02)
+    with Session(file_engine) as db:
+        _, baby = add_family(db, openid=OPENID)
+        return baby.id
+
+
+def _receive(ws, message_type: str) -> dict:
+    """下一条非心跳消息，须为 message_type"""
+    message = ws.receive_json()
+    while message["type"] == "ping":
+        message = ws.receive_json()
+    assert message["type"] == message_type, message
+    return message
+
+
+def test_rejects_unknown_user(client, baby_id):
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(f"/api/live/baby/{baby_id}", headers={"X-Wx-Openid": "openid-stranger"}) as ws:
+            ws.receive_json()
+    assert exc.value.code == 1008
+
+
+def test_rejects_other_family(client, file_engine, baby_id):
+    with Session(file_engine) as db:
+        _, other = add_family(db, openid="openid-other-family", baby_name="别家宝宝")
+        other_id = other.id
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(f"/api/live/baby/{other_id}", headers=HEADERS) as ws:
+            ws.receive_json()
+    assert exc.value.code == 1008
+
+
+def test_snapshot_then_feeding_pushes(client, baby_id):
+    with client.websocket_connect(f"/api/live/baby/{baby_id}", headers=HEADERS) as ws:
+        snapshot = ws.receive_json()
+        assert snapshot == {
+            "type": "snapshot", "baby_id": baby_id, "data": {"feeding_ongoing": None, "sleep_active": None}
+        }
+
+        started = client.post("/api/feeding/ongoing/action", json={"baby_id": baby_id, "action": "start_left"},
+                              headers=HEADERS)
+        assert started.status_code == 200, started.text
+        message = _receive(ws, "feeding_ongoing")
+        assert message["baby_id"] == baby_id
+        assert message["data"]["current_side"] == "left"
+
+        finished = client.post(f"/api/feeding/ongoing/finish/{baby_id}", headers=HEADERS)
+        assert finished.status_code == 200, finished.text
+        assert _receive(ws, "feeding_ongoing")["data"] is None
+
+        resumed = client.post(f"/api/feeding/ongoing/resume/{finished.json()['id']}", headers=HEADERS)
+        assert resumed.status_code == 200, resumed.text
+        assert _receive(ws, "feeding_ongoing")["data"]["current_side"] == "paused"
+
+
+def test_snapshot_reflects_current_state(client, baby_id):
+    started = client.post("/api/feeding/ongoing/action", json={"baby_id": baby_id, "action": "start_right"},
+                          headers=HEADERS)
+    assert started.status_code == 200, started.text
+
+    with client.websocket_connect(f"/api/live/baby/{baby_id}", headers=HEADERS) as ws:
+        snapshot = _receive(ws, "snapshot")
+        assert snapshot["data"]["feeding_ongoing"]["current_side"] == "right"
+
+
+def test_heartbeat_when_idle(client, baby_id, monkeypatch):
+    monkeypatch.setattr(get_settings(), "live_heartbeat_seconds", 0.05)
+    with client.websocket_connect(f"/api/live/baby/{baby_id}", headers=HEADERS) as ws:
+        assert ws.receive_json()["type"] == "snapshot"
+        assert ws.receive_json() == {"type": "ping"}
+
+
+def test_poller_dispatches_other_origin_events(client, file_engine, baby_id):
+    with client.websocket_connect(f"/api/live/baby/{baby_id}", headers=HEADERS) as ws:
+        _receive(ws, "snapshot")
+        # 本进程发布的事件直接投递，轮询时按 origin 跳过，不会重复推送
+        client.post("/api/feeding/ongoing/action", json={"baby_id": baby_id, "action": "start_left"}, headers=HEADERS)
+        _receive(ws, "feeding_ongoing")
+
+        with Session(file_engine) as db:
+            live_event_crud.create_live_event(db, baby_id, "sleep_active", {"id": 42}, "other-host:1")
+        assert _receive(ws, "sleep_active") == {"type": "sleep_active", "baby_id": baby_id, "data": {"id": 42}}
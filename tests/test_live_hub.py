@@ -0,0 +1,48 @@
+"""
+跨进程事件轮询：查询出错后退避重试，其他进程发布的事件仍会投递
+"""
+import asyncio
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from conftest import add_family
+from wxcloudrun.core import live
+from wxcloudrun.core.config import get_settings
+from wxcloudrun.crud import live_event as live_event_crud
+
+
+def test_poller_keeps_running_after_db_errors(file_engine, monkeypatch):
+    with Session(file_engine) as db:
+        _, baby = add_family(db, openid="openid-live-hub")
+        baby_id = baby.id
+    monkeypatch.setattr(live, "SessionLocal", sessionmaker(bind=file_engine))
+    monkeypatch.setattr(get_settings(), "live_poll_interval", 0.01)
+    monkeypatch.setattr(live, "_POLL_BACKOFF_MAX_SECONDS", 0.05)
+
+    calls = {"count": 0}
+    get_events = live_event_crud.get_live_events_after
+
+    def flaky_get_events(db, after_id, limit=500):
+        calls["count"] += 1
+        if calls["count"] <= 3:
+            raise OperationalError("SELECT", {}, Exception("Lost connection to MySQL server"))
+        return get_events(db, after_id, limit)
+
+    monkeypatch.setattr(live_event_crud, "get_live_events_after", flaky_get_events)
+
+    async def scenario():
+        hub = live.LiveHub()
+        async with hub.subscribe(baby_id) as queue:
+            # 首次拉取时已读取起始 id，之后发布的事件都应投递
+            while calls["count"] == 0:
+                await asyncio.sleep(0.01)
+            with Session(file_engine) as db:
+                live_event_crud.create_live_event(db, baby_id, "sleep_active", {"id": 7}, "other-host:1")
+            message = await asyncio.wait_for(queue.get(), timeout=5)
+            assert not hub._poller.done()
+        return message
+
+    message = asyncio.run(scenario())
+    assert message == {"type": "sleep_active", "baby_id": baby_id, "data": {"id": 7}}
+    assert calls["count"] > 3
@@ -0,0 +1,81 @@
+"""
+睡眠记录写接口推送的实时状态（sleep_active）
+
+推送内容始终是宝宝当前进行中的睡眠，与本次操作的记录无关。
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from conftest import add_family
+from wxcloudrun.models.live_event import LiveEvent
+
+OPENID = "openid-live-sleep"
+HEADERS = {"X-Wx-Openid": OPENID}
+
+
+@pytest.fixture
+def baby_id(client, file_engine):
+    with Session(file_engine) as db:
+        _, baby = add_family(db, openid=OPENID)
+        return baby.id
+
+
+def _last_sleep_event(file_engine, baby_id: int):
+    with Session(file_engine) as db:
+        event = (
+            db.query(LiveEvent)
+            .filter(LiveEvent.baby_id == baby_id, LiveEvent.event == "sleep_active")
+            .order_by(LiveEvent.id.desc())
+            .first()
+        )
+        assert event is not None, "没有推送 sleep_active"
+        return event.id, event.payload
+
+
+def test_sleep_writes_publish_current_active_sleep(client, file_engine, baby_id):
+    now = datetime.now().replace(microsecond=0)
+
+    started = client.post("/api/sleep/start", json={"baby_id": baby_id, "start_time": now.isoformat()}, headers=HEADERS)
+    assert started.status_code == 201, started.text
+    active_id = started.json()["id"]
+    _, payload = _last_sleep_event(file_engine, baby_id)
+    assert payload["id"] == active_id
+
+    # 补录一条已结束的睡眠：推送的仍是进行中的那条
+    created = client.post("/api/sleep/", json={
+        "baby_id": baby_id,
+        "start_time": (now - timedelta(hours=5)).isoformat(),
+        "end_time": (now - timedelta(hours=4)).isoformat(),
+    }, headers=HEADERS)
+    assert created.status_code == 201, created.text
+    event_id, payload = _last_sleep_event(file_engine, baby_id)
+    assert payload["id"] == active_id
+
+    updated = client.patch(f"/api/sleep/{created.json()['id']}", json={"notes": "补录"}, headers=HEADERS)
+    assert updated.status_code == 200, updated.text
+    next_event_id, payload = _last_sleep_event(file_engine, baby_id)
+    assert next_event_id > event_id and payload["id"] == active_id
+
+    deleted = client.delete(f"/api/sleep/{created.json()['id']}", headers=HEADERS)
+    assert deleted.status_code == 204
+    event_id, payload = _last_sleep_event(file_engine, baby_id)
+    assert event_id > next_event_id and payload["id"] == active_id
+
+    stopped = client.patch(f"/api/sleep/{active_id}/stop", json={"end_time": (now + timedelta(hours=1)).isoformat()},
+                           headers=HEADERS)
+    assert stopped.status_code == 200, stopped.text
+    _, payload = _last_sleep_event(file_engine, baby_id)
+    assert payload is None
+
+
+def test_deleting_active_sleep_publishes_null(client, file_engine, baby_id):
+    started = client.post("/api/sleep/start", json={"baby_id": baby_id, "start_time": datetime.now().isoformat()},
+                          headers=HEADERS)
+    assert started.status_code == 201, started.text
+
+    deleted = client.delete(f"/api/sleep/{started.json()['id']}", headers=HEADERS)
+    assert deleted.status_code == 204
+    _, payload = _last_sleep_event(file_engine, baby_id)
+    assert payload is None
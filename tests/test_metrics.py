@@ -0,0 +1,97 @@
+"""
+/metrics 与请求级 SQL 统计响应头默认不对外暴露；开启后的路由、微信接口指标标签
+"""
+import asyncio
+import os
+import subprocess
+import sys
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+
+from wxcloudrun.core.config import Settings, get_settings
+from wxcloudrun.utils.wechat import WeChatAPI, WeChatAPIError
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 在开启指标、按需加载路由的全新进程中请求应用，输出 /metrics
+_SCRAPE = """
+from fastapi.testclient import TestClient
+from wxcloudrun import app
+client = TestClient(app)
+for path in ("/api/feeding/baby/7", "/api/feeding/baby/8", "/no-such-path/123"):
+    client.get(path)
+print(client.get("/metrics").text)
+"""
+
+
+def test_metrics_disabled_by_default(client):
+    assert Settings.model_fields["metrics_enabled"].default is False
+    assert client.get("/metrics").status_code == 404
+
+
+def test_query_metrics_disabled_by_default():
+    # 测试环境由 conftest 设置 QUERY_METRICS=true 开启
+    assert Settings.model_fields["query_metrics"].default is False
+
+
+def test_request_histogram_uses_route_templates():
+    env = dict(os.environ, ENV="test", SCHEMA_CHECK="off", METRICS_ENABLED="true", LAZY_ROUTERS="true")
+    env.pop("PROMETHEUS_MULTIPROC_DIR", None)
+    env["PYTHONPATH"] = PROJECT_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    proc = subprocess.run([sys.executable, "-c", _SCRAPE], cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+
+    counts = [line for line in proc.stdout.splitlines() if line.startswith("http_request_duration_seconds_count")]
+    # 路径参数不同的请求归入同一路由模板，未匹配的路径统一为 <unmatched>
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/feeding/baby/{baby_id}",status="401"} 2.0' in counts
+    assert 'http_request_duration_seconds_count{method="GET",route="<unmatched>",status="404"} 1.0' in counts
+    assert not any("/7" in line or "/no-such-path" in line for line in counts)
+
+
+@pytest.fixture
+def wechat(monkeypatch):
+    """开启指标、不重试的 WeChatAPI，HTTP 响应依次取自返回的列表"""
+    settings = get_settings()
+    for name, value in {"metrics_enabled": True, "wx_appid": "wx-test", "wx_appsecret": "secret",
+                        "wx_http_retries": 0}.items():
+        monkeypatch.setattr(settings, name, value)
+    responses = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    api = WeChatAPI()
+    api._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return api, responses
+
+
+def _calls(errcode: str) -> float:
+    return REGISTRY.get_sample_value("wechat_api_calls_total", {"api": "code2session", "errcode": errcode}) or 0.0
+
+
+def test_wechat_call_errcode_labels(wechat):
+    api, responses = wechat
+    responses.extend([
+        httpx.Response(200, json={"openid": "o", "session_key": "k"}),
+        httpx.Response(200, json={"errcode": 40029, "errmsg": "invalid code"}),
+        httpx.Response(503, json={"errcode": -1, "errmsg": "system busy"}),
+        httpx.ConnectError("connection refused"),
+    ])
+    before = {errcode: _calls(errcode) for errcode in ("0", "40029", "http_503", "exception")}
+
+    async def scenario():
+        assert (await api.code2session("code"))["openid"] == "o"
+        for expected in (WeChatAPIError, WeChatAPIError, httpx.ConnectError):
+            with pytest.raises(expected):
+                await api.code2session("code")
+        await api.aclose()
+
+    asyncio.run(scenario())
+    assert {errcode: _calls(errcode) - count for errcode, count in before.items()} == {
+        "0": 1, "40029": 1, "http_503": 1, "exception": 1
+    }
@@ -0,0 +1,99 @@
+"""
+列表接口与首页时间线的 SQL 语句数回归测试
+
+语句数按 X-Query-Count 响应头统计（包含鉴权查询，每次请求前清空登录态缓存）。
+同一接口在记录数不同时语句数必须相同（没有 N+1），且不超过预算（与 scripts/query_budget.py 一致）。
+"""
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.orm import Session
+
+from conftest import add_family
+from wxcloudrun.core.query_metrics import assert_route_max_queries
+from wxcloudrun.models.album import AlbumRecord
+from wxcloudrun.models.baby import BabyFamily
+from wxcloudrun.models.diaper import DiaperRecord
+from wxcloudrun.models.feeding import FeedingRecord
+from wxcloudrun.models.growth import GrowthRecord
+from wxcloudrun.models.jaundice import JaundiceRecord
+from wxcloudrun.models.pumping import PumpingRecord
+from wxcloudrun.models.sleep import SleepRecord
+from wxcloudrun.models.user import User
+from wxcloudrun.utils.cache import auth_cache
+
+OPENID = "openid-query-count"
+
+# (路径模板, 查询参数, 语句数上限)
+LIST_BUDGETS = [
+    ("/api/feeding/baby/{baby_id}", {"limit": 20}, 6),
+    ("/api/diaper/baby/{baby_id}", {"limit": 20}, 6),
+    ("/api/sleep/baby/{baby_id}", {"limit": 20}, 6),
+    ("/api/growth/baby/{baby_id}", {"limit": 20}, 6),
+    ("/api/pumping/baby/{baby_id}", {"limit": 20}, 6),
+    ("/api/jaundice/baby/{baby_id}", {"limit": 20}, 6),
+    ("/api/album/baby/{baby_id}", {"limit": 20}, 6),
+    ("/api/home/baby/{baby_id}", {"limit": 50}, 13),
+]
+
+
+def _add_records(db: Session, baby_id: int, user_ids: list[int], count: int) -> None:
+    """每种记录各 count 条，记录人在多个家庭成员间轮换（覆盖创建者信息的批量加载）"""
+    base = datetime.now().replace(microsecond=0) - timedelta(days=1)
+    for i in range(count):
+        user_id = user_ids[i % len(user_ids)]
+        at = base + timedelta(minutes=10 * i)
+        db.add_all([
+            FeedingRecord(baby_id=baby_id, user_id=user_id, feeding_type='breast', start_time=at,
+                          duration_left=300, duration_right=240,
+                          feeding_sequence=[{'side': 'left', 'duration_seconds': 300, 'start_time': at.isoformat()}]),
+            DiaperRecord(baby_id=baby_id, user_id=user_id, diaper_type='pee', record_time=at),
+            SleepRecord(baby_id=baby_id, user_id=user_id, status='completed', source='manual',
+                        start_time=at, end_time=at + timedelta(minutes=5), duration=300),
+            GrowthRecord(baby_id=baby_id, user_id=user_id, record_date=at, weight=Decimal('5.20')),
+            PumpingRecord(baby_id=baby_id, user_id=user_id, total_amount=60, record_time=at),
+            JaundiceRecord(baby_id=baby_id, user_id=user_id, record_date=at, value=Decimal('8.50')),
+            AlbumRecord(baby_id=baby_id, user_id=user_id, file_id=f"cloud://album/{i}.jpg", media_type='image'),
+        ])
+    db.commit()
+
+
+@pytest.fixture
+def family(client, file_engine, monkeypatch):
+    """一个宝宝、两位家庭成员；相册临时链接不请求微信"""
+    async def no_temp_urls(file_ids):
+        return {}
+
+    monkeypatch.setattr("wxcloudrun.utils.wechat.get_temp_file_urls", no_temp_urls)
+    with Session(file_engine) as db:
+        user, baby = add_family(db, openid=OPENID)
+        other = User(openid="openid-query-count-2", nickname="测试家长2")
+        db.add(other)
+        db.flush()
+        db.add(BabyFamily(baby_id=baby.id, user_id=other.id, relation="妈妈", is_admin=0))
+        db.commit()
+        return baby.id, [user.id, other.id]
+
+
+def _query_count(client, path: str, params: dict, budget: int) -> int:
+    auth_cache.clear()
+    response = assert_route_max_queries(client, "GET", path, budget, params=params, headers={"X-Wx-Openid": OPENID})
+    assert response.status_code == 200, response.text
+    return int(response.headers["X-Query-Count"])
+
+
+@pytest.mark.parametrize("path_template,params,budget", LIST_BUDGETS, ids=[p for p, _, _ in LIST_BUDGETS])
+def test_list_query_count_is_constant(client, file_engine, family, path_template, params, budget):
+    baby_id, user_ids = family
+    path = path_template.format(baby_id=baby_id)
+
+    with Session(file_engine) as db:
+        _add_records(db, baby_id, user_ids, 2)
+    few = _query_count(client, path, params, budget)
+
+    with Session(file_engine) as db:
+        _add_records(db, baby_id, user_ids, 15)
+    many = _query_count(client, path, params, budget)
+
+    assert many == few, f"{path}: 记录由 2 条增至 17 条后语句数 {few} -> {many}（N+1 查询）"
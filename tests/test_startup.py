@@ -0,0 +1,52 @@
+"""
+冷启动回归测试：导入耗时预算与按需加载的模块
+
+在全新进程中导入应用（当前进程已被其他测试导入过全部路由）。
+"""
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# import wxcloudrun 的累计导入耗时上限（毫秒），可用 IMPORT_BUDGET_MS 按机器调整
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", 2500))
+
+# 首个请求用到时才导入的模块
+LAZY_MODULES = [
+    "httpx",
+    "alembic",
+    "wxcloudrun.data.vaccines",
+    "wxcloudrun.routers.babies",
+    "wxcloudrun.routers.feeding",
+    "wxcloudrun.routers.home",
+    "wxcloudrun.routers.vaccines",
+]
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, ENV="test", SCHEMA_CHECK="off", LAZY_ROUTERS="true")
+    env["PYTHONPATH"] = PROJECT_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    proc = subprocess.run([sys.executable, *args], cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    return proc
+
+
+def test_import_time_within_budget():
+    proc = _run("-X", "importtime", "-c", "import wxcloudrun")
+    # 最后一行为 wxcloudrun 本身：import time: self | cumulative | wxcloudrun
+    line = [row for row in proc.stderr.splitlines() if row.startswith("import time:")][-1]
+    _, cumulative_us, module = (part.strip() for part in line.split(":", 1)[1].split("|"))
+    assert module == "wxcloudrun"
+    cumulative_ms = int(cumulative_us) / 1000
+    assert cumulative_ms <= IMPORT_BUDGET_MS, f"import wxcloudrun 耗时 {cumulative_ms:.0f} ms，超过预算 {IMPORT_BUDGET_MS:.0f} ms"
+
+
+def test_heavy_modules_are_lazy():
+    snippet = (
+        "import json, sys, wxcloudrun; "
+        f"print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"
+    )
+    loaded = json.loads(_run("-c", snippet).stdout.strip().splitlines()[-1])
+    assert loaded == [], f"导入应用时加载了应按需加载的模块: {loaded}"
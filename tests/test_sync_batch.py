@@ -0,0 +1,122 @@
+"""
+离线批量同步：每条结果的 ID 对应本条数据写入的记录；写入睡眠记录时推送当前睡眠
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from conftest import add_family
+from wxcloudrun.core.query_metrics import assert_max_queries
+from wxcloudrun.crud import sync as sync_crud
+from wxcloudrun.models.diaper import DiaperRecord
+from wxcloudrun.models.feeding import FeedingRecord
+from wxcloudrun.models.live_event import LiveEvent
+from wxcloudrun.models.sleep import SleepRecord
+from wxcloudrun.schemas.sync import SyncItem
+
+T0 = datetime(2026, 10, 17, 8, 0, 0)
+
+# 新建 3 种类型：每种一条 INSERT + 一次每日汇总重算，MySQL 上另读一次 auto_increment_increment
+SYNC_CREATE_BUDGET = 7
+
+
+def _at(minutes: int) -> str:
+    return (T0 + timedelta(minutes=minutes)).isoformat()
+
+
+def test_mixed_batch_maps_each_result_to_its_row(db):
+    user, baby = add_family(db)
+    existing = FeedingRecord(baby_id=baby.id, user_id=user.id, feeding_type='formula', start_time=T0,
+                             amount=60, bottle_content='formula')
+    db.add(existing)
+    db.commit()
+
+    items = [
+        SyncItem(client_id='f1', type='feeding', op='create',
+                 data={'feeding_type': 'formula', 'start_time': _at(10), 'amount': 90, 'bottle_content': 'formula'}),
+        SyncItem(client_id='d1', type='diaper', op='create', data={'diaper_type': 'pee', 'record_time': _at(20)}),
+        SyncItem(client_id='bad', type='diaper', op='create', data={'diaper_type': 'pee'}),
+        SyncItem(client_id='s1', type='sleep', op='create', data={'start_time': _at(30), 'end_time': _at(90)}),
+        SyncItem(client_id='f2', type='feeding', op='create',
+                 data={'feeding_type': 'breast', 'start_time': _at(100), 'duration_left': 300}),
+        SyncItem(client_id='u1', type='feeding', op='update', record_id=existing.id, data={'amount': 70}),
+        SyncItem(client_id='d2', type='diaper', op='create', data={'diaper_type': 'poop', 'record_time': _at(110)}),
+        SyncItem(client_id='missing', type='sleep', op='update', record_id=999999, data={'notes': 'x'}),
+    ]
+    results = sync_crud.apply_sync_batch(db, baby.id, user.id, items)
+    by_client = {r.client_id: r for r in results}
+
+    assert [r.client_id for r in results] == [item.client_id for item in items]
+    assert [r.status for r in results] == [
+        'created', 'created', 'invalid', 'created', 'created', 'updated', 'created', 'not_found'
+    ]
+
+    db.expire_all()
+    assert db.get(FeedingRecord, by_client['f1'].id).amount == 90
+    assert db.get(FeedingRecord, by_client['f2'].id).duration_left == 300
+    assert db.get(DiaperRecord, by_client['d1'].id).diaper_type == 'pee'
+    assert db.get(DiaperRecord, by_client['d2'].id).diaper_type == 'poop'
+    assert db.get(SleepRecord, by_client['s1'].id).start_time == T0 + timedelta(minutes=30)
+    assert by_client['u1'].id == existing.id
+    assert db.get(FeedingRecord, existing.id).amount == 70
+    assert db.query(DiaperRecord).filter(DiaperRecord.baby_id == baby.id).count() == 2
+
+
+
+def test_batch_statements_do_not_grow_with_item_count(db):
+    user, baby = add_family(db)
+    baby_id, user_id = baby.id, user.id
+    items = []
+    for i in range(50):
+        at = _at(i)
+        items.append([
+            SyncItem(type='feeding', op='create',
+                     data={'feeding_type': 'formula', 'start_time': at, 'amount': 60 + i, 'bottle_content': 'formula'}),
+            SyncItem(type='diaper', op='create', data={'diaper_type': 'pee', 'record_time': at}),
+            SyncItem(type='sleep', op='create', data={'start_time': at, 'end_time': _at(i + 1)}),
+        ][i % 3])
+
+    with assert_max_queries(SYNC_CREATE_BUDGET, "50 条新建的批量同步"):
+        results = sync_crud.apply_sync_batch(db, baby_id, user_id, items)
+
+    models = {'feeding': FeedingRecord, 'diaper': DiaperRecord, 'sleep': SleepRecord}
+    db.expire_all()
+    for i, result in enumerate(results):
+        assert result.status == 'created'
+        row = db.get(models[result.type], result.id)
+        assert row.baby_id == baby_id
+        time = row.record_time if result.type == 'diaper' else row.start_time
+        assert time == T0 + timedelta(minutes=i)
+
+
+def test_sync_sleep_publishes_active_sleep(client, file_engine):
+    headers = {"X-Wx-Openid": "openid-sync-live"}
+    with Session(file_engine) as db:
+        _, baby = add_family(db, openid="openid-sync-live")
+        baby_id = baby.id
+
+    def sleep_events() -> list:
+        with Session(file_engine) as db:
+            return [e.payload for e in db.query(LiveEvent).filter(
+                LiveEvent.baby_id == baby_id, LiveEvent.event == "sleep_active").order_by(LiveEvent.id)]
+
+    diaper_only = client.post("/api/sync/batch", json={"baby_id": baby_id, "items": [
+        {"type": "diaper", "op": "create", "data": {"diaper_type": "pee", "record_time": _at(0)}},
+    ]}, headers=headers)
+    assert diaper_only.status_code == 200, diaper_only.text
+    assert sleep_events() == []
+
+    started = client.post("/api/sync/batch", json={"baby_id": baby_id, "items": [
+        {"type": "sleep", "op": "create", "data": {"start_time": _at(10)}},
+    ]}, headers=headers)
+    assert started.status_code == 200, started.text
+    sleep_id = started.json()["results"][0]["id"]
+    assert [payload["id"] for payload in sleep_events()] == [sleep_id]
+
+    updated = client.post("/api/sync/batch", json={"baby_id": baby_id, "items": [
+        {"type": "sleep", "op": "update", "record_id": sleep_id, "data": {"notes": "离线补录"}},
+        {"type": "sleep", "op": "create", "data": {"start_time": _at(-120), "end_time": _at(-60)}},
+    ]}, headers=headers)
+    assert updated.status_code == 200, updated.text
+    payload = sleep_events()[-1]
+    assert (payload["id"], payload["notes"]) == (sleep_id, "离线补录")
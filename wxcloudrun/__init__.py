@@ -1,8 +1,19 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, Response, status
+import asyncio
 import logging
+import time
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from wxcloudrun.core.config import get_settings
-from wxcloudrun.core.database import Base, engine
+from wxcloudrun.core.database import engine, dispose_async_engine, get_pool_status
+from wxcloudrun.core.schema import check_schema_version
+from wxcloudrun.core.live import live_hub
+from wxcloudrun.core.lazy_routers import LazyRouterLoader, LazyRouterMiddleware
+from wxcloudrun.core.query_metrics import QueryMetricsMiddleware, QUERY_COUNT_HEADER, SERVER_TIMING_HEADER
+from wxcloudrun.routers import ROUTER_MODULES
+from wxcloudrun.utils.pagination import NEXT_CURSOR_HEADER
+from wxcloudrun.utils.wechat import close_wechat_client
+import wxcloudrun.models  # noqa: F401  预先注册模型，保证按需加载路由时 relationship 可解析
 
 settings = get_settings()
 
@@ -13,7 +24,9 @@ app = FastAPI(
     version="1.0.0",
     debug=settings.debug,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # 默认使用 orjson 渲染 JSON 响应
+    default_response_class=ORJSONResponse,
 )
 
 # 配置CORS
@@ -23,15 +36,31 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER] + ([QUERY_COUNT_HEADER, SERVER_TIMING_HEADER] if settings.query_metrics else []),
 )
 
+# 请求级 SQL 统计：响应头输出语句数与数据库耗时，超过阈值的请求记录告警日志
+if settings.query_metrics:
+    app.add_middleware(
+        QueryMetricsMiddleware,
+        slow_ms=settings.slow_request_ms,
+        max_queries=settings.slow_request_queries,
+        log_statements=settings.slow_request_log_statements,
+    )
+
+# Prometheus 指标：请求耗时直方图、进行中的请求数
+if settings.metrics_enabled:
+    from wxcloudrun.core.metrics import MetricsMiddleware, render_metrics
+    app.add_middleware(MetricsMiddleware)
+
 
 @app.on_event("startup")
 async def startup_event():
     """应用启动时执行"""
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s")
-    # 初始化数据库表
-    Base.metadata.create_all(bind=engine)
+    started = time.perf_counter()
+    # 检查数据库结构版本（建表/改表请执行 alembic upgrade head）
+    await asyncio.to_thread(check_schema_version, engine, settings.schema_check)
 
     # 打印启动信息
     print("=" * 60)
@@ -41,12 +70,16 @@ async def startup_event():
     print(f"📊 数据库名称: {settings.mysql_database}")
     print(f"🔧 调试模式: {'开启' if settings.debug else '关闭'}")
     print(f"📖 API文档: http://localhost/docs (或对应的访问地址)")
+    print(f"⏱️  启动耗时: {(time.perf_counter() - started) * 1000:.0f} ms")
     print("=" * 60)
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """应用关闭时执行"""
+    await live_hub.close()
+    await close_wechat_client()
+    await dispose_async_engine()
     print(f"{settings.app_name} 已关闭")
 
 
@@ -67,41 +100,25 @@ async def health_check():
     return {"status": "ok", "service": settings.app_name}
 
 
-# 注册所有路由
-from wxcloudrun.routers import (
-    auth_router,
-    users_router,
-    babies_router,
-    feeding_router,
-    feeding_ongoing_router,
-    diaper_router,
-    sleep_router,
-    growth_router,
-    pumping_router,
-    jaundice_router,
-    invitations_router,
-    policies_router,
-    home_router,
-    user_preference_router,
-    notifications_router,
-    vaccines_router,
-    album_router
-)
+@app.get("/health/db-pool", tags=["健康检查"])
+def db_pool_status():
+    """当前工作进程的数据库连接池状态（借出/溢出连接数、等待耗时、超时与建连失败次数）"""
+    return get_pool_status()
+
+
+if settings.metrics_enabled:
+    @app.get("/metrics", tags=["健康检查"], include_in_schema=False)
+    def metrics(authorization: str | None = Header(default=None)):
+        """Prometheus 指标（多进程部署时汇总全部工作进程）"""
+        if settings.metrics_token and authorization != f"Bearer {settings.metrics_token}":
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="指标访问认证失败")
+        content, content_type = render_metrics()
+        return Response(content=content, media_type=content_type)
+
 
-app.include_router(auth_router)
-app.include_router(users_router)
-app.include_router(babies_router)
-app.include_router(feeding_router)
-app.include_router(feeding_ongoing_router)
-app.include_router(diaper_router)
-app.include_router(sleep_router)
-app.include_router(growth_router)
-app.include_router(pumping_router)
-app.include_router(jaundice_router)
-app.include_router(invitations_router)
-app.include_router(policies_router)
-app.include_router(home_router)
-app.include_router(user_preference_router)
-app.include_router(notifications_router)
-app.include_router(vaccines_router)
-app.include_router(album_router)
+# 注册路由：默认按需加载，首个命中某路由前缀的请求到来时才导入对应模块；LAZY_ROUTERS=false 时启动前全部加载
+router_loader = LazyRouterLoader(app, ROUTER_MODULES)
+if settings.lazy_routers:
+    app.add_middleware(LazyRouterMiddleware, loader=router_loader)
+else:
+    router_loader.load_all()
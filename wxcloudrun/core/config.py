@@ -1,8 +1,39 @@
+import glob
+import math
 import os
-from typing import Literal
+import tempfile
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 
+# 容器 CPU 配额（cgroup v2 / v1）
+CGROUP_V2_CPU_MAX = "/sys/fs/cgroup/cpu.max"
+CGROUP_V1_CPU_QUOTA = "/sys/fs/cgroup/cpu/cpu.cfs_quota_us"
+CGROUP_V1_CPU_PERIOD = "/sys/fs/cgroup/cpu/cpu.cfs_period_us"
+
+
+def _read_file(path: str) -> str:
+    with open(path) as f:
+        return f.read().strip()
+
+
+def cgroup_cpu_limit() -> Optional[int]:
+    """容器的 CPU 配额（向上取整的核数）；未限制或无法读取时返回 None"""
+    try:
+        quota, period = _read_file(CGROUP_V2_CPU_MAX).split()[:2]
+        if quota == "max":
+            return None
+        quota, period = int(quota), int(period)
+    except (OSError, ValueError):
+        try:
+            quota = int(_read_file(CGROUP_V1_CPU_QUOTA))
+            period = int(_read_file(CGROUP_V1_CPU_PERIOD))
+        except (OSError, ValueError):
+            return None
+    if quota <= 0 or period <= 0:
+        return None
+    return max(1, math.ceil(quota / period))
+
 
 class Settings(BaseSettings):
     """应用配置"""
@@ -19,11 +50,65 @@ class Settings(BaseSettings):
     mysql_password: str = "root"
     mysql_address: str = "127.0.0.1:3306"
     mysql_database: str = "baby_record"
+    mysql_async_driver: str = "aiomysql"  # 异步引擎使用的驱动（aiomysql / asyncmy）
+
+    # 数据库连接池配置（每个工作进程内同步、异步引擎各一个连接池）
+    db_max_connections: int = 100  # 所有工作进程、所有连接池合计可占用的 MySQL 连接数
+    db_pool_size: int = 0  # 单个连接池常驻连接数，0 表示按连接预算自动计算
+    db_pool_min_size: int = 5  # 自动计算时单个连接池常驻连接数的下限（同步路由在最多 40 个线程中并发执行）
+    db_max_overflow: int = -1  # 单个连接池溢出连接数，-1 表示按连接预算自动计算
+    db_pool_timeout: float = 10.0  # 等待空闲连接的超时（秒），超时抛错而不是长时间挂起
+    db_pool_recycle: int = 3600
+    db_echo: bool = False  # 打印全部 SQL（仅排查问题时开启）
+    schema_check: Literal["off", "warn", "fail"] = "warn"  # 启动时数据库结构版本检查，不一致时警告或拒绝启动
+
+    # 请求级 SQL 统计（X-Query-Count / Server-Timing 响应头与慢请求日志），默认关闭，排查性能问题或测试时开启
+    query_metrics: bool = False
+    slow_request_ms: int = 1000  # 请求耗时超过该毫秒数时记录告警日志，0 表示不按耗时判断
+    slow_request_queries: int = 20  # 单个请求语句数超过该值时记录告警日志，0 表示不按语句数判断
+    slow_request_log_statements: int = 20  # 告警日志中最多输出的（聚合后）语句条数
+
+    # Prometheus 监控指标（/metrics），默认关闭；对外暴露的部署开启时应同时设置 metrics_token
+    metrics_enabled: bool = False
+    metrics_token: str | None = None  # 设置后抓取 /metrics 需携带 Authorization: Bearer <token>
+    prometheus_multiproc_dir: str | None = None  # 多进程指标目录，gunicorn / run.py 多进程启动时未设置则自动创建临时目录
+
+    # 实时推送（喂养计时/睡眠状态 WebSocket 频道）
+    live_fanout: Literal["db", "local"] = "db"  # db：经 live_events 表跨进程广播；local：仅单进程部署使用
+    live_poll_interval: float = 1.0  # 拉取其他进程事件的间隔（秒）
+    live_event_retention_seconds: int = 600  # live_events 表中事件保留时长
+    live_heartbeat_seconds: int = 25  # 连接空闲时发送心跳的间隔，避免被代理断开
+    live_queue_size: int = 32  # 单个连接待发送消息上限，超出时丢弃最旧的消息
+
+    # 服务进程配置（gunicorn.conf.py / run.py 读取）
+    web_host: str = "0.0.0.0"
+    web_port: int = 80
+    web_workers: int = 0  # 工作进程数，0 表示按可用 CPU 核数（容器内取 CPU 配额）计算
+    web_preload: bool = True  # 主进程预加载应用，fork 后共享只读内存
+    web_max_requests: int = 10000  # 单个进程处理该数量请求后重启，0 表示不重启
+    web_max_requests_jitter: int = 1000  # 重启阈值随机抖动，避免所有进程同时重启
+    web_timeout: int = 60  # 进程无响应超过该秒数被强制重启
+    web_graceful_timeout: int = 30  # 收到退出信号后等待在途请求完成的秒数
+    web_keepalive: int = 5  # HTTP keep-alive 秒数
+    lazy_routers: bool = True  # 路由模块按需加载（缩短冷启动）；为 False 时启动前全部加载
+    web_reload: bool = False  # run.py 是否强制启用热重载（development 环境默认启用）
 
     # 微信小程序配置
     wx_appid: str = ""
     wx_appsecret: str = ""
     wx_env_id: str = ""  # 云开发环境ID
+    wx_api_base_url: str = "https://api.weixin.qq.com"  # 可指向本地桩服务做压测
+
+    # 微信 API HTTP 客户端配置（进程内共享连接池）
+    wx_http2: bool = True
+    wx_http_max_connections: int = 50
+    wx_http_max_keepalive: int = 20
+    wx_http_keepalive_expiry: float = 30.0
+    wx_http_timeout: float = 10.0
+    wx_http_connect_timeout: float = 5.0
+    wx_http_retries: int = 2
+    wx_http_retry_backoff: float = 0.2
+    wx_token_refresh_margin: int = 300  # access_token 距过期不足该秒数时提前刷新
     
     # JWT配置（未来用于认证）
     secret_key: str = "your-secret-key-change-in-production"
@@ -33,6 +118,19 @@ class Settings(BaseSettings):
     ca_bundle_path: str | None = None
     admin_token: str | None = None
 
+    # 登录态缓存配置（进程内）
+    auth_cache_ttl_seconds: int = 60
+    auth_cache_maxsize: int = 10000
+
+    # 小程序码缓存配置（进程内）
+    qrcode_cache_ttl_seconds: int = 86400
+    qrcode_cache_maxsize: int = 256
+
+    # 云存储临时链接缓存配置（进程内）
+    file_url_max_age: int = 7200  # 向微信申请的链接有效期（秒）
+    file_url_safety_margin: int = 300  # 提前该秒数视为过期
+    file_url_cache_maxsize: int = 5000
+
     class Config:
         # 根据环境变量 ENV 加载对应的配置文件
         # 优先级: .env.{ENV} > .env
@@ -43,6 +141,26 @@ class Settings(BaseSettings):
         """构建数据库连接URL"""
         return f"mysql+pymysql://{self.mysql_username}:{self.mysql_password}@{self.mysql_address}/{self.mysql_database}"
 
+    @property
+    def async_database_url(self) -> str:
+        """构建异步数据库连接URL"""
+        return f"mysql+{self.mysql_async_driver}://{self.mysql_username}:{self.mysql_password}@{self.mysql_address}/{self.mysql_database}"
+
+    @property
+    def worker_count(self) -> int:
+        """实际工作进程数"""
+        if self.web_workers > 0:
+            return self.web_workers
+        try:
+            cpus = len(os.sched_getaffinity(0))
+        except AttributeError:
+            cpus = os.cpu_count() or 1
+        # 容器内可见的是宿主机全部核数，按 cgroup CPU 配额取较小值
+        limit = cgroup_cpu_limit()
+        if limit is not None:
+            cpus = min(cpus, limit)
+        return max(1, cpus)
+
     @property
     def is_production(self) -> bool:
         """是否为生产环境"""
@@ -83,3 +201,19 @@ def get_settings() -> Settings:
 
     # 创建Settings时指定env_file
     return Settings(_env_file=env_file if os.path.exists(env_file) else None)
+
+
+def prepare_prometheus_multiproc_dir(settings: Settings) -> str:
+    """
+    设置 Prometheus 多进程指标目录并清空上次运行遗留的指标文件，返回目录
+
+    须在导入 prometheus_client、启动工作进程之前调用。目录可能与其他程序共用，只删除其中的 *.db 指标文件
+    """
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not path:
+        path = settings.prometheus_multiproc_dir or tempfile.mkdtemp(prefix="prometheus-")
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+    os.makedirs(path, exist_ok=True)
+    for name in glob.glob(os.path.join(path, "*.db")):
+        os.remove(name)
+    return path
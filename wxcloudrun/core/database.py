@@ -1,19 +1,46 @@
+import os
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from .config import get_settings
+from .pool_metrics import (
+    InstrumentedQueuePool,
+    InstrumentedAsyncQueuePool,
+    sync_pool_stats,
+    async_pool_stats,
+    register_pool_events,
+    pool_status,
+)
+from .query_metrics import register_query_events
 
 settings = get_settings()
 
+
+def _pool_sizing() -> tuple[int, int]:
+    """
+    计算单个连接池的 (pool_size, max_overflow)
+    连接预算 db_max_connections 在所有工作进程、每进程两个引擎（同步/异步）之间平分；
+    常驻连接数不低于 db_pool_min_size，避免工作进程多时连接池过小、请求排队等待连接超时
+    """
+    per_pool = max(2, settings.db_max_connections // (settings.worker_count * 2))
+    pool_size = settings.db_pool_size if settings.db_pool_size > 0 else max(settings.db_pool_min_size, per_pool * 2 // 3)
+    max_overflow = settings.db_max_overflow if settings.db_max_overflow >= 0 else max(0, per_pool - pool_size)
+    return pool_size, max_overflow
+
+
+POOL_SIZE, POOL_MAX_OVERFLOW = _pool_sizing()
+
 # 创建数据库引擎
 engine = create_engine(
     settings.database_url,
+    poolclass=InstrumentedQueuePool,
     pool_pre_ping=True,      # 连接池预检查，确保连接可用
-    pool_recycle=3600,       # 连接回收时间（1小时）
-    pool_size=5,             # 连接池大小
-    max_overflow=10,         # 最大溢出连接数
-    pool_timeout=60,         # 获取连接的超时时间（秒）
-    echo=settings.debug,     # 开发环境打印SQL
+    pool_recycle=settings.db_pool_recycle,
+    pool_size=POOL_SIZE,
+    max_overflow=POOL_MAX_OVERFLOW,
+    pool_timeout=settings.db_pool_timeout,
+    echo=settings.db_echo,
     connect_args={
         "connect_timeout": 60,   # MySQL 连接超时（秒）
         "read_timeout": 60,      # 读取超时（秒）
@@ -21,6 +48,10 @@ engine = create_engine(
     }
 )
 
+register_pool_events(engine, sync_pool_stats)
+if settings.query_metrics:
+    register_query_events(engine)
+
 # 创建会话工厂
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -40,6 +71,70 @@ def get_db():
         db.close()
 
 
+# 异步引擎：供 async def 路由使用，避免在事件循环中执行阻塞的数据库调用
+# 首次使用时才创建，未安装异步驱动时不影响同步代码（脚本、alembic 等）的导入
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """获取（必要时创建）异步数据库引擎"""
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            settings.async_database_url,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_pre_ping=True,
+            pool_recycle=settings.db_pool_recycle,
+            pool_size=POOL_SIZE,
+            max_overflow=POOL_MAX_OVERFLOW,
+            pool_timeout=settings.db_pool_timeout,
+            echo=settings.db_echo,
+            connect_args={"connect_timeout": 60},
+        )
+        register_pool_events(_async_engine.sync_engine, async_pool_stats)
+        if settings.query_metrics:
+            register_query_events(_async_engine.sync_engine)
+        # expire_on_commit=False：提交后仍可直接读取属性，避免在异步环境中触发隐式加载
+        _async_session_factory = async_sessionmaker(
+            _async_engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_engine
+
+
+async def get_async_db():
+    """
+    获取异步数据库会话
+    用于 async def 路由的依赖注入
+    """
+    get_async_engine()
+    async with _async_session_factory() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """关闭异步引擎的连接池（应用关闭时调用）"""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
+
+
+def get_pool_status() -> dict:
+    """当前进程内各连接池的状态与累计统计"""
+    return {
+        "pid": os.getpid(),
+        "workers": settings.worker_count,
+        "pool_size": POOL_SIZE,
+        "max_overflow": POOL_MAX_OVERFLOW,
+        "sync": pool_status(engine.pool, sync_pool_stats),
+        "async": pool_status(_async_engine.sync_engine.pool, async_pool_stats) if _async_engine is not None else None,
+    }
+
+
 def init_db():
     """
     初始化数据库，创建所有表
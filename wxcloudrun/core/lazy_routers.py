@@ -0,0 +1,92 @@
+"""
+按需加载路由
+
+导入路由模块（及其依赖的 schema / crud / 模型）并注册到 FastAPI 的开销占冷启动的大头。
+这里把路由模块与其负责的路径前缀登记下来，在第一个命中该前缀的请求到来时才导入并注册，
+首屏只需加载实际访问到的几个模块。
+"""
+import asyncio
+import importlib
+import logging
+import time
+from typing import Iterable
+from fastapi import FastAPI
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class LazyRouterLoader:
+    """
+    Args:
+        app: FastAPI 应用
+        modules: 路由模块路径 -> 该模块负责的路径前缀；顺序即注册顺序（与路由匹配优先级一致）
+    """
+
+    def __init__(self, app: FastAPI, modules: dict[str, tuple[str, ...]]):
+        self.app = app
+        self._pending = dict(modules)
+        self._order = list(modules)
+        self._lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._pending)
+
+    def _modules_for(self, scope: Scope) -> list[str]:
+        path = scope["path"]
+        if path == self.app.openapi_url:
+            # 接口文档需要完整路由表
+            return list(self._pending)
+        names = [
+            name for name, prefixes in self._pending.items()
+            if any(path.startswith(prefix) for prefix in prefixes)
+        ]
+        if names:
+            return names
+        # 未登记前缀的路径：已注册的路由（如健康检查）能处理则不加载，否则全部加载后再匹配（保证 404/405 判定正确）
+        if any(route.matches(scope)[0] == Match.FULL for route in self.app.router.routes):
+            return []
+        return list(self._pending)
+
+    def _include(self, names: Iterable[str]) -> None:
+        for name in self._order:
+            if name not in names or name not in self._pending:
+                continue
+            started = time.perf_counter()
+            module = importlib.import_module(name)
+            self.app.include_router(module.router)
+            del self._pending[name]
+            logger.info(f"lazy router loaded: {name} ({(time.perf_counter() - started) * 1000:.1f} ms)")
+        self.app.openapi_schema = None
+
+    async def ensure_loaded(self, scope: Scope) -> None:
+        """加载处理该请求所需的路由模块"""
+        names = self._modules_for(scope)
+        if not names:
+            return
+        async with self._lock:
+            names = [name for name in names if name in self._pending]
+            if not names:
+                return
+            # 在线程中完成模块导入，避免阻塞事件循环；注册路由回到事件循环中进行
+            await asyncio.to_thread(lambda: [importlib.import_module(name) for name in names])
+            self._include(names)
+
+    def load_all(self) -> None:
+        """立即加载全部路由（关闭按需加载时使用）"""
+        self._include(list(self._pending))
+
+
+class LazyRouterMiddleware:
+    """在请求进入路由匹配前按需加载路由模块"""
+
+    def __init__(self, app: ASGIApp, loader: LazyRouterLoader):
+        self.app = app
+        self.loader = loader
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket") and self.loader.pending:
+            await self.loader.ensure_loaded(scope)
+        await self.app(scope, receive, send)
@@ -0,0 +1,162 @@
+"""
+按宝宝的实时推送
+
+家庭成员通过 WebSocket 订阅某个宝宝的频道，喂养计时、睡眠开始/结束等状态变化时推送给全部订阅者，
+取代客户端轮询。
+
+跨进程广播：发布事件时写入 live_events 表并直接投递给本进程的订阅者；
+每个有订阅者的进程只运行一个轮询任务，按自增 id 拉取其他进程发布的事件再投递给本进程的订阅者，
+无论在线人数多少，每个进程每个轮询周期只有一次查询。
+"""
+import asyncio
+import logging
+import os
+import socket
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Optional
+from sqlalchemy.orm import Session
+from wxcloudrun.core.config import get_settings
+from wxcloudrun.core.database import SessionLocal
+from wxcloudrun.crud import live_event as live_event_crud
+
+logger = logging.getLogger(__name__)
+
+# 轮询时回看的 id 窗口：并发事务的自增 id 可能晚于更大的 id 提交，回看一段并按已投递 id 去重
+_LOOKBACK_IDS = 200
+# 轮询出错后的最长退避间隔（秒）
+_POLL_BACKOFF_MAX_SECONDS = 30
+
+
+def process_origin() -> str:
+    """当前进程标识（fork 后 pid 变化，每次调用时计算）"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LiveHub:
+    """进程内的订阅表与跨进程事件轮询"""
+
+    def __init__(self):
+        self._subscribers: dict[int, set[asyncio.Queue]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._poller: Optional[asyncio.Task] = None
+        self._last_id = 0
+        self._delivered: deque[int] = deque(maxlen=_LOOKBACK_IDS * 5)
+        self._last_cleanup = datetime.min
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    @asynccontextmanager
+    async def subscribe(self, baby_id: int) -> AsyncIterator[asyncio.Queue]:
+        """订阅宝宝频道，返回接收消息的队列"""
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=get_settings().live_queue_size)
+        self._subscribers.setdefault(baby_id, set()).add(queue)
+        if get_settings().live_fanout == "db" and (self._poller is None or self._poller.done()):
+            self._poller = asyncio.create_task(self._poll())
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(baby_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[baby_id]
+
+    def dispatch(self, baby_id: int, message: dict) -> None:
+        """投递给本进程内该宝宝的全部订阅者（须在事件循环线程中调用）"""
+        for queue in self._subscribers.get(baby_id, ()):
+            if queue.full():
+                # 客户端消费过慢时丢弃最旧的消息，状态类消息只关心最新值
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    def dispatch_threadsafe(self, baby_id: int, message: dict) -> None:
+        """从任意线程投递（同步路由在线程池中执行）"""
+        loop = self._loop
+        if loop is None or loop.is_closed() or baby_id not in self._subscribers:
+            return
+        try:
+            if asyncio.get_running_loop() is loop:
+                self.dispatch(baby_id, message)
+                return
+        except RuntimeError:
+            pass
+        loop.call_soon_threadsafe(self.dispatch, baby_id, message)
+
+    async def _poll(self) -> None:
+        """拉取其他进程发布的事件，直到本进程没有订阅者；查询出错时退避重试，不退出"""
+        settings = get_settings()
+        origin = process_origin()
+        start_id: Optional[int] = None
+        failures = 0
+        try:
+            while self._subscribers:
+                try:
+                    if start_id is None:
+                        # 订阅前已发布的事件不再投递（新连接先收到快照）
+                        start_id = self._last_id = await asyncio.to_thread(
+                            self._run, live_event_crud.get_max_live_event_id
+                        )
+                        self._delivered.clear()
+                    await asyncio.sleep(settings.live_poll_interval)
+                    rows = await asyncio.to_thread(
+                        self._run, live_event_crud.get_live_events_after, max(start_id, self._last_id - _LOOKBACK_IDS)
+                    )
+                    for event_id, baby_id, event, payload, event_origin in rows:
+                        self._last_id = max(self._last_id, event_id)
+                        if event_id in self._delivered:
+                            continue
+                        self._delivered.append(event_id)
+                        if event_origin != origin:
+                            self.dispatch(baby_id, {"type": event, "baby_id": baby_id, "data": payload})
+                    await self._cleanup(settings.live_event_retention_seconds)
+                    failures = 0
+                except Exception:
+                    failures += 1
+                    logger.exception(f"live hub poll failed (attempt {failures}), retrying")
+                    await asyncio.sleep(min(settings.live_poll_interval * 2 ** failures, _POLL_BACKOFF_MAX_SECONDS))
+        finally:
+            self._poller = None
+
+    async def _cleanup(self, retention_seconds: int) -> None:
+        """定期清理过期事件（任意进程执行均可）"""
+        now = datetime.now()
+        if now - self._last_cleanup < timedelta(seconds=retention_seconds):
+            return
+        self._last_cleanup = now
+        await asyncio.to_thread(
+            self._run, live_event_crud.delete_live_events_before, now - timedelta(seconds=retention_seconds)
+        )
+
+    @staticmethod
+    def _run(fn, *args):
+        with SessionLocal() as db:
+            return fn(db, *args)
+
+    async def close(self) -> None:
+        if self._poller is not None:
+            self._poller.cancel()
+            self._poller = None
+
+
+live_hub = LiveHub()
+
+
+def publish(db: Session, baby_id: int, event: str, data: Any) -> None:
+    """
+    发布宝宝频道事件（在状态变更提交之后调用）
+
+    data 须可 JSON 序列化；推送失败只记录日志，不影响已完成的业务操作
+    """
+    message = {"type": event, "baby_id": baby_id, "data": data}
+    if get_settings().live_fanout == "db":
+        try:
+            live_event_crud.create_live_event(db, baby_id, event, data, process_origin())
+        except Exception:
+            db.rollback()
+            logger.exception(f"live publish failed baby_id={baby_id} event={event}")
+    live_hub.dispatch_threadsafe(baby_id, message)
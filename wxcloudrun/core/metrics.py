@@ -0,0 +1,183 @@
+"""
+Prometheus 监控指标
+
+- 请求耗时直方图（按路由模板、方法、状态码）与进行中的请求数
+- 微信接口调用耗时与 errcode 计数（按接口）
+- 数据库连接池与进程内缓存的状态（各工作进程定期刷新）
+
+多进程部署（gunicorn 或 run.py 多 worker）时各工作进程把指标写入 PROMETHEUS_MULTIPROC_DIR 目录，
+由处理 /metrics 的进程汇总全部进程的数据；未设置该目录时只输出当前进程的指标。
+"""
+import os
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from wxcloudrun.core.config import get_settings
+
+_settings = get_settings()
+if _settings.prometheus_multiproc_dir:
+    # prometheus_client 在导入时根据该环境变量决定是否使用多进程模式
+    os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", _settings.prometheus_multiproc_dir)
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+# 未匹配到路由的请求统一归入该标签，避免按原始路径产生大量时间序列
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP 请求耗时",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "进行中的 HTTP 请求数",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+WECHAT_API_DURATION = Histogram(
+    "wechat_api_duration_seconds",
+    "微信接口调用耗时（含重试）",
+    ["api"],
+    buckets=(0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+WECHAT_API_CALLS = Counter(
+    "wechat_api_calls_total",
+    "微信接口调用次数（errcode=0 为成功；exception 为网络异常）",
+    ["api", "errcode"],
+)
+
+DB_POOL = Gauge(
+    "db_pool_connections",
+    "数据库连接池连接数（state: size/checked_in/checked_out/overflow）",
+    ["pool", "state"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_EVENTS = Gauge(
+    "db_pool_events",
+    "数据库连接池累计事件数（进程启动以来）",
+    ["pool", "event"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Gauge(
+    "db_pool_wait_seconds",
+    "借出连接累计等待耗时（进程启动以来）",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+CACHE_LOOKUPS = Gauge(
+    "cache_lookups",
+    "进程内缓存累计查询次数（result: hit/miss，进程启动以来）",
+    ["cache", "result"],
+    multiprocess_mode="livesum",
+)
+CACHE_SIZE = Gauge(
+    "cache_entries",
+    "进程内缓存条目数",
+    ["cache"],
+    multiprocess_mode="livesum",
+)
+
+_POOL_EVENTS = ("connects", "connect_errors", "checkouts", "checkins", "invalidations", "timeouts")
+_last_refresh = 0.0
+
+
+def observe_wechat_call(api: str, seconds: float, errcode) -> None:
+    """记录一次微信接口调用"""
+    WECHAT_API_DURATION.labels(api).observe(seconds)
+    WECHAT_API_CALLS.labels(api, str(errcode)).inc()
+
+
+def refresh_runtime_gauges() -> None:
+    """把当前进程的连接池、缓存状态写入指标"""
+    global _last_refresh
+    from wxcloudrun.core.database import get_pool_status
+    from wxcloudrun.utils.cache import auth_cache, qrcode_cache, file_url_cache
+
+    status = get_pool_status()
+    for pool in ("sync", "async"):
+        stats = status[pool]
+        if stats is None:
+            continue
+        for state in ("size", "checked_in", "checked_out", "overflow"):
+            DB_POOL.labels(pool, state).set(stats[state])
+        for name in _POOL_EVENTS:
+            DB_POOL_EVENTS.labels(pool, name).set(stats[name])
+        DB_POOL_WAIT.labels(pool).set(stats["wait_seconds_total"])
+
+    for name, cache in (("auth", auth_cache), ("qrcode", qrcode_cache), ("file_url", file_url_cache)):
+        stats = cache.stats()
+        CACHE_LOOKUPS.labels(name, "hit").set(stats["hits"])
+        CACHE_LOOKUPS.labels(name, "miss").set(stats["misses"])
+        CACHE_SIZE.labels(name).set(stats["size"])
+    _last_refresh = time.monotonic()
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """输出 Prometheus 文本格式的指标，返回 (内容, Content-Type)"""
+    refresh_runtime_gauges()
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """工作进程退出时清理其 live* 类型的指标（gunicorn child_exit 钩子调用）"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(pid)
+
+
+class MetricsMiddleware:
+    """
+    记录请求耗时与进行中的请求数，并定期刷新本进程的连接池、缓存指标
+
+    Args:
+        app: ASGI 应用
+        refresh_interval: 刷新连接池、缓存指标的最小间隔（秒）
+    """
+
+    def __init__(self, app: ASGIApp, refresh_interval: float = 5.0):
+        self.app = app
+        self.refresh_interval = refresh_interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            # 路由匹配后 FastAPI 会把命中的路由写入 scope（scope 在整个调用链中共享）
+            route = scope.get("route")
+            REQUEST_DURATION.labels(
+                method, getattr(route, "path", UNMATCHED_ROUTE), str(status_code)
+            ).observe(time.perf_counter() - started)
+            if time.monotonic() - _last_refresh >= self.refresh_interval:
+                refresh_runtime_gauges()
@@ -0,0 +1,116 @@
+"""
+数据库连接池监控
+
+通过连接池事件统计建连、借出、归还、失效次数，并在借出连接时记录等待耗时、
+等待超时（连接池耗尽）与建连失败次数。统计按进程独立。
+"""
+import logging
+import threading
+import time
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+# 连接池日志以类所在模块命名（本模块下），与 sqlalchemy 默认一致只输出 WARNING 及以上
+logging.getLogger(__name__).setLevel(logging.WARNING)
+
+
+class PoolStats:
+    """单个连接池的累计统计（线程安全）"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.connect_errors = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def incr(self, field: str) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.wait_seconds_total += seconds
+            if seconds > self.wait_seconds_max:
+                self.wait_seconds_max = seconds
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "connects": self.connects,
+                "connect_errors": self.connect_errors,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+sync_pool_stats = PoolStats("sync")
+async_pool_stats = PoolStats("async")
+
+
+class _TimedConnectMixin:
+    """在借出连接时记录等待耗时与失败原因"""
+
+    stats: PoolStats
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            conn = super().connect()
+        except exc.TimeoutError:
+            self.stats.incr("timeouts")
+            raise
+        except Exception:
+            self.stats.incr("connect_errors")
+            raise
+        self.stats.record_wait(time.perf_counter() - start)
+        return conn
+
+
+class InstrumentedQueuePool(_TimedConnectMixin, QueuePool):
+    stats = sync_pool_stats
+
+
+class InstrumentedAsyncQueuePool(_TimedConnectMixin, AsyncAdaptedQueuePool):
+    stats = async_pool_stats
+
+
+def register_pool_events(engine, stats: PoolStats) -> None:
+    """为引擎的连接池注册统计事件"""
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        stats.incr("connects")
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.incr("checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        stats.incr("checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        stats.incr("invalidations")
+
+
+def pool_status(pool, stats: PoolStats) -> dict:
+    """连接池当前状态与累计统计"""
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(0, pool.overflow()),
+        "timeout": pool.timeout(),
+        **stats.snapshot(),
+    }
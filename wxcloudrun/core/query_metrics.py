@@ -0,0 +1,168 @@
+"""
+请求级 SQL 统计
+
+通过引擎的 before/after_cursor_execute 事件统计当前请求发出的语句数与数据库耗时，
+由中间件写入 Server-Timing / X-Query-Count 响应头；语句数或耗时超过阈值的请求记录告警日志，
+附带按语句聚合的 SQL（同一语句执行多次通常意味着 N+1 查询）。
+
+统计对象保存在 contextvars 中：同步路由在线程池中执行、异步引擎在 greenlet 中执行时均会继承，
+因此同一请求内同步/异步两个引擎的语句都会计入。
+"""
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-Query-Count"
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+class QueryStats:
+    """单个请求（或一段代码）内的语句统计"""
+
+    def __init__(self):
+        self.count = 0
+        self.db_seconds = 0.0
+        # 语句 -> [执行次数, 累计耗时]
+        self.statements: dict[str, list] = {}
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.db_seconds += seconds
+        entry = self.statements.get(statement)
+        if entry is None:
+            self.statements[statement] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def format_statements(self, limit: int = 20) -> str:
+        """按累计耗时倒序输出聚合后的语句"""
+        rows = sorted(self.statements.items(), key=lambda item: item[1][1], reverse=True)
+        lines = [
+            f"  [{count}x {seconds * 1000:.1f} ms] {' '.join(statement.split())}"
+            for statement, (count, seconds) in rows[:limit]
+        ]
+        if len(rows) > limit:
+            lines.append(f"  ... 另有 {len(rows) - limit} 条不同语句")
+        return "\n".join(lines)
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def register_query_events(engine) -> None:
+    """为引擎注册语句计时事件（同步引擎或异步引擎的 sync_engine）"""
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _current_stats.get() is not None:
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _current_stats.get()
+        started = conn.info.get("query_started")
+        if stats is not None and started:
+            stats.record(statement, time.perf_counter() - started.pop())
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """统计代码块内发出的语句"""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def assert_max_queries(max_count: int, label: str = "") -> Iterator[QueryStats]:
+    """
+    断言代码块内发出的语句数不超过 max_count（测试/脚本用）
+
+    用法:
+        with assert_max_queries(3):
+            feeding_crud.get_feeding_records_by_baby(db, baby_id)
+    """
+    with track_queries() as stats:
+        yield stats
+    if stats.count > max_count:
+        raise AssertionError(
+            f"{label or '代码块'} 发出 {stats.count} 条语句，超过上限 {max_count}:\n{stats.format_statements()}"
+        )
+
+
+def assert_route_max_queries(client, method: str, url: str, max_count: int, **kwargs):
+    """
+    请求路由并按 X-Query-Count 响应头断言语句数不超过 max_count，返回响应（测试/脚本用）
+
+    client 为 TestClient / httpx.Client；路由在应用的事件循环中执行，不能用 assert_max_queries 包裹
+    """
+    response = client.request(method, url, **kwargs)
+    header = response.headers.get(QUERY_COUNT_HEADER)
+    if header is None:
+        raise AssertionError(f"{method} {url} 响应缺少 {QUERY_COUNT_HEADER} 头（QUERY_METRICS 未开启？）")
+    if int(header) > max_count:
+        raise AssertionError(f"{method} {url} 发出 {header} 条语句，超过上限 {max_count}")
+    return response
+
+
+class QueryMetricsMiddleware:
+    """
+    统计每个请求的语句数与数据库耗时，写入响应头并记录慢请求
+
+    Args:
+        app: ASGI 应用
+        slow_ms: 请求总耗时超过该毫秒数时记录告警，0 表示不按耗时判断
+        max_queries: 语句数超过该值时记录告警，0 表示不按语句数判断
+        log_statements: 告警日志中最多输出的（聚合后）语句条数
+    """
+
+    def __init__(self, app: ASGIApp, slow_ms: float = 0, max_queries: int = 0, log_statements: int = 20):
+        self.app = app
+        self.slow_ms = slow_ms
+        self.max_queries = max_queries
+        self.log_statements = log_statements
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        with track_queries() as stats:
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # 响应头发出时路由与依赖已执行完毕，此后的语句（如后台任务）只计入日志
+                    headers = MutableHeaders(scope=message)
+                    headers[QUERY_COUNT_HEADER] = str(stats.count)
+                    headers.append(
+                        SERVER_TIMING_HEADER,
+                        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.count} queries", '
+                        f"app;dur={(time.perf_counter() - started) * 1000:.1f}",
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                self._log_if_slow(scope, stats, (time.perf_counter() - started) * 1000)
+
+    def _log_if_slow(self, scope: Scope, stats: QueryStats, elapsed_ms: float) -> None:
+        too_slow = self.slow_ms and elapsed_ms > self.slow_ms
+        too_many = self.max_queries and stats.count > self.max_queries
+        if not (too_slow or too_many):
+            return
+        logger.warning(
+            f"slow request {scope['method']} {scope['path']}: {elapsed_ms:.1f} ms, "
+            f"{stats.count} queries, db {stats.db_seconds * 1000:.1f} ms\n"
+            f"{stats.format_statements(self.log_statements)}"
+        )
@@ -0,0 +1,10 @@
+"""
+gunicorn 使用的 uvicorn 工作进程
+"""
+from uvicorn.workers import UvicornWorker as _UvicornWorker
+
+
+class UvicornWorker(_UvicornWorker):
+    """固定使用 uvloop 事件循环与 httptools 解析器"""
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
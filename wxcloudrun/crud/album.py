@@ -1,10 +1,12 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, select
 from typing import List, Optional
 from datetime import datetime
 
 from wxcloudrun.models.album import AlbumRecord
 from wxcloudrun.schemas.album import AlbumRecordCreate
+from wxcloudrun.utils.pagination import keyset_condition
 
 def create_album_record(db: Session, record: AlbumRecordCreate, user_id: int) -> AlbumRecord:
     """创建相册记录"""
@@ -24,16 +26,42 @@ def get_album_records_by_baby(
     db: Session, 
     baby_id: int, 
     skip: int = 0, 
-    limit: int = 20
+    limit: int = 20,
+    cursor: Optional[tuple] = None
 ) -> List[AlbumRecord]:
-    """获取宝宝的相册记录列表"""
-    return db.query(AlbumRecord)\
-        .filter(AlbumRecord.baby_id == baby_id)\
-        .order_by(desc(AlbumRecord.created_at))\
+    """获取宝宝的相册记录列表
+
+    Args:
+        cursor: 上一页最后一条的 (创建时间, id)，为空表示从头开始
+    """
+    query = db.query(AlbumRecord).filter(AlbumRecord.baby_id == baby_id)
+    if cursor:
+        query = query.filter(keyset_condition(AlbumRecord.created_at, AlbumRecord.id, cursor))
+    return query\
+        .order_by(desc(AlbumRecord.created_at), desc(AlbumRecord.id))\
         .offset(skip)\
         .limit(limit)\
         .all()
 
+async def get_album_records_by_baby_async(
+    db: AsyncSession,
+    baby_id: int,
+    skip: int = 0,
+    limit: int = 20,
+    cursor: Optional[tuple] = None
+) -> List[AlbumRecord]:
+    """获取宝宝的相册记录列表（异步）"""
+    stmt = select(AlbumRecord).where(AlbumRecord.baby_id == baby_id)
+    if cursor:
+        stmt = stmt.where(keyset_condition(AlbumRecord.created_at, AlbumRecord.id, cursor))
+    result = await db.execute(
+        stmt
+        .order_by(desc(AlbumRecord.created_at), desc(AlbumRecord.id))
+        .offset(skip)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
 def get_album_record(db: Session, record_id: int) -> Optional[AlbumRecord]:
     """获取单条相册记录"""
     return db.query(AlbumRecord).filter(AlbumRecord.id == record_id).first()
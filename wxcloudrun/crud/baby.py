@@ -2,7 +2,9 @@
 宝宝相关的 CRUD 操作
 """
 from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from wxcloudrun.models.baby import Baby, BabyFamily
 from wxcloudrun.schemas.baby import BabyCreate, BabyUpdate, BabyFamilyCreate
 
@@ -119,6 +121,16 @@ def is_family_member(db: Session, baby_id: int, user_id: int) -> bool:
     )
 
 
+async def is_family_member_async(db: AsyncSession, baby_id: int, user_id: int) -> bool:
+    """检查用户是否是宝宝的家庭成员（异步）"""
+    result = await db.execute(
+        select(BabyFamily.id)
+        .where(BabyFamily.baby_id == baby_id, BabyFamily.user_id == user_id)
+        .limit(1)
+    )
+    return result.first() is not None
+
+
 def is_admin(db: Session, baby_id: int, user_id: int) -> bool:
     """检查用户是否是宝宝的管理员"""
     family = (
@@ -0,0 +1,89 @@
+"""
+记录创建者信息的批量解析
+
+各类记录（喂养/睡眠/排便/生长/吸奶）都需要在响应中附带 created_by，
+这里按整个结果集一次性加载用户与家庭成员关系，避免逐条查询。
+"""
+from typing import Iterable, Optional
+from sqlalchemy.orm import Session
+from wxcloudrun.models.user import User
+from wxcloudrun.models.baby import BabyFamily
+from wxcloudrun.schemas.user import CreatorInfo
+
+
+# 关系显示映射（同时支持枚举代码和中文原值）
+RELATION_DISPLAY_MAP = {
+    'mom': '妈妈',
+    'dad': '爸爸',
+    'grandpa_p': '爷爷',
+    'grandma_p': '奶奶',
+    'grandpa_m': '外公',
+    'grandma_m': '外婆',
+    'other': '其他'
+}
+
+
+def resolve_relation_display(relation: Optional[str], relation_display: Optional[str]) -> Optional[str]:
+    """如果数据库中没有显示名称，则根据枚举映射生成中文显示"""
+    return relation_display or RELATION_DISPLAY_MAP.get(relation, relation)
+
+
+def attach_creator_info(db: Session, records: Iterable) -> None:
+    """给一批记录附加创建者信息（固定两次查询，与记录条数无关）。
+
+    对每条记录，优先获取该用户在该宝宝下 relation 非空的最新家庭成员记录，
+    找不到则回退到任意一条最新的家庭成员记录。
+    """
+    records = [r for r in records if r is not None]
+    if not records:
+        return
+
+    user_ids = {r.user_id for r in records}
+    baby_ids = {r.baby_id for r in records}
+
+    # 1. 批量查询用户
+    users = {
+        row.id: row
+        for row in db.query(User.id, User.nickname).filter(User.id.in_(user_ids))
+    }
+
+    # 2. 批量查询家庭成员关系（按 id 降序，先出现的即为最新）
+    families: dict[tuple[int, int], tuple] = {}
+    if users:
+        rows = (
+            db.query(
+                BabyFamily.user_id,
+                BabyFamily.baby_id,
+                BabyFamily.relation,
+                BabyFamily.relation_display,
+            )
+            .filter(
+                BabyFamily.user_id.in_(users.keys()),
+                BabyFamily.baby_id.in_(baby_ids),
+            )
+            .order_by(BabyFamily.id.desc())
+            .all()
+        )
+        for row in rows:
+            key = (row.user_id, row.baby_id)
+            current = families.get(key)
+            # 已经选中了非空 relation 的记录则保留；否则用更合适的记录替换
+            if current is None or (current.relation is None and row.relation is not None):
+                families[key] = row
+
+    for record in records:
+        user = users.get(record.user_id)
+        if not user:
+            record.created_by = None
+            continue
+
+        family = families.get((user.id, record.baby_id))
+        relation = family.relation if family else None
+        relation_display = family.relation_display if family else None
+
+        record.created_by = CreatorInfo(
+            user_id=user.id,
+            nickname=user.nickname,
+            relation=relation,
+            relation_display=resolve_relation_display(relation, relation_display)
+        )
@@ -0,0 +1,158 @@
+"""
+宝宝每日汇总（baby_daily_summary）相关的 CRUD 操作
+
+汇总按来源分组维护：某类记录写入后，只重算该宝宝受影响日期的这一组字段。
+重算使用单条 INSERT ... SELECT ... ON DUPLICATE KEY UPDATE，与记录写入处于同一事务。
+"""
+from typing import Optional
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import case, cast, func, literal, select, Date
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.orm import Session
+from wxcloudrun.models.daily_summary import BabyDailySummary
+from wxcloudrun.models.feeding import FeedingRecord
+from wxcloudrun.models.sleep import SleepRecord
+from wxcloudrun.models.diaper import DiaperRecord
+from wxcloudrun.models.pumping import PumpingRecord
+
+
+def _sum(expr):
+    return func.coalesce(func.sum(expr), 0)
+
+
+def _count_if(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def _feeding_columns() -> dict:
+    is_breast = FeedingRecord.feeding_type == 'breast'
+    return {
+        'feed_count': func.count(FeedingRecord.id),
+        'breast_left_seconds': _sum(case((is_breast, FeedingRecord.duration_left), else_=0)),
+        'breast_right_seconds': _sum(case((is_breast, FeedingRecord.duration_right), else_=0)),
+        'bottle_ml': _sum(case((FeedingRecord.feeding_type == 'formula', FeedingRecord.amount), else_=0)),
+    }
+
+
+def _sleep_columns() -> dict:
+    completed = SleepRecord.status == 'completed'
+    return {
+        'sleep_count': func.count(SleepRecord.id),
+        'sleep_completed_count': _count_if(completed),
+        'sleep_minutes': _sum(case((completed, SleepRecord.duration), else_=0)),
+        'wake_count': _sum(case((completed, SleepRecord.wake_count), else_=0)),
+    }
+
+
+def _diaper_columns() -> dict:
+    return {
+        'pee_count': _count_if(DiaperRecord.diaper_type == 'pee'),
+        'poop_count': _count_if(DiaperRecord.diaper_type == 'poop'),
+        'both_count': _count_if(DiaperRecord.diaper_type == 'both'),
+    }
+
+
+def _pumping_columns() -> dict:
+    return {
+        'pumping_count': func.count(PumpingRecord.id),
+        'pumped_ml': _sum(PumpingRecord.total_amount),
+        'pumped_left_ml': _sum(PumpingRecord.left_amount),
+        'pumped_right_ml': _sum(PumpingRecord.right_amount),
+    }
+
+
+# 来源 -> (模型, 归属日期的时间字段, 汇总字段表达式)
+SUMMARY_SOURCES = {
+    'feeding': (FeedingRecord, FeedingRecord.start_time, _feeding_columns),
+    'sleep': (SleepRecord, SleepRecord.start_time, _sleep_columns),
+    'diaper': (DiaperRecord, DiaperRecord.record_time, _diaper_columns),
+    'pumping': (PumpingRecord, PumpingRecord.record_time, _pumping_columns),
+}
+
+
+def _upsert(db: Session, columns: dict, select_stmt) -> None:
+    stmt = insert(BabyDailySummary).from_select(
+        ['baby_id', 'summary_date', *columns.keys()], select_stmt
+    )
+    stmt = stmt.on_duplicate_key_update(
+        {name: getattr(stmt.inserted, name) for name in columns}
+    )
+    db.execute(stmt)
+
+
+def _refresh_day(db: Session, kind: str, baby_id: int, day: date) -> None:
+    """重算某宝宝某一天某一类来源的汇总字段"""
+    model, time_col, columns_factory = SUMMARY_SOURCES[kind]
+    columns = columns_factory()
+    day_start = datetime.combine(day, time.min)
+    select_stmt = (
+        select(literal(baby_id), literal(day), *columns.values())
+        .where(
+            model.baby_id == baby_id,
+            time_col >= day_start,
+            time_col < day_start + timedelta(days=1),
+        )
+    )
+    _upsert(db, columns, select_stmt)
+
+
+def touch_daily_summary(db: Session, kind: str, baby_id: int, *times: Optional[datetime]) -> None:
+    """记录写入后重算受影响日期的汇总（在调用方事务中执行，由调用方 commit）
+
+    Args:
+        kind: feeding / sleep / diaper / pumping
+        times: 变更前后记录的归属时间（更新时传入旧值与新值）
+    """
+    db.flush()
+    for day in {t.date() for t in times if t}:
+        _refresh_day(db, kind, baby_id, day)
+
+
+def rebuild_daily_summary(
+    db: Session,
+    baby_id: Optional[int] = None,
+    start_day: Optional[date] = None,
+    end_day: Optional[date] = None,
+) -> int:
+    """从原始记录重建汇总（用于回填与修复），返回重建后的汇总行数"""
+    delete_query = db.query(BabyDailySummary)
+    if baby_id is not None:
+        delete_query = delete_query.filter(BabyDailySummary.baby_id == baby_id)
+    if start_day:
+        delete_query = delete_query.filter(BabyDailySummary.summary_date >= start_day)
+    if end_day:
+        delete_query = delete_query.filter(BabyDailySummary.summary_date <= end_day)
+    delete_query.delete(synchronize_session=False)
+
+    for model, time_col, columns_factory in SUMMARY_SOURCES.values():
+        columns = columns_factory()
+        day_col = cast(time_col, Date)
+        select_stmt = select(model.baby_id, day_col, *columns.values())
+        if baby_id is not None:
+            select_stmt = select_stmt.where(model.baby_id == baby_id)
+        if start_day:
+            select_stmt = select_stmt.where(time_col >= datetime.combine(start_day, time.min))
+        if end_day:
+            select_stmt = select_stmt.where(time_col < datetime.combine(end_day + timedelta(days=1), time.min))
+        _upsert(db, columns, select_stmt.group_by(model.baby_id, day_col))
+
+    db.commit()
+
+    count_query = db.query(func.count(BabyDailySummary.id))
+    if baby_id is not None:
+        count_query = count_query.filter(BabyDailySummary.baby_id == baby_id)
+    return count_query.scalar()
+
+
+def is_whole_day_range(start_date: datetime, end_date: datetime) -> bool:
+    """时间范围是否按整天对齐（可直接读取每日汇总）"""
+    return start_date.time() == time.min and end_date.time() >= time(23, 59, 59)
+
+
+def whole_day_filters(baby_id: int, start_date: datetime, end_date: datetime) -> list:
+    """整天范围对应的汇总表过滤条件"""
+    return [
+        BabyDailySummary.baby_id == baby_id,
+        BabyDailySummary.summary_date >= start_date.date(),
+        BabyDailySummary.summary_date <= end_date.date(),
+    ]
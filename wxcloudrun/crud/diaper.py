@@ -4,80 +4,21 @@
 from typing import Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, case, func
 from wxcloudrun.models.diaper import DiaperRecord
-from wxcloudrun.models.user import User
-from wxcloudrun.models.baby import BabyFamily
+from wxcloudrun.models.daily_summary import BabyDailySummary
 from wxcloudrun.schemas.diaper import DiaperRecordCreate, DiaperRecordUpdate
-from wxcloudrun.schemas.user import CreatorInfo
-
-
-def _attach_creator_info(db: Session, record: DiaperRecord) -> None:
-    if not record:
-        return
-
-    user = db.query(User).filter(User.id == record.user_id).first()
-    if not user:
-        record.created_by = None
-        return
-
-    family_with_relation = (
-        db.query(BabyFamily)
-        .filter(
-            BabyFamily.user_id == user.id,
-            BabyFamily.baby_id == record.baby_id,
-            BabyFamily.relation.isnot(None)
-        )
-        .order_by(BabyFamily.id.desc())
-        .first()
-    )
-
-    relation = None
-    relation_display = None
-    if family_with_relation:
-        relation = family_with_relation.relation
-        relation_display = family_with_relation.relation_display
-    else:
-        family_any = (
-            db.query(BabyFamily)
-            .filter(
-                BabyFamily.user_id == user.id,
-                BabyFamily.baby_id == record.baby_id
-            )
-            .order_by(BabyFamily.id.desc())
-            .first()
-        )
-        if family_any:
-            relation = family_any.relation
-            relation_display = family_any.relation_display
-        else:
-            relation = None
-            relation_display = None
-
-    relation_map = {
-        'mom': '妈妈',
-        'dad': '爸爸',
-        'grandpa_p': '爷爷',
-        'grandma_p': '奶奶',
-        'grandpa_m': '外公',
-        'grandma_m': '外婆',
-        'other': '其他'
-    }
-    relation_display = relation_display or relation_map.get(relation, relation)
-
-    record.created_by = CreatorInfo(
-        user_id=user.id,
-        nickname=user.nickname,
-        relation=relation,
-        relation_display=relation_display
-    )
+from wxcloudrun.crud.creator import attach_creator_info
+from wxcloudrun.crud.daily_summary import touch_daily_summary, is_whole_day_range, whole_day_filters
+from wxcloudrun.crud.stats import GroupBy, aggregate_by_period
+from wxcloudrun.utils.pagination import keyset_condition
 
 
 def get_diaper_record(db: Session, record_id: int) -> Optional[DiaperRecord]:
     """根据ID获取排便/排尿记录"""
     record = db.query(DiaperRecord).filter(DiaperRecord.id == record_id).first()
     if record:
-        _attach_creator_info(db, record)
+        attach_creator_info(db, [record])
     return record
 
 
@@ -88,8 +29,13 @@ def get_diaper_records_by_baby(
     limit: int = 100,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    cursor: Optional[tuple] = None,
 ) -> list[DiaperRecord]:
-    """获取宝宝的排便/排尿记录"""
+    """获取宝宝的排便/排尿记录
+
+    Args:
+        cursor: 上一页最后一条的 (时间, id)，为空表示从头开始；与 skip 同时传入时先按游标定位再跳过
+    """
     query = db.query(DiaperRecord).filter(DiaperRecord.baby_id == baby_id)
 
     if start_date:
@@ -97,11 +43,18 @@ def get_diaper_records_by_baby(
     if end_date:
         query = query.filter(DiaperRecord.record_time <= end_date)
 
-    records = query.order_by(DiaperRecord.record_time.desc()).offset(skip).limit(limit).all()
+    if cursor:
+        query = query.filter(keyset_condition(DiaperRecord.record_time, DiaperRecord.id, cursor))
+
+    records = (
+        query.order_by(DiaperRecord.record_time.desc(), DiaperRecord.id.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
 
-    # 为每条记录附加创建者信息
-    for record in records:
-        _attach_creator_info(db, record)
+    # 批量附加创建者信息
+    attach_creator_info(db, records)
 
     return records
 
@@ -110,6 +63,7 @@ def create_diaper_record(db: Session, record: DiaperRecordCreate, user_id: int)
     """创建排便/排尿记录"""
     db_record = DiaperRecord(**record.model_dump(), user_id=user_id)
     db.add(db_record)
+    touch_daily_summary(db, 'diaper', db_record.baby_id, db_record.record_time)
     db.commit()
     db.refresh(db_record)
     return db_record
@@ -123,10 +77,12 @@ def update_diaper_record(
     if not db_record:
         return None
 
+    old_record_time = db_record.record_time
     update_data = record.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_record, field, value)
 
+    touch_daily_summary(db, 'diaper', db_record.baby_id, old_record_time, db_record.record_time)
     db.commit()
     db.refresh(db_record)
     return db_record
@@ -139,22 +95,54 @@ def delete_diaper_record(db: Session, record_id: int) -> bool:
         return False
 
     db.delete(db_record)
+    touch_daily_summary(db, 'diaper', db_record.baby_id, db_record.record_time)
     db.commit()
     return True
 
 
-def get_diaper_count_by_date(db: Session, baby_id: int, start_date: datetime, end_date: datetime) -> dict:
-    """统计指定日期范围内的排便/排尿次数"""
-    records = get_diaper_records_by_baby(db, baby_id, start_date=start_date, end_date=end_date, limit=1000)
-
-    count = {
-        'pee': 0,
-        'poop': 0,
-        'both': 0,
-        'total': len(records)
-    }
-
-    for record in records:
-        count[record.diaper_type] += 1
+def get_diaper_count_by_date(
+    db: Session,
+    baby_id: int,
+    start_date: datetime,
+    end_date: datetime,
+    group_by: Optional[GroupBy] = None,
+) -> dict:
+    """统计指定日期范围内的排便/排尿次数
+
+    范围按整天对齐时直接读取每日汇总表，否则在原始记录上聚合。
+    """
+    if is_whole_day_range(start_date, end_date):
+        s = BabyDailySummary
+        totals, series = aggregate_by_period(
+            db,
+            metrics=[
+                func.sum(s.pee_count).label('pee'),
+                func.sum(s.poop_count).label('poop'),
+                func.sum(s.both_count).label('both'),
+                func.sum(s.pee_count + s.poop_count + s.both_count).label('total'),
+            ],
+            time_col=s.summary_date,
+            filters=whole_day_filters(baby_id, start_date, end_date),
+            group_by=group_by,
+        )
+    else:
+        totals, series = aggregate_by_period(
+            db,
+            metrics=[
+                func.sum(case((DiaperRecord.diaper_type == 'pee', 1), else_=0)).label('pee'),
+                func.sum(case((DiaperRecord.diaper_type == 'poop', 1), else_=0)).label('poop'),
+                func.sum(case((DiaperRecord.diaper_type == 'both', 1), else_=0)).label('both'),
+                func.count(DiaperRecord.id).label('total'),
+            ],
+            time_col=DiaperRecord.record_time,
+            filters=[
+                DiaperRecord.baby_id == baby_id,
+                DiaperRecord.record_time >= start_date,
+                DiaperRecord.record_time <= end_date,
+            ],
+            group_by=group_by,
+        )
 
-    return count
+    if group_by:
+        totals['series'] = series
+    return totals
@@ -3,126 +3,26 @@
 """
 from typing import Optional
 from datetime import datetime
-import json
+from pydantic_core import to_jsonable_python
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import flag_modified
 from wxcloudrun.models.feeding import FeedingRecord
-from wxcloudrun.models.user import User
-from wxcloudrun.models.baby import BabyFamily
-from wxcloudrun.schemas.feeding import (
-    FeedingRecordCreate,
-    FeedingRecordUpdate,
-    FeedingSequenceItem,
-)
-from wxcloudrun.schemas.user import CreatorInfo
-
-
-def _deserialize_feeding_sequence(record: FeedingRecord) -> None:
-    """反序列化喂养序列（从JSON字符串转为对象列表）"""
-    if record.feeding_sequence:
-        try:
-            sequence_data = json.loads(record.feeding_sequence)
-            record.feeding_sequence = [
-                FeedingSequenceItem(**item) for item in sequence_data
-            ]
-        except (json.JSONDecodeError, TypeError, ValueError):
-            record.feeding_sequence = None
+from wxcloudrun.models.daily_summary import BabyDailySummary
+from wxcloudrun.schemas.feeding import FeedingRecordCreate, FeedingRecordUpdate
+from wxcloudrun.crud.creator import attach_creator_info
+from wxcloudrun.crud.daily_summary import touch_daily_summary
+from wxcloudrun.utils.pagination import keyset_condition
 
 
 def _serialize_feeding_sequence(data: dict) -> dict:
-    """序列化喂养序列（从对象列表转为JSON字符串）"""
-    if 'feeding_sequence' in data and data['feeding_sequence'] is not None:
-        sequence_list = data['feeding_sequence']
-        if isinstance(sequence_list, list) and len(sequence_list) > 0:
-            # 转换为字典列表，然后序列化为JSON
-            serialized_items = []
-            for item in sequence_list:
-                if hasattr(item, 'model_dump'):
-                    # 使用 mode='json' 来确保 datetime 被转换为字符串
-                    item_dict = item.model_dump(mode='json')
-                else:
-                    item_dict = item
-                serialized_items.append(item_dict)
-
-            data['feeding_sequence'] = json.dumps(
-                serialized_items,
-                ensure_ascii=False,
-                default=str,
-            )
+    """序列化喂养序列（对象列表转为可写入 JSON 列的字典列表）"""
+    sequence_list = data.get('feeding_sequence')
+    if isinstance(sequence_list, list):
+        # datetime 转换为 ISO 字符串
+        data['feeding_sequence'] = to_jsonable_python(sequence_list)
     return data
 
 
-def _attach_creator_info(db: Session, record: FeedingRecord) -> None:
-    """给记录附加创建者信息。
-
-    优先获取在该宝宝下非空的关系，找不到则回退。
-    同时生成中文显示名称（relation_display）。
-    """
-    if not record:
-        return
-
-    # 查询用户信息
-    user = db.query(User).filter(User.id == record.user_id).first()
-    if not user:
-        record.created_by = None
-        return
-
-    # 优先获取非空 relation 的家庭成员记录
-    family_with_relation = (
-        db.query(BabyFamily)
-        .filter(
-            BabyFamily.user_id == user.id,
-            BabyFamily.baby_id == record.baby_id,
-            BabyFamily.relation.isnot(None)
-        )
-        .order_by(BabyFamily.id.desc())
-        .first()
-    )
-
-    relation = None
-    relation_display = None
-    if family_with_relation:
-        relation = family_with_relation.relation
-        relation_display = family_with_relation.relation_display
-    else:
-        # 回退：任意一条家庭成员记录（可能 relation 为 NULL）
-        family_any = (
-            db.query(BabyFamily)
-            .filter(
-                BabyFamily.user_id == user.id,
-                BabyFamily.baby_id == record.baby_id
-            )
-            .order_by(BabyFamily.id.desc())
-            .first()
-        )
-        if family_any:
-            relation = family_any.relation
-            relation_display = family_any.relation_display
-        else:
-            relation = None
-            relation_display = None
-
-    # 关系显示映射（同时支持枚举代码和中文原值）
-    relation_map = {
-        'mom': '妈妈',
-        'dad': '爸爸',
-        'grandpa_p': '爷爷',
-        'grandma_p': '奶奶',
-        'grandpa_m': '外公',
-        'grandma_m': '外婆',
-        'other': '其他'
-    }
-    # 如果数据库中没有显示名称，则根据枚举映射生成中文显示
-    relation_display = relation_display or relation_map.get(relation, relation)
-
-    record.created_by = CreatorInfo(
-        user_id=user.id,
-        nickname=user.nickname,
-        relation=relation,
-        relation_display=relation_display
-    )
-
-
 def get_feeding_record(db: Session, record_id: int) -> Optional[FeedingRecord]:
     """根据ID获取喂养记录"""
     record = (
@@ -131,8 +31,7 @@ def get_feeding_record(db: Session, record_id: int) -> Optional[FeedingRecord]:
         .first()
     )
     if record:
-        _deserialize_feeding_sequence(record)
-        _attach_creator_info(db, record)
+        attach_creator_info(db, [record])
     return record
 
 
@@ -146,7 +45,13 @@ def get_feeding_records_by_baby(
     feeding_type: Optional[str] = None,
     sort_by: Optional[str] = "start_time",
     order: Optional[str] = "desc",
+    cursor: Optional[tuple] = None,
 ) -> list[FeedingRecord]:
+    """获取宝宝的喂养记录
+
+    Args:
+        cursor: 上一页最后一条的 (排序字段值, id)，为空表示从头开始；与 skip 同时传入时先按游标定位再跳过
+    """
     query = db.query(FeedingRecord).filter(FeedingRecord.baby_id == baby_id)
     if feeding_type:
         query = query.filter(FeedingRecord.feeding_type == feeding_type)
@@ -161,14 +66,15 @@ def get_feeding_records_by_baby(
         sort_col = FeedingRecord.created_at
     elif sort_by == "updated_at":
         sort_col = FeedingRecord.updated_at
+    if cursor:
+        query = query.filter(keyset_condition(sort_col, FeedingRecord.id, cursor, descending=order != "asc"))
+    # 以 id 作为同一时间的次级排序，保证游标分页稳定
     if order == "asc":
-        query = query.order_by(sort_col.asc())
+        query = query.order_by(sort_col.asc(), FeedingRecord.id.asc())
     else:
-        query = query.order_by(sort_col.desc())
+        query = query.order_by(sort_col.desc(), FeedingRecord.id.desc())
     records = query.offset(skip).limit(limit).all()
-    for record in records:
-        _deserialize_feeding_sequence(record)
-        _attach_creator_info(db, record)
+    attach_creator_info(db, records)
     return records
 
 
@@ -197,16 +103,27 @@ def _calculate_durations(data: dict) -> dict:
     return data
 
 
-def create_feeding_record(db: Session, record: FeedingRecordCreate, user_id: int) -> FeedingRecord:
-    """创建喂养记录"""
+def create_payload(record: FeedingRecordCreate) -> dict:
+    """创建喂养记录时写入的字段（计算左右侧时长并序列化喂养序列）"""
     record_data = record.model_dump()
     record_data = _calculate_durations(record_data)
-    record_data = _serialize_feeding_sequence(record_data)
-    db_record = FeedingRecord(**record_data, user_id=user_id)
+    return _serialize_feeding_sequence(record_data)
+
+
+def update_payload(record: FeedingRecordUpdate) -> dict:
+    """更新喂养记录时写入的字段"""
+    update_data = record.model_dump(exclude_unset=True)
+    update_data = _calculate_durations(update_data)
+    return _serialize_feeding_sequence(update_data)
+
+
+def create_feeding_record(db: Session, record: FeedingRecordCreate, user_id: int) -> FeedingRecord:
+    """创建喂养记录"""
+    db_record = FeedingRecord(**create_payload(record), user_id=user_id)
     db.add(db_record)
+    touch_daily_summary(db, 'feeding', db_record.baby_id, db_record.start_time)
     db.commit()
     db.refresh(db_record)
-    _deserialize_feeding_sequence(db_record)
     return db_record
 
 
@@ -218,9 +135,8 @@ def update_feeding_record(
     if not db_record:
         return None
 
-    update_data = record.model_dump(exclude_unset=True)
-    update_data = _calculate_durations(update_data)
-    update_data = _serialize_feeding_sequence(update_data)
+    old_start_time = db_record.start_time
+    update_data = update_payload(record)
     if 'start_time' not in update_data:
         update_data['start_time'] = db_record.start_time
         # 强制写回 start_time，避免数据库自动更新时间覆盖
@@ -229,9 +145,9 @@ def update_feeding_record(
     for field, value in update_data.items():
         setattr(db_record, field, value)
 
+    touch_daily_summary(db, 'feeding', db_record.baby_id, old_start_time, db_record.start_time)
     db.commit()
     db.refresh(db_record)
-    _deserialize_feeding_sequence(db_record)
     return db_record
 
 
@@ -242,6 +158,7 @@ def delete_feeding_record(db: Session, record_id: int) -> bool:
         return False
 
     db.delete(db_record)
+    touch_daily_summary(db, 'feeding', db_record.baby_id, db_record.start_time)
     db.commit()
     return True
 
@@ -255,59 +172,50 @@ def get_latest_feeding(db: Session, baby_id: int) -> Optional[FeedingRecord]:
         .first()
     )
     if record:
-        _deserialize_feeding_sequence(record)
-        _attach_creator_info(db, record)
+        attach_creator_info(db, [record])
     return record
 
 
 def get_daily_feeding_stats(db: Session, baby_id: int, date: datetime) -> dict:
     """获取指定日期的喂养统计（左右侧总时长、最近一次喂养侧）"""
-    # 1. 获取当天的所有记录
-    start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
-    end_of_day = date.replace(hour=23, minute=59, second=59, microsecond=999999)
-    
-    records = (
-        db.query(FeedingRecord)
+    # 1. 从每日汇总表读取当天左右侧总时长
+    summary = (
+        db.query(BabyDailySummary.breast_left_seconds, BabyDailySummary.breast_right_seconds)
         .filter(
-            FeedingRecord.baby_id == baby_id,
-            FeedingRecord.feeding_type == 'breast',
-            FeedingRecord.start_time >= start_of_day,
-            FeedingRecord.start_time <= end_of_day
+            BabyDailySummary.baby_id == baby_id,
+            BabyDailySummary.summary_date == date.date()
         )
-        .order_by(FeedingRecord.start_time.asc())
-        .all()
+        .first()
     )
-    
-    total_left = 0
-    total_right = 0
-    
-    for r in records:
-        total_left += (r.duration_left or 0)
-        total_right += (r.duration_right or 0)
+    total_left = summary.breast_left_seconds if summary else 0
+    total_right = summary.breast_right_seconds if summary else 0
         
-    # 2. 获取最近一次喂养记录（不限当天，只要是最近的）
-    last_record = get_latest_feeding(db, baby_id)
+    # 2. 最近一次喂养（不限当天）：只读取生成列与时长，不加载、解析喂养序列
+    last_record = (
+        db.query(
+            FeedingRecord.sequence_last_side,
+            FeedingRecord.sequence_count,
+            FeedingRecord.duration_left,
+            FeedingRecord.duration_right,
+            FeedingRecord.start_time,
+            FeedingRecord.end_time,
+        )
+        .filter(FeedingRecord.baby_id == baby_id)
+        .order_by(FeedingRecord.start_time.desc())
+        .first()
+    )
     last_side = None
     last_time = None
-    
+
     if last_record:
-        # 尝试从 feeding_sequence 判断最后一次的具体侧
-        # 如果没有 sequence，则尝试用 duration 判断
-        # 简单起见，我们看 duration_left 和 duration_right
-        # 如果都有，说明是双侧，或者最后一次是某一侧？
-        # 这里我们简单逻辑：如果 sequence 存在，取最后一个 item 的 side
-        # 否则，如果 duration_right > 0 则 right，否则 left (假设)
-        
-        if last_record.feeding_sequence and isinstance(last_record.feeding_sequence, list) and len(last_record.feeding_sequence) > 0:
-             last_item = last_record.feeding_sequence[-1]
-             last_side = getattr(last_item, 'side', None) or last_item.get('side')
-        else:
-             # Fallback
-             if (last_record.duration_right or 0) > 0:
-                 last_side = 'right'
-             elif (last_record.duration_left or 0) > 0:
-                 last_side = 'left'
-                 
+        # 有喂养序列时取最后一段的侧别，否则按时长判断
+        if last_record.sequence_count:
+            last_side = last_record.sequence_last_side
+        elif (last_record.duration_right or 0) > 0:
+            last_side = 'right'
+        elif (last_record.duration_left or 0) > 0:
+            last_side = 'left'
+
         last_time = last_record.end_time or last_record.start_time
 
     return {
@@ -0,0 +1,270 @@
+"""
+正在进行的喂养（母乳计时）相关的 CRUD 操作
+
+feeding_ongoing 只保存计时开始时的状态，之后每次切换左右侧 / 暂停都只向 feeding_ongoing_segments
+追加一行（INSERT ... SELECT，不更新计时行），多位家庭成员同时操作时互不冲突，也不会丢失或重复累计时长。
+当前状态与结束时的喂养序列都由分段按时间顺序回放得到；从已有记录恢复计时时，原记录的喂养序列还原为分段。
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import delete, insert, literal, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from wxcloudrun.models.feeding import FeedingRecord
+from wxcloudrun.models.feeding_ongoing import FeedingOngoing, FeedingOngoingSegment
+from wxcloudrun.crud.daily_summary import touch_daily_summary
+
+# 并发创建计时冲突时的最大重试次数
+ONGOING_MAX_RETRIES = 10
+
+_ACTION_SIDES = {'start_left': 'left', 'start_right': 'right', 'pause': 'paused'}
+
+
+class OngoingConflictError(RuntimeError):
+    """并发操作过于频繁，重试后仍未能完成状态切换"""
+
+
+def get_ongoing(db: Session, baby_id: int) -> Optional[FeedingOngoing]:
+    return db.query(FeedingOngoing).filter(FeedingOngoing.baby_id == baby_id).first()
+
+
+def _replay(ongoing: FeedingOngoing, segments: list, until: Optional[datetime] = None) -> dict:
+    """
+    从计时开始时的状态依次回放分段，返回当前状态与喂养序列
+
+    时钟回拨（分段时间早于上一次操作）时该段记 0；until 为结束时间，不传时不计算进行中的最后一段
+    """
+    side = ongoing.current_side
+    last = ongoing.last_action_time
+    totals = {'left': ongoing.accumulated_left or 0, 'right': ongoing.accumulated_right or 0}
+    sequence = []
+
+    def close(end: datetime) -> None:
+        if side == 'paused':
+            return
+        seconds = max(0, int((end - last).total_seconds()))
+        if seconds == 0:
+            return
+        totals[side] += seconds
+        previous = sequence[-1] if sequence else None
+        # 重复点击同一侧时与上一段连续，合并为一段
+        if previous and previous['side'] == side and \
+                (previous['start_time'] - last).total_seconds() + previous['duration_seconds'] == 0:
+            previous['duration_seconds'] += seconds
+        else:
+            sequence.append({'side': side, 'duration_seconds': seconds, 'start_time': last})
+
+    for segment in segments:
+        close(segment.action_time)
+        side = segment.side
+        last = max(last, segment.action_time)
+    if until is not None:
+        close(until)
+
+    return {
+        'current_side': side,
+        'last_action_time': last,
+        'accumulated_left': totals['left'],
+        'accumulated_right': totals['right'],
+        'sequence': sequence,
+    }
+
+
+def _ongoing_state(ongoing: FeedingOngoing, segments: list) -> dict:
+    """计时状态（FeedingOngoingResponse 的字段）"""
+    state = _replay(ongoing, segments)
+    state.pop('sequence')
+    state.update(
+        id=ongoing.id,
+        baby_id=ongoing.baby_id,
+        start_time=ongoing.start_time,
+        version=(ongoing.version or 0) + len(segments),
+        updated_at=segments[-1].action_time if segments else ongoing.updated_at,
+    )
+    return state
+
+
+def get_ongoing_state(db: Session, baby_id: int) -> Optional[dict]:
+    """当前计时状态（一次查询读取计时行及其全部分段）；没有进行中的喂养时返回 None"""
+    rows = db.execute(
+        select(FeedingOngoing, FeedingOngoingSegment)
+        .outerjoin(FeedingOngoingSegment, FeedingOngoingSegment.ongoing_id == FeedingOngoing.id)
+        .where(FeedingOngoing.baby_id == baby_id)
+        .order_by(FeedingOngoingSegment.action_time, FeedingOngoingSegment.id)
+    ).all()
+    if not rows:
+        return None
+    segments = [segment for _, segment in rows if segment is not None]
+    return _ongoing_state(rows[0][0], segments)
+
+
+def build_ongoing_state(ongoing: FeedingOngoing) -> dict:
+    """刚创建（尚无分段）的计时状态"""
+    return _ongoing_state(ongoing, [])
+
+
+def _sequence_segments(sequence: Optional[list]) -> list[tuple[str, datetime]]:
+    """
+    把喂养序列还原为 (切换后的状态, 操作时间)：每段开始时切换到该侧、结束时暂停
+
+    无法解析的条目跳过；各段时间有重叠时（早期版本按开始时间补出的近似序列）无法还原，返回空列表
+    """
+    items = []
+    for item in sequence or []:
+        try:
+            side = item['side']
+            start = datetime.fromisoformat(item['start_time'])
+            seconds = int(item['duration_seconds'])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if side not in ('left', 'right') or seconds <= 0:
+            continue
+        if start.tzinfo is not None:
+            start = start.astimezone().replace(tzinfo=None)
+        items.append((start.replace(microsecond=0), seconds, side))
+
+    actions = []
+    previous_end = None
+    for start, seconds, side in sorted(items):
+        if previous_end is not None and start < previous_end:
+            return []
+        previous_end = start + timedelta(seconds=seconds)
+        actions += [(side, start), ('paused', previous_end)]
+    return actions
+
+
+def resume_ongoing(db: Session, record: FeedingRecord, now: Optional[datetime] = None) -> dict:
+    """
+    从已有的喂养记录恢复计时（删除原记录），返回恢复后的计时状态（暂停中）
+
+    原记录的喂养序列还原为分段，结束时原样回放；序列未覆盖的时长（没有序列或手动修改过时长）
+    作为左右侧初始累计时长，只计入总时长，不在序列中虚构分段
+    """
+    now = (now or datetime.now()).replace(microsecond=0)
+    baby_id = record.baby_id
+    ongoing = FeedingOngoing(
+        baby_id=baby_id,
+        start_time=record.start_time,
+        last_action_time=record.start_time,
+        current_side='paused',
+        accumulated_left=0,
+        accumulated_right=0,
+        version=0,
+        updated_at=now,
+    )
+    segments = [
+        FeedingOngoingSegment(baby_id=baby_id, side=side, action_time=action_time)
+        for side, action_time in _sequence_segments(record.feeding_sequence)
+    ]
+    replayed = _replay(ongoing, segments)
+    ongoing.accumulated_left = max(0, (record.duration_left or 0) - replayed['accumulated_left'])
+    ongoing.accumulated_right = max(0, (record.duration_right or 0) - replayed['accumulated_right'])
+
+    db.add(ongoing)
+    db.flush()
+    for segment in segments:
+        segment.ongoing_id = ongoing.id
+    db.add_all(segments)
+    db.delete(record)
+    touch_daily_summary(db, 'feeding', baby_id, record.start_time)
+    db.commit()
+    return get_ongoing_state(db, baby_id)
+
+
+def apply_ongoing_action(db: Session, baby_id: int, action: str, now: Optional[datetime] = None) -> dict:
+    """
+    开始左侧 / 开始右侧 / 暂停，返回操作后的计时状态
+
+    Raises:
+        ValueError: 没有进行中的喂养时暂停
+        OngoingConflictError: 并发冲突重试后仍失败
+    """
+    side = _ACTION_SIDES[action]
+    # 列类型为 TIMESTAMP（秒精度），舍去微秒避免写入时被四舍五入
+    now = (now or datetime.now()).replace(microsecond=0)
+
+    for _ in range(ONGOING_MAX_RETRIES):
+        # 追加分段；INSERT ... SELECT 对计时行加共享锁，与结束计时互斥
+        appended = db.execute(
+            insert(FeedingOngoingSegment).from_select(
+                ['ongoing_id', 'baby_id', 'side', 'action_time'],
+                select(FeedingOngoing.id, FeedingOngoing.baby_id, literal(side), literal(now))
+                .where(FeedingOngoing.baby_id == baby_id)
+            )
+        ).rowcount
+        if appended:
+            db.commit()
+            # 新事务读取最新提交的分段（包含其他家庭成员同时追加的分段）
+            return get_ongoing_state(db, baby_id)
+
+        if side == 'paused':
+            db.rollback()
+            raise ValueError("没有正在进行的喂养，无法暂停")
+        ongoing = FeedingOngoing(
+            baby_id=baby_id,
+            start_time=now,
+            last_action_time=now,
+            current_side=side,
+            accumulated_left=0,
+            accumulated_right=0,
+            version=0,
+            updated_at=now,
+        )
+        db.add(ongoing)
+        try:
+            db.flush()
+            # 先移出会话，避免提交后属性过期触发再次查询
+            db.expunge(ongoing)
+            db.commit()
+            return build_ongoing_state(ongoing)
+        except IntegrityError:
+            # 其他家庭成员同时开始了计时，改为追加分段
+            db.rollback()
+
+    raise OngoingConflictError("操作过于频繁，请稍后重试")
+
+
+def finish_ongoing(db: Session, baby_id: int, user_id: int, now: Optional[datetime] = None) -> Optional[FeedingRecord]:
+    """
+    结束计时并保存为喂养记录（回放分段得到准确的喂养序列与左右侧时长）；没有进行中的喂养时返回 None
+
+    左右侧时长包含初始累计时长（恢复计时时序列未覆盖的部分），喂养序列只包含实际的分段
+
+    锁定计时行后再读取分段：正在追加的分段先提交，之后的操作等待结束后开始新的计时
+    """
+    now = (now or datetime.now()).replace(microsecond=0)
+
+    ongoing = db.query(FeedingOngoing).filter(FeedingOngoing.baby_id == baby_id).with_for_update().first()
+    if ongoing is None:
+        db.rollback()
+        return None
+    # 锁定读取最新提交的数据（普通查询可能读到本事务更早建立的快照）
+    segments = db.execute(
+        select(FeedingOngoingSegment)
+        .where(FeedingOngoingSegment.ongoing_id == ongoing.id)
+        .order_by(FeedingOngoingSegment.action_time, FeedingOngoingSegment.id)
+        .with_for_update()
+    ).scalars().all()
+    state = _replay(ongoing, segments, until=max(now, ongoing.last_action_time))
+
+    sequence = state['sequence']
+
+    db.execute(delete(FeedingOngoingSegment).where(FeedingOngoingSegment.baby_id == baby_id))
+    db.delete(ongoing)
+
+    record = FeedingRecord(
+        baby_id=baby_id,
+        user_id=user_id,
+        feeding_type='breast',
+        start_time=ongoing.start_time,
+        end_time=now,
+        duration_left=state['accumulated_left'],
+        duration_right=state['accumulated_right'],
+        feeding_sequence=[dict(item, start_time=item['start_time'].isoformat()) for item in sequence],
+        notes=""
+    )
+    db.add(record)
+    touch_daily_summary(db, 'feeding', baby_id, record.start_time)
+    db.commit()
+    db.refresh(record)
+    return record
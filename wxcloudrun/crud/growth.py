@@ -6,88 +6,16 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 from wxcloudrun.models.growth import GrowthRecord
-from wxcloudrun.models.user import User
-from wxcloudrun.models.baby import BabyFamily
 from wxcloudrun.schemas.growth import GrowthRecordCreate, GrowthRecordUpdate
-from wxcloudrun.schemas.user import CreatorInfo
-
-
-def _attach_creator_info(db: Session, record: GrowthRecord) -> None:
-    """给记录附加创建者信息。
-
-    优先获取在该宝宝下非空的关系，找不到则回退。
-    同时生成中文显示名称（relation_display）。
-    """
-    if not record:
-        return
-
-    # 查询用户信息
-    user = db.query(User).filter(User.id == record.user_id).first()
-    if not user:
-        record.created_by = None
-        return
-
-    # 优先获取非空 relation 的家庭成员记录
-    family_with_relation = (
-        db.query(BabyFamily)
-        .filter(
-            BabyFamily.user_id == user.id,
-            BabyFamily.baby_id == record.baby_id,
-            BabyFamily.relation.isnot(None)
-        )
-        .order_by(BabyFamily.id.desc())
-        .first()
-    )
-
-    relation = None
-    relation_display = None
-    if family_with_relation:
-        relation = family_with_relation.relation
-        relation_display = family_with_relation.relation_display
-    else:
-        # 回退：任意一条家庭成员记录（可能 relation 为 NULL）
-        family_any = (
-            db.query(BabyFamily)
-            .filter(
-                BabyFamily.user_id == user.id,
-                BabyFamily.baby_id == record.baby_id
-            )
-            .order_by(BabyFamily.id.desc())
-            .first()
-        )
-        if family_any:
-            relation = family_any.relation
-            relation_display = family_any.relation_display
-        else:
-            relation = None
-            relation_display = None
-
-    # 关系显示映射（同时支持枚举代码和中文原值）
-    relation_map = {
-        'mom': '妈妈',
-        'dad': '爸爸',
-        'grandpa_p': '爷爷',
-        'grandma_p': '奶奶',
-        'grandpa_m': '外公',
-        'grandma_m': '外婆',
-        'other': '其他'
-    }
-    # 如果数据库中没有显示名称，则根据枚举映射生成中文显示
-    relation_display = relation_display or relation_map.get(relation, relation)
-
-    record.created_by = CreatorInfo(
-        user_id=user.id,
-        nickname=user.nickname,
-        relation=relation,
-        relation_display=relation_display
-    )
+from wxcloudrun.crud.creator import attach_creator_info
+from wxcloudrun.utils.pagination import keyset_condition
 
 
 def get_growth_record(db: Session, record_id: int) -> Optional[GrowthRecord]:
     """根据ID获取生长发育记录"""
     record = db.query(GrowthRecord).filter(GrowthRecord.id == record_id).first()
     if record:
-        _attach_creator_info(db, record)
+        attach_creator_info(db, [record])
     return record
 
 
@@ -98,8 +26,13 @@ def get_growth_records_by_baby(
     limit: int = 100,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    cursor: Optional[tuple] = None,
 ) -> list[GrowthRecord]:
-    """获取宝宝的生长发育记录"""
+    """获取宝宝的生长发育记录
+
+    Args:
+        cursor: 上一页最后一条的 (时间, id)，为空表示从头开始；与 skip 同时传入时先按游标定位再跳过
+    """
     query = db.query(GrowthRecord).filter(GrowthRecord.baby_id == baby_id)
 
     if start_date:
@@ -107,11 +40,18 @@ def get_growth_records_by_baby(
     if end_date:
         query = query.filter(GrowthRecord.record_date <= end_date)
 
-    records = query.order_by(GrowthRecord.record_date.desc()).offset(skip).limit(limit).all()
+    if cursor:
+        query = query.filter(keyset_condition(GrowthRecord.record_date, GrowthRecord.id, cursor))
+
+    records = (
+        query.order_by(GrowthRecord.record_date.desc(), GrowthRecord.id.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
 
-    # 为每条记录附加创建者信息
-    for record in records:
-        _attach_creator_info(db, record)
+    # 批量附加创建者信息
+    attach_creator_info(db, records)
 
     return records
 
@@ -162,7 +102,7 @@ def get_latest_growth(db: Session, baby_id: int) -> Optional[GrowthRecord]:
         .first()
     )
     if record:
-        _attach_creator_info(db, record)
+        attach_creator_info(db, [record])
     return record
 
 
@@ -0,0 +1,125 @@
+"""
+首页时间线相关的 CRUD 操作
+
+六类记录先通过一条 UNION ALL 查询在合并后的时间轴上完成排序与分页（只取主键），
+再按类型用 IN 查询取回完整记录。查询次数固定，不随记录条数增长。
+"""
+from typing import Optional
+from datetime import datetime
+from sqlalchemy import select, union_all, literal, tuple_
+from sqlalchemy.orm import Session, selectinload
+from wxcloudrun.models.feeding import FeedingRecord
+from wxcloudrun.models.diaper import DiaperRecord
+from wxcloudrun.models.sleep import SleepRecord
+from wxcloudrun.models.growth import GrowthRecord
+from wxcloudrun.models.jaundice import JaundiceRecord
+from wxcloudrun.models.pumping import PumpingRecord
+from wxcloudrun.crud.creator import attach_creator_info
+
+
+# 记录类型 -> (模型, 时间轴字段)
+TIMELINE_SOURCES = {
+    'feeding': (FeedingRecord, FeedingRecord.start_time),
+    'diaper': (DiaperRecord, DiaperRecord.record_time),
+    'sleep': (SleepRecord, SleepRecord.start_time),
+    'growth': (GrowthRecord, GrowthRecord.record_date),
+    'jaundice': (JaundiceRecord, JaundiceRecord.record_date),
+    'pumping': (PumpingRecord, PumpingRecord.record_time),
+}
+
+
+def _cursor_condition(kind: str, model, time_col, cursor: tuple):
+    """单个分支的游标条件
+
+    合并时间轴按 (时间, 类型, id) 降序排列，类型在分支内是常量，
+    因此可以化简为只依赖 (baby_id, 时间) 索引的条件。
+    """
+    cursor_time, cursor_kind, cursor_id = cursor
+    if kind < cursor_kind:
+        return time_col <= cursor_time
+    if kind > cursor_kind:
+        return time_col < cursor_time
+    return tuple_(time_col, model.id) < tuple_(cursor_time, cursor_id)
+
+
+def get_home_timeline(
+    db: Session,
+    baby_id: int,
+    limit: int = 100,
+    skip: int = 0,
+    cursor: Optional[tuple] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> tuple[dict[str, list], Optional[tuple]]:
+    """获取首页合并时间线
+
+    Args:
+        cursor: 上一页最后一条的 (时间, 类型, id)，为空表示第一页
+
+    Returns:
+        (按类型分组的记录（组内按时间倒序）, 下一页游标；没有更多数据时为 None)
+    """
+    # 1. 一次查询得到当前页的 (类型, id, 时间)
+    branches = []
+    for kind, (model, time_col) in TIMELINE_SOURCES.items():
+        branch = (
+            select(
+                literal(kind).label('kind'),
+                model.id.label('id'),
+                time_col.label('event_time'),
+            )
+            .where(model.baby_id == baby_id)
+        )
+        if start_date:
+            branch = branch.where(time_col >= start_date)
+        if end_date:
+            branch = branch.where(time_col <= end_date)
+        if cursor:
+            branch = branch.where(_cursor_condition(kind, model, time_col, cursor))
+        # 每个分支最多只需要 skip + limit + 1 条
+        branch = branch.order_by(time_col.desc(), model.id.desc()).limit(skip + limit + 1)
+        # 包一层派生表再 UNION：带 ORDER BY / LIMIT 的括号分支 SQLite 不支持（测试库），MySQL 结果相同
+        branches.append(select(branch.subquery()))
+
+    timeline = union_all(*branches).subquery()
+    rows = db.execute(
+        select(timeline.c.kind, timeline.c.id, timeline.c.event_time)
+        .order_by(
+            timeline.c.event_time.desc(),
+            timeline.c.kind.desc(),
+            timeline.c.id.desc(),
+        )
+        .offset(skip)
+        .limit(limit + 1)
+    ).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = (last.event_time, last.kind, last.id)
+
+    # 2. 按类型批量取回完整记录
+    ids_by_kind: dict[str, list[int]] = {kind: [] for kind in TIMELINE_SOURCES}
+    for row in rows:
+        ids_by_kind[row.kind].append(row.id)
+
+    grouped: dict[str, list] = {}
+    for kind, ids in ids_by_kind.items():
+        if not ids:
+            grouped[kind] = []
+            continue
+        model, _ = TIMELINE_SOURCES[kind]
+        query = db.query(model).filter(model.id.in_(ids))
+        if model is JaundiceRecord:
+            query = query.options(selectinload(JaundiceRecord.created_by))
+        by_id = {r.id: r for r in query.all()}
+        grouped[kind] = [by_id[i] for i in ids if i in by_id]
+
+    # 3. 一次性附加创建者信息（黄疸记录的 created_by 为用户关系，单独预加载）
+    attach_creator_info(
+        db,
+        [r for kind, records in grouped.items() if kind != 'jaundice' for r in records],
+    )
+
+    return grouped, next_cursor
@@ -2,6 +2,7 @@ from datetime import datetime, timedelta
 from typing import Optional
 from sqlalchemy.orm import Session
 from wxcloudrun.models.invitation import Invitation
+from wxcloudrun.utils.cache import qrcode_cache
 
 
 def get_active_invitation_by_baby(db: Session, baby_id: int) -> Optional[Invitation]:
@@ -27,6 +28,14 @@ def create_invitation_for_baby(db: Session, baby_id: int, creator_id: int, ttl_d
         chars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
         return ''.join(random.choice(chars) for _ in range(8))
 
+    # 签发新码前，清理该宝宝旧邀请码对应的小程序码缓存
+    old_scenes = {
+        f"code={old_code}"
+        for (old_code,) in db.query(Invitation.invite_code).filter(Invitation.baby_id == baby_id)
+    }
+    if old_scenes:
+        qrcode_cache.pop_where(lambda key: key[0] in old_scenes)
+
     code = gen_code()
     while db.query(Invitation).filter(Invitation.invite_code == code).first() is not None:
         code = gen_code()
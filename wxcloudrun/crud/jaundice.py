@@ -4,6 +4,7 @@ from typing import List, Optional
 from datetime import datetime
 from wxcloudrun.models.jaundice import JaundiceRecord
 from wxcloudrun.schemas.jaundice import JaundiceRecordCreate, JaundiceRecordUpdate
+from wxcloudrun.utils.pagination import keyset_condition
 
 def create_jaundice_record(db: Session, record: JaundiceRecordCreate, user_id: int) -> JaundiceRecord:
     """创建黄疸记录"""
@@ -30,17 +31,24 @@ def get_jaundice_records_by_baby(
     skip: int = 0, 
     limit: int = 100,
     start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None,
+    cursor: Optional[tuple] = None
 ) -> List[JaundiceRecord]:
-    """获取宝宝的黄疸记录列表"""
+    """获取宝宝的黄疸记录列表
+
+    Args:
+        cursor: 上一页最后一条的 (时间, id)，为空表示从头开始；与 skip 同时传入时先按游标定位再跳过
+    """
     query = db.query(JaundiceRecord).filter(JaundiceRecord.baby_id == baby_id)
     
     if start_date:
         query = query.filter(JaundiceRecord.record_date >= start_date)
     if end_date:
         query = query.filter(JaundiceRecord.record_date <= end_date)
+    if cursor:
+        query = query.filter(keyset_condition(JaundiceRecord.record_date, JaundiceRecord.id, cursor))
         
-    return query.order_by(desc(JaundiceRecord.record_date))\
+    return query.order_by(desc(JaundiceRecord.record_date), desc(JaundiceRecord.id))\
         .offset(skip)\
         .limit(limit)\
         .all()
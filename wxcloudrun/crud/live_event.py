@@ -0,0 +1,35 @@
+"""
+实时推送事件 CRUD
+"""
+from datetime import datetime
+from typing import Any
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+from wxcloudrun.models.live_event import LiveEvent
+
+
+def create_live_event(db: Session, baby_id: int, event: str, payload: Any, origin: str) -> int:
+    rec = LiveEvent(baby_id=baby_id, event=event, payload=payload, origin=origin)
+    db.add(rec)
+    db.commit()
+    return rec.id
+
+
+def get_max_live_event_id(db: Session) -> int:
+    return db.execute(select(func.max(LiveEvent.id))).scalar() or 0
+
+
+def get_live_events_after(db: Session, after_id: int, limit: int = 500) -> list[tuple]:
+    """id 大于 after_id 的事件 (id, baby_id, event, payload, origin)，按 id 升序"""
+    return db.execute(
+        select(LiveEvent.id, LiveEvent.baby_id, LiveEvent.event, LiveEvent.payload, LiveEvent.origin)
+        .where(LiveEvent.id > after_id)
+        .order_by(LiveEvent.id)
+        .limit(limit)
+    ).all()
+
+
+def delete_live_events_before(db: Session, before: datetime) -> int:
+    result = db.execute(delete(LiveEvent).where(LiveEvent.created_at < before))
+    db.commit()
+    return result.rowcount
@@ -4,79 +4,21 @@
 from typing import Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
+from sqlalchemy import func
 from wxcloudrun.models.pumping import PumpingRecord
-from wxcloudrun.models.user import User
-from wxcloudrun.models.baby import BabyFamily
+from wxcloudrun.models.daily_summary import BabyDailySummary
 from wxcloudrun.schemas.pumping import PumpingRecordCreate, PumpingRecordUpdate
-from wxcloudrun.schemas.user import CreatorInfo
-
-
-def _attach_creator_info(db: Session, record: PumpingRecord) -> None:
-    """为吸奶记录附加创建者信息"""
-    if not record:
-        return
-
-    user = db.query(User).filter(User.id == record.user_id).first()
-    if not user:
-        record.created_by = None
-        return
-
-    # 查找家庭关系
-    family_with_relation = (
-        db.query(BabyFamily)
-        .filter(
-            BabyFamily.user_id == user.id,
-            BabyFamily.baby_id == record.baby_id,
-            BabyFamily.relation.isnot(None)
-        )
-        .order_by(BabyFamily.id.desc())
-        .first()
-    )
-
-    relation = None
-    relation_display = None
-    if family_with_relation:
-        relation = family_with_relation.relation
-        relation_display = family_with_relation.relation_display
-    else:
-        family_any = (
-            db.query(BabyFamily)
-            .filter(
-                BabyFamily.user_id == user.id,
-                BabyFamily.baby_id == record.baby_id
-            )
-            .order_by(BabyFamily.id.desc())
-            .first()
-        )
-        if family_any:
-            relation = family_any.relation
-            relation_display = family_any.relation_display
-
-    # 关系映射
-    relation_map = {
-        'mom': '妈妈',
-        'dad': '爸爸',
-        'grandpa_p': '爷爷',
-        'grandma_p': '奶奶',
-        'grandpa_m': '外公',
-        'grandma_m': '外婆',
-        'other': '其他'
-    }
-    relation_display = relation_display or relation_map.get(relation, relation)
-
-    record.created_by = CreatorInfo(
-        user_id=user.id,
-        nickname=user.nickname,
-        relation=relation,
-        relation_display=relation_display
-    )
+from wxcloudrun.crud.creator import attach_creator_info
+from wxcloudrun.crud.daily_summary import touch_daily_summary, is_whole_day_range, whole_day_filters
+from wxcloudrun.crud.stats import GroupBy, aggregate_by_period
+from wxcloudrun.utils.pagination import keyset_condition
 
 
 def get_pumping_record(db: Session, record_id: int) -> Optional[PumpingRecord]:
     """根据ID获取吸奶记录"""
     record = db.query(PumpingRecord).filter(PumpingRecord.id == record_id).first()
     if record:
-        _attach_creator_info(db, record)
+        attach_creator_info(db, [record])
     return record
 
 
@@ -87,8 +29,13 @@ def get_pumping_records_by_baby(
     limit: int = 100,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    cursor: Optional[tuple] = None,
 ) -> list[PumpingRecord]:
-    """获取宝宝的吸奶记录"""
+    """获取宝宝的吸奶记录
+
+    Args:
+        cursor: 上一页最后一条的 (时间, id)，为空表示从头开始；与 skip 同时传入时先按游标定位再跳过
+    """
     query = db.query(PumpingRecord).filter(PumpingRecord.baby_id == baby_id)
 
     if start_date:
@@ -96,11 +43,18 @@ def get_pumping_records_by_baby(
     if end_date:
         query = query.filter(PumpingRecord.record_time <= end_date)
 
-    records = query.order_by(PumpingRecord.record_time.desc()).offset(skip).limit(limit).all()
+    if cursor:
+        query = query.filter(keyset_condition(PumpingRecord.record_time, PumpingRecord.id, cursor))
 
-    # 为每条记录附加创建者信息
-    for record in records:
-        _attach_creator_info(db, record)
+    records = (
+        query.order_by(PumpingRecord.record_time.desc(), PumpingRecord.id.desc())
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+
+    # 批量附加创建者信息
+    attach_creator_info(db, records)
 
     return records
 
@@ -109,9 +63,10 @@ def create_pumping_record(db: Session, record: PumpingRecordCreate, user_id: int
     """创建吸奶记录"""
     db_record = PumpingRecord(**record.model_dump(), user_id=user_id)
     db.add(db_record)
+    touch_daily_summary(db, 'pumping', db_record.baby_id, db_record.record_time)
     db.commit()
     db.refresh(db_record)
-    _attach_creator_info(db, db_record)
+    attach_creator_info(db, [db_record])
     return db_record
 
 
@@ -123,13 +78,15 @@ def update_pumping_record(
     if not db_record:
         return None
 
+    old_record_time = db_record.record_time
     update_data = record.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_record, field, value)
 
+    touch_daily_summary(db, 'pumping', db_record.baby_id, old_record_time, db_record.record_time)
     db.commit()
     db.refresh(db_record)
-    _attach_creator_info(db, db_record)
+    attach_creator_info(db, [db_record])
     return db_record
 
 
@@ -140,26 +97,64 @@ def delete_pumping_record(db: Session, record_id: int) -> bool:
         return False
 
     db.delete(db_record)
+    touch_daily_summary(db, 'pumping', db_record.baby_id, db_record.record_time)
     db.commit()
     return True
 
 
+def _pumping_summary(agg: dict) -> dict:
+    return {
+        'count': agg['count'],
+        'total_amount': agg['total_amount'],
+        'left_total': agg['left_total'],
+        'right_total': agg['right_total'],
+        'average_amount': agg['total_amount'] / agg['count'] if agg['count'] > 0 else 0
+    }
+
+
 def get_pumping_stats_by_date(
-    db: Session, baby_id: int, start_date: datetime, end_date: datetime
+    db: Session,
+    baby_id: int,
+    start_date: datetime,
+    end_date: datetime,
+    group_by: Optional[GroupBy] = None,
 ) -> dict:
-    """统计指定日期范围内的吸奶量"""
-    records = get_pumping_records_by_baby(
-        db, baby_id, start_date=start_date, end_date=end_date, limit=1000
-    )
-
-    total_amount = sum(record.total_amount for record in records)
-    left_total = sum(record.left_amount or 0 for record in records)
-    right_total = sum(record.right_amount or 0 for record in records)
+    """统计指定日期范围内的吸奶量
+
+    范围按整天对齐时直接读取每日汇总表，否则在原始记录上聚合。
+    """
+    if is_whole_day_range(start_date, end_date):
+        totals, series = aggregate_by_period(
+            db,
+            metrics=[
+                func.sum(BabyDailySummary.pumping_count).label('count'),
+                func.sum(BabyDailySummary.pumped_ml).label('total_amount'),
+                func.sum(BabyDailySummary.pumped_left_ml).label('left_total'),
+                func.sum(BabyDailySummary.pumped_right_ml).label('right_total'),
+            ],
+            time_col=BabyDailySummary.summary_date,
+            filters=whole_day_filters(baby_id, start_date, end_date),
+            group_by=group_by,
+        )
+    else:
+        totals, series = aggregate_by_period(
+            db,
+            metrics=[
+                func.count(PumpingRecord.id).label('count'),
+                func.sum(PumpingRecord.total_amount).label('total_amount'),
+                func.sum(PumpingRecord.left_amount).label('left_total'),
+                func.sum(PumpingRecord.right_amount).label('right_total'),
+            ],
+            time_col=PumpingRecord.record_time,
+            filters=[
+                PumpingRecord.baby_id == baby_id,
+                PumpingRecord.record_time >= start_date,
+                PumpingRecord.record_time <= end_date,
+            ],
+            group_by=group_by,
+        )
 
-    return {
-        'count': len(records),
-        'total_amount': total_amount,
-        'left_total': left_total,
-        'right_total': right_total,
-        'average_amount': total_amount / len(records) if len(records) > 0 else 0
-    }
+    result = _pumping_summary(totals)
+    if group_by:
+        result['series'] = [{'period': item['period'], **_pumping_summary(item)} for item in series]
+    return result
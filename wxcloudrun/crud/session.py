@@ -3,9 +3,12 @@
 """
 from datetime import datetime, timedelta
 from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 from wxcloudrun.models.session import UserSession
+from wxcloudrun.utils.cache import auth_cache
 logger = logging.getLogger(__name__)
 
 
@@ -58,9 +61,52 @@ def create_or_update_session(
     
     db.commit()
     db.refresh(db_session)
+    auth_cache.pop(openid)
     return db_session
 
 
+async def create_or_update_session_async(
+    db: AsyncSession,
+    user_id: int,
+    openid: str,
+    session_key: str,
+    unionid: Optional[str] = None,
+    expires_days: int = 30
+) -> UserSession:
+    """创建或更新用户会话（异步，参数同 create_or_update_session）"""
+    expires_at = datetime.now() + timedelta(days=expires_days)
+
+    db_session = await get_session_by_openid_async(db, openid)
+
+    if db_session:
+        db_session.user_id = user_id
+        db_session.session_key = session_key
+        db_session.unionid = unionid
+        db_session.expires_at = expires_at
+        logger.info(f"crud.session: update session openid={openid} expires_at={expires_at}")
+    else:
+        db_session = UserSession(
+            user_id=user_id,
+            openid=openid,
+            session_key=session_key,
+            unionid=unionid,
+            expires_at=expires_at
+        )
+        db.add(db_session)
+        logger.info(f"crud.session: create session openid={openid} expires_at={expires_at}")
+
+    await db.commit()
+    await db.refresh(db_session)
+    auth_cache.pop(openid)
+    return db_session
+
+
+async def get_session_by_openid_async(db: AsyncSession, openid: str) -> Optional[UserSession]:
+    """根据 OpenID 获取会话（异步）"""
+    result = await db.execute(select(UserSession).where(UserSession.openid == openid).limit(1))
+    return result.scalars().first()
+
+
 def get_session_by_openid(db: Session, openid: str) -> Optional[UserSession]:
     """
     根据 OpenID 获取会话
@@ -145,6 +191,7 @@ def delete_session_by_openid(db: Session, openid: str) -> bool:
     
     db.delete(db_session)
     db.commit()
+    auth_cache.pop(openid)
     return True
 
 
@@ -178,4 +225,27 @@ def update_session_key(
     
     db.commit()
     db.refresh(db_session)
+    auth_cache.pop(openid)
+    return db_session
+
+
+async def update_session_key_async(
+    db: AsyncSession,
+    openid: str,
+    new_session_key: str,
+    expires_days: int = 30
+) -> Optional[UserSession]:
+    """更新会话密钥并延长过期时间（异步，参数同 update_session_key）"""
+    db_session = await get_session_by_openid_async(db, openid)
+
+    if not db_session:
+        return None
+
+    db_session.session_key = new_session_key
+    db_session.expires_at = datetime.now() + timedelta(days=expires_days)
+    logger.info(f"crud.session: update session_key openid={openid} expires_at={db_session.expires_at}")
+
+    await db.commit()
+    await db.refresh(db_session)
+    auth_cache.pop(openid)
     return db_session
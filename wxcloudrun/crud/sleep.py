@@ -4,90 +4,21 @@
 from typing import Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, case, func
 from wxcloudrun.models.sleep import SleepRecord
-from wxcloudrun.models.user import User
-from wxcloudrun.models.baby import BabyFamily
-from wxcloudrun.schemas.sleep import SleepRecordCreate, SleepRecordUpdate
-from wxcloudrun.schemas.user import CreatorInfo
-
-
-def _attach_creator_info(db: Session, record: SleepRecord) -> None:
-    """给记录附加创建者信息。
-
-    优先获取在该宝宝下非空的关系，找不到则回退。
-    同时生成中文显示名称（relation_display）。
-    """
-    if not record:
-        return
-
-    # 查询用户信息
-    user = db.query(User).filter(User.id == record.user_id).first()
-    if not user:
-        record.created_by = None
-        return
-
-    # 优先获取非空 relation 的家庭成员记录
-    family_with_relation = (
-        db.query(BabyFamily)
-        .filter(
-            BabyFamily.user_id == user.id,
-            BabyFamily.baby_id == record.baby_id,
-            BabyFamily.relation.isnot(None)
-        )
-        .order_by(BabyFamily.id.desc())
-        .first()
-    )
-
-    relation = None
-    relation_display = None
-    if family_with_relation:
-        relation = family_with_relation.relation
-        relation_display = family_with_relation.relation_display
-    else:
-        # 回退：任意一条家庭成员记录（可能 relation 为 NULL）
-        family_any = (
-            db.query(BabyFamily)
-            .filter(
-                BabyFamily.user_id == user.id,
-                BabyFamily.baby_id == record.baby_id
-            )
-            .order_by(BabyFamily.id.desc())
-            .first()
-        )
-        if family_any:
-            relation = family_any.relation
-            relation_display = family_any.relation_display
-        else:
-            relation = None
-            relation_display = None
-
-    # 关系显示映射（同时支持枚举代码和中文原值）
-    relation_map = {
-        'mom': '妈妈',
-        'dad': '爸爸',
-        'grandpa_p': '爷爷',
-        'grandma_p': '奶奶',
-        'grandpa_m': '外公',
-        'grandma_m': '外婆',
-        'other': '其他'
-    }
-    # 如果数据库中没有显示名称，则根据枚举映射生成中文显示
-    relation_display = relation_display or relation_map.get(relation, relation)
-
-    record.created_by = CreatorInfo(
-        user_id=user.id,
-        nickname=user.nickname,
-        relation=relation,
-        relation_display=relation_display
-    )
+from wxcloudrun.models.daily_summary import BabyDailySummary
+from wxcloudrun.schemas.sleep import SleepRecordCreate, SleepRecordUpdate, SleepRecordResponse
+from wxcloudrun.crud.creator import attach_creator_info
+from wxcloudrun.crud.daily_summary import touch_daily_summary, is_whole_day_range, whole_day_filters
+from wxcloudrun.crud.stats import GroupBy, aggregate_by_period
+from wxcloudrun.utils.pagination import keyset_condition
 
 
 def get_sleep_record(db: Session, record_id: int) -> Optional[SleepRecord]:
     """根据ID获取睡眠记录"""
     record = db.query(SleepRecord).filter(SleepRecord.id == record_id).first()
     if record:
-        _attach_creator_info(db, record)
+        attach_creator_info(db, [record])
     return record
 
 
@@ -99,9 +30,14 @@ def get_sleep_records_by_baby(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     sort_by: str = "start_time",
-    order: str = "desc"
+    order: str = "desc",
+    cursor: Optional[tuple] = None,
 ) -> list[SleepRecord]:
-    """获取宝宝的睡眠记录"""
+    """获取宝宝的睡眠记录
+
+    Args:
+        cursor: 上一页最后一条的 (排序字段值, id)，为空表示从头开始；与 skip 同时传入时先按游标定位再跳过
+    """
     query = db.query(SleepRecord).filter(SleepRecord.baby_id == baby_id)
 
     if start_date:
@@ -111,7 +47,13 @@ def get_sleep_records_by_baby(
 
     # 动态排序
     sort_column = getattr(SleepRecord, sort_by, SleepRecord.start_time)
-    query = query.order_by(sort_column.desc() if order == "desc" else sort_column.asc())
+    if cursor:
+        query = query.filter(keyset_condition(sort_column, SleepRecord.id, cursor, descending=order == "desc"))
+    # 以 id 作为同一时间的次级排序，保证游标分页稳定
+    if order == "desc":
+        query = query.order_by(sort_column.desc(), SleepRecord.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), SleepRecord.id.asc())
 
     query = query.offset(skip)
     if limit:
@@ -119,14 +61,14 @@ def get_sleep_records_by_baby(
 
     records = query.all()
 
-    # 为每条记录附加创建者信息
-    for record in records:
-        _attach_creator_info(db, record)
+    # 批量附加创建者信息
+    attach_creator_info(db, records)
 
     return records
 
 
-def create_sleep_record(db: Session, record: SleepRecordCreate, user_id: int) -> SleepRecord:
+def create_payload(record: SleepRecordCreate) -> dict:
+    """创建睡眠记录时写入的字段（有结束时间时计算时长并标记为已完成）"""
     payload = record.model_dump()
     if payload.get('end_time'):
         start = payload['start_time']
@@ -136,8 +78,13 @@ def create_sleep_record(db: Session, record: SleepRecordCreate, user_id: int) ->
         payload['status'] = 'completed'
     else:
         payload['status'] = 'in_progress'
-    db_record = SleepRecord(**payload, user_id=user_id)
+    return payload
+
+
+def create_sleep_record(db: Session, record: SleepRecordCreate, user_id: int) -> SleepRecord:
+    db_record = SleepRecord(**create_payload(record), user_id=user_id)
     db.add(db_record)
+    touch_daily_summary(db, 'sleep', db_record.baby_id, db_record.start_time)
     db.commit()
     db.refresh(db_record)
     return db_record
@@ -150,10 +97,12 @@ def update_sleep_record(
     if not db_record:
         return None
 
+    old_start_time = db_record.start_time
     update_data = record.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_record, field, value)
 
+    touch_daily_summary(db, 'sleep', db_record.baby_id, old_start_time, db_record.start_time)
     db.commit()
     db.refresh(db_record)
     return db_record
@@ -166,33 +115,69 @@ def delete_sleep_record(db: Session, record_id: int) -> bool:
         return False
 
     db.delete(db_record)
+    touch_daily_summary(db, 'sleep', db_record.baby_id, db_record.start_time)
     db.commit()
     return True
 
 
-def get_sleep_stats_by_date(db: Session, baby_id: int, start_date: datetime, end_date: datetime) -> dict:
-    records = get_sleep_records_by_baby(db, baby_id, start_date=start_date, end_date=end_date, limit=1000)
-
-    total_duration = 0
-    total_wake_count = 0
-
-    for record in records:
-        if getattr(record, 'status', 'completed') != 'completed':
-            continue
-        if record.duration:
-            total_duration += record.duration
-        total_wake_count += record.wake_count or 0
-
+def _sleep_summary(agg: dict) -> dict:
+    total_duration = agg['total_duration_minutes']
     return {
-        'total_records': len(records),
+        'total_records': agg['total_records'],
         'total_duration_minutes': total_duration,
         'total_duration_hours': round(total_duration / 60, 2) if total_duration > 0 else 0,
-        'average_duration_minutes': round(total_duration / max(1, total_records_completed(records)), 2),
-        'total_wake_count': total_wake_count,
+        'average_duration_minutes': round(total_duration / max(1, agg['completed_records']), 2),
+        'total_wake_count': agg['total_wake_count'],
     }
 
-def total_records_completed(records: list[SleepRecord]) -> int:
-    return sum(1 for r in records if getattr(r, 'status', 'completed') == 'completed')
+
+def get_sleep_stats_by_date(
+    db: Session,
+    baby_id: int,
+    start_date: datetime,
+    end_date: datetime,
+    group_by: Optional[GroupBy] = None,
+) -> dict:
+    """统计指定日期范围内的睡眠（仅已完成的记录计入时长与夜醒次数）
+
+    范围按整天对齐时直接读取每日汇总表，否则在原始记录上聚合。
+    """
+    if is_whole_day_range(start_date, end_date):
+        totals, series = aggregate_by_period(
+            db,
+            metrics=[
+                func.sum(BabyDailySummary.sleep_count).label('total_records'),
+                func.sum(BabyDailySummary.sleep_completed_count).label('completed_records'),
+                func.sum(BabyDailySummary.sleep_minutes).label('total_duration_minutes'),
+                func.sum(BabyDailySummary.wake_count).label('total_wake_count'),
+            ],
+            time_col=BabyDailySummary.summary_date,
+            filters=whole_day_filters(baby_id, start_date, end_date),
+            group_by=group_by,
+        )
+    else:
+        completed = SleepRecord.status == 'completed'
+        totals, series = aggregate_by_period(
+            db,
+            metrics=[
+                func.count(SleepRecord.id).label('total_records'),
+                func.sum(case((completed, 1), else_=0)).label('completed_records'),
+                func.sum(case((completed, SleepRecord.duration), else_=0)).label('total_duration_minutes'),
+                func.sum(case((completed, SleepRecord.wake_count), else_=0)).label('total_wake_count'),
+            ],
+            time_col=SleepRecord.start_time,
+            filters=[
+                SleepRecord.baby_id == baby_id,
+                SleepRecord.start_time >= start_date,
+                SleepRecord.start_time <= end_date,
+            ],
+            group_by=group_by,
+        )
+
+    result = _sleep_summary(totals)
+    if group_by:
+        result['series'] = [{'period': item['period'], **_sleep_summary(item)} for item in series]
+    return result
 
 
 def create_sleep_start(db: Session, baby_id: int, start_time: datetime, user_id: int, source: str = 'manual', position: Optional[str] = None) -> SleepRecord:
@@ -206,6 +191,7 @@ def create_sleep_start(db: Session, baby_id: int, start_time: datetime, user_id:
         wake_count=0
     )
     db.add(db_record)
+    touch_daily_summary(db, 'sleep', baby_id, start_time)
     db.commit()
     db.refresh(db_record)
     return db_record
@@ -222,6 +208,7 @@ def stop_sleep_record(db: Session, record_id: int, end_time: datetime) -> Option
     dur = int((end_time - db_record.start_time).total_seconds() // 60)
     db_record.duration = dur if dur >= 0 else None
     db_record.status = 'completed'
+    touch_daily_summary(db, 'sleep', db_record.baby_id, db_record.start_time)
     db.commit()
     db.refresh(db_record)
     return db_record
@@ -234,6 +221,7 @@ def auto_close_sleep_record(db: Session, record_id: int, auto_closed_at: datetim
         return db_record
     db_record.auto_closed_at = auto_closed_at
     db_record.status = 'auto_closed'
+    touch_daily_summary(db, 'sleep', db_record.baby_id, db_record.start_time)
     db.commit()
     db.refresh(db_record)
     return db_record
@@ -244,5 +232,13 @@ def get_active_sleep_records_by_baby(db: Session, baby_id: int) -> Optional[Slee
         SleepRecord.status == 'in_progress'
     ).order_by(SleepRecord.start_time.desc()).first()
     if record:
-        _attach_creator_info(db, record)
+        attach_creator_info(db, [record])
     return record
+
+
+def get_active_sleep_state(db: Session, baby_id: int) -> Optional[dict]:
+    """宝宝进行中的睡眠（实时推送 / 快照使用的 JSON 数据）；没有时返回 None"""
+    record = get_active_sleep_records_by_baby(db, baby_id)
+    if record is None:
+        return None
+    return SleepRecordResponse.model_validate(record, from_attributes=True).model_dump(mode="json")
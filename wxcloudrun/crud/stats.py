@@ -0,0 +1,64 @@
+"""
+统计查询的公共工具
+
+统计接口在数据库端完成 GROUP BY / SUM / COUNT，只返回标量或按时间分桶的序列，
+不再把原始记录加载到 Python 中累加。
+"""
+from typing import Literal, Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+
+GroupBy = Literal['day', 'week', 'month']
+
+
+def time_bucket(time_col, group_by: GroupBy):
+    """按日/周（周一为起点）/月分桶的 SQL 表达式，结果为字符串"""
+    if group_by == 'day':
+        return func.date_format(time_col, '%Y-%m-%d')
+    if group_by == 'week':
+        return func.date_format(func.subdate(time_col, func.weekday(time_col)), '%Y-%m-%d')
+    if group_by == 'month':
+        return func.date_format(time_col, '%Y-%m')
+    raise ValueError(f"不支持的分组方式: {group_by}")
+
+
+def aggregate_by_period(
+    db: Session,
+    metrics: list,
+    time_col,
+    filters: list,
+    group_by: Optional[GroupBy] = None,
+) -> tuple[dict, list[dict]]:
+    """执行聚合查询（单条 SQL）
+
+    Args:
+        metrics: 带 label 的可累加聚合表达式（SUM/COUNT）
+        time_col: 用于分桶的时间字段
+        filters: 过滤条件
+        group_by: 为空时只返回合计；否则同时返回按时间分桶的序列
+
+    Returns:
+        (合计, 序列)；序列元素包含 period 与各指标
+    """
+    names = [m.name for m in metrics]
+
+    if not group_by:
+        row = db.query(*metrics).filter(*filters).one()
+        return {name: int(row._mapping[name] or 0) for name in names}, []
+
+    bucket = time_bucket(time_col, group_by).label('period')
+    rows = (
+        db.query(bucket, *metrics)
+        .filter(*filters)
+        .group_by(bucket)
+        .order_by(bucket)
+        .all()
+    )
+    series = [
+        {'period': row.period, **{name: int(row._mapping[name] or 0) for name in names}}
+        for row in rows
+    ]
+    # 指标均可累加，合计由分桶结果汇总，无需再次查询
+    totals = {name: sum(item[name] for item in series) for name in names}
+    return totals, series
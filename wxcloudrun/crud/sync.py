@@ -0,0 +1,173 @@
+"""
+离线批量同步相关的 CRUD 操作
+
+小程序在弱网下把记录先存入本地队列，恢复网络后一次上传。整批操作：
+    1. 逐条按对应类型的创建/更新 Schema 校验，校验失败的条目单独返回 invalid，不影响其他条目
+    2. 每种类型的新建记录用一条多行 INSERT 写入；更新的记录每种类型一次查询取回后修改
+    3. 每日汇总按类型只重算一次受影响的日期，整批在同一事务中提交
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Optional
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
+from wxcloudrun.models.feeding import FeedingRecord
+from wxcloudrun.models.diaper import DiaperRecord
+from wxcloudrun.models.sleep import SleepRecord
+from wxcloudrun.models.growth import GrowthRecord
+from wxcloudrun.models.pumping import PumpingRecord
+from wxcloudrun.models.jaundice import JaundiceRecord
+from wxcloudrun.schemas.feeding import FeedingRecordCreate, FeedingRecordUpdate
+from wxcloudrun.schemas.diaper import DiaperRecordCreate, DiaperRecordUpdate
+from wxcloudrun.schemas.sleep import SleepRecordCreate, SleepRecordUpdate
+from wxcloudrun.schemas.growth import GrowthRecordCreate, GrowthRecordUpdate
+from wxcloudrun.schemas.pumping import PumpingRecordCreate, PumpingRecordUpdate
+from wxcloudrun.schemas.jaundice import JaundiceRecordCreate, JaundiceRecordUpdate
+from wxcloudrun.schemas.sync import SyncItem, SyncItemResult
+from wxcloudrun.crud import feeding as feeding_crud
+from wxcloudrun.crud import sleep as sleep_crud
+from wxcloudrun.crud.daily_summary import touch_daily_summary
+
+
+def _create_dump(record: BaseModel) -> dict:
+    return record.model_dump()
+
+
+def _update_dump(record: BaseModel) -> dict:
+    return record.model_dump(exclude_unset=True)
+
+
+@dataclass(frozen=True)
+class SyncType:
+    """一种可批量同步的记录类型"""
+    model: type
+    create_schema: type[BaseModel]
+    update_schema: type[BaseModel]
+    time_field: str
+    # 每日汇总来源（touch_daily_summary 的 kind），不参与汇总的类型为 None
+    summary: Optional[str] = None
+    create_payload: Callable[[BaseModel], dict] = _create_dump
+    update_payload: Callable[[BaseModel], dict] = _update_dump
+
+
+SYNC_TYPES: dict[str, SyncType] = {
+    'feeding': SyncType(FeedingRecord, FeedingRecordCreate, FeedingRecordUpdate, 'start_time', 'feeding',
+                        feeding_crud.create_payload, feeding_crud.update_payload),
+    'diaper': SyncType(DiaperRecord, DiaperRecordCreate, DiaperRecordUpdate, 'record_time', 'diaper'),
+    'sleep': SyncType(SleepRecord, SleepRecordCreate, SleepRecordUpdate, 'start_time', 'sleep',
+                      sleep_crud.create_payload),
+    'growth': SyncType(GrowthRecord, GrowthRecordCreate, GrowthRecordUpdate, 'record_date'),
+    'pumping': SyncType(PumpingRecord, PumpingRecordCreate, PumpingRecordUpdate, 'record_time', 'pumping'),
+    'jaundice': SyncType(JaundiceRecord, JaundiceRecordCreate, JaundiceRecordUpdate, 'record_date'),
+}
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" if e['loc'] else e['msg']
+        for e in error.errors()
+    )
+
+
+def _auto_increment_step(db: Session) -> int:
+    """自增步长（MySQL 的 auto_increment_increment，其他数据库为 1）"""
+    if db.get_bind().dialect.name != 'mysql':
+        return 1
+    return db.execute(text("SELECT @@auto_increment_increment")).scalar()
+
+
+def _insert_rows(db: Session, model: type, rows: list[dict], step: int) -> list[int]:
+    """
+    用一条多行 INSERT 写入，返回各行的自增 ID
+
+    单条 INSERT 的行数预先确定（InnoDB 的 simple insert），分配的自增 ID 按步长连续：
+    MySQL 的 LAST_INSERT_ID 为第一行的 ID，SQLite 的 lastrowid 为最后一行的 ID
+    """
+    # 各行字段须一致，缺少的字段写入 NULL
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    values = [{column: row.get(column) for column in columns} for row in rows]
+    row_id = db.execute(insert(model.__table__).values(values)).lastrowid
+    first_id = row_id if db.get_bind().dialect.name == 'mysql' else row_id - (len(rows) - 1) * step
+    return [first_id + i * step for i in range(len(rows))]
+
+
+def apply_sync_batch(db: Session, baby_id: int, user_id: int, items: list[SyncItem]) -> list[SyncItemResult]:
+    """批量写入离线队列中的记录（调用方已校验宝宝访问权限），返回与 items 一一对应的结果"""
+    results: list[Optional[SyncItemResult]] = [None] * len(items)
+    creates: dict[str, list[tuple[int, dict]]] = {}
+    updates: dict[str, list[tuple[int, int, dict]]] = {}
+
+    def fail(index: int, status: str, error: str) -> None:
+        item = items[index]
+        results[index] = SyncItemResult(client_id=item.client_id, type=item.type, op=item.op, status=status, error=error)
+
+    # 1. 校验
+    for index, item in enumerate(items):
+        sync_type = SYNC_TYPES[item.type]
+        try:
+            if item.op == 'create':
+                record = sync_type.create_schema.model_validate({**item.data, 'baby_id': baby_id})
+                payload = sync_type.create_payload(record)
+                payload['user_id'] = user_id
+                creates.setdefault(item.type, []).append((index, payload))
+            elif item.record_id is None:
+                fail(index, 'invalid', "更新操作必须提供 record_id")
+            else:
+                record = sync_type.update_schema.model_validate(item.data)
+                updates.setdefault(item.type, []).append((index, item.record_id, sync_type.update_payload(record)))
+        except ValidationError as e:
+            fail(index, 'invalid', _validation_message(e))
+        except ValueError as e:
+            fail(index, 'invalid', str(e))
+
+    # 受影响的汇总日期：kind -> 归属时间
+    touched: dict[str, list[datetime]] = {}
+
+    # 2. 新建：每种类型一条 INSERT
+    step = _auto_increment_step(db) if creates else 1
+    for type_name, entries in creates.items():
+        sync_type = SYNC_TYPES[type_name]
+        ids = _insert_rows(db, sync_type.model, [payload for _, payload in entries], step)
+        for (index, payload), record_id in zip(entries, ids):
+            item = items[index]
+            results[index] = SyncItemResult(
+                client_id=item.client_id, type=item.type, op=item.op, status='created', id=record_id
+            )
+            if sync_type.summary:
+                touched.setdefault(sync_type.summary, []).append(payload[sync_type.time_field])
+
+    # 3. 更新：每种类型一次查询取回本宝宝的目标记录
+    for type_name, entries in updates.items():
+        sync_type = SYNC_TYPES[type_name]
+        model = sync_type.model
+        record_ids = {record_id for _, record_id, _ in entries}
+        records = {
+            r.id: r for r in db.query(model).filter(model.id.in_(record_ids), model.baby_id == baby_id).all()
+        }
+        for index, record_id, changes in entries:
+            db_record = records.get(record_id)
+            if db_record is None:
+                fail(index, 'not_found', "记录不存在")
+                continue
+            old_time = getattr(db_record, sync_type.time_field)
+            for field, value in changes.items():
+                setattr(db_record, field, value)
+            if type_name == 'feeding' and 'start_time' not in changes:
+                # 强制写回 start_time，避免数据库自动更新时间覆盖（同 update_feeding_record）
+                flag_modified(db_record, 'start_time')
+            item = items[index]
+            results[index] = SyncItemResult(
+                client_id=item.client_id, type=item.type, op=item.op, status='updated', id=record_id
+            )
+            if sync_type.summary:
+                touched.setdefault(sync_type.summary, []).extend(
+                    [old_time, getattr(db_record, sync_type.time_field)]
+                )
+
+    # 4. 每日汇总按类型重算一次（touch_daily_summary 会先 flush 上面的更新），整批一次提交
+    for kind, times in touched.items():
+        touch_daily_summary(db, kind, baby_id, *times)
+    db.commit()
+    return results
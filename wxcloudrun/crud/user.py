@@ -2,9 +2,12 @@
 用户相关的 CRUD 操作
 """
 from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 from wxcloudrun.models.user import User
+from wxcloudrun.utils.cache import auth_cache
 logger = logging.getLogger(__name__)
 from wxcloudrun.schemas.user import UserCreate, UserUpdate
 
@@ -19,6 +22,17 @@ def get_user_by_openid(db: Session, openid: str) -> Optional[User]:
     return db.query(User).filter(User.openid == openid).first()
 
 
+async def get_user_async(db: AsyncSession, user_id: int) -> Optional[User]:
+    """根据ID获取用户（异步）"""
+    return await db.get(User, user_id)
+
+
+async def get_user_by_openid_async(db: AsyncSession, openid: str) -> Optional[User]:
+    """根据OpenID获取用户（异步）"""
+    result = await db.execute(select(User).where(User.openid == openid).limit(1))
+    return result.scalars().first()
+
+
 def get_users(db: Session, skip: int = 0, limit: int = 100) -> list[User]:
     """获取用户列表"""
     return db.query(User).offset(skip).limit(limit).all()
@@ -34,6 +48,16 @@ def create_user(db: Session, user: UserCreate) -> User:
     return db_user
 
 
+async def create_user_async(db: AsyncSession, user: UserCreate) -> User:
+    """创建用户（异步）"""
+    db_user = User(**user.model_dump())
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    logger.info(f"crud.user: create user id={db_user.id} openid={db_user.openid}")
+    return db_user
+
+
 def update_user(db: Session, user_id: int, user: UserUpdate) -> Optional[User]:
     """更新用户信息"""
     db_user = get_user(db, user_id)
@@ -59,5 +83,6 @@ def delete_user(db: Session, user_id: int) -> bool:
 
     db.delete(db_user)
     db.commit()
+    auth_cache.pop(db_user.openid)
     logger.info(f"crud.user: delete user id={db_user.id}")
     return True
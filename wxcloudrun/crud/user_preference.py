@@ -1,5 +1,7 @@
 """用户偏好设置的 CRUD 操作"""
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, Dict, Any, List
 from wxcloudrun.models.user_preference import UserPreference
 from wxcloudrun.schemas.user_preference import UserPreferenceCreate, UserPreferenceUpdate
@@ -92,3 +94,66 @@ def delete_all_preferences(
     ).delete()
     db.commit()
     return count
+
+
+async def get_preference_async(
+    db: AsyncSession,
+    user_id: int,
+    preference_key: str
+) -> Optional[UserPreference]:
+    """获取用户的特定偏好设置（异步）"""
+    result = await db.execute(
+        select(UserPreference).where(
+            UserPreference.user_id == user_id,
+            UserPreference.preference_key == preference_key
+        ).limit(1)
+    )
+    return result.scalars().first()
+
+
+async def get_preferences_dict_async(
+    db: AsyncSession,
+    user_id: int
+) -> Dict[str, Any]:
+    """获取用户的所有偏好设置，返回字典格式（异步）"""
+    result = await db.execute(
+        select(UserPreference.preference_key, UserPreference.preference_value)
+        .where(UserPreference.user_id == user_id)
+    )
+    return {key: value for key, value in result.all()}
+
+
+async def set_preference_async(
+    db: AsyncSession,
+    user_id: int,
+    preference_key: str,
+    preference_value: Any
+) -> UserPreference:
+    """设置用户的偏好设置（创建或更新，异步）"""
+    preference = await get_preference_async(db, user_id, preference_key)
+    if preference:
+        preference.preference_value = preference_value
+    else:
+        preference = UserPreference(
+            user_id=user_id,
+            preference_key=preference_key,
+            preference_value=preference_value
+        )
+        db.add(preference)
+    await db.commit()
+    await db.refresh(preference)
+    return preference
+
+
+async def delete_preference_async(
+    db: AsyncSession,
+    user_id: int,
+    preference_key: str
+) -> bool:
+    """删除用户的特定偏好设置（异步）"""
+    preference = await get_preference_async(db, user_id, preference_key)
+    if preference:
+        await db.delete(preference)
+        await db.commit()
+        return True
+    return False
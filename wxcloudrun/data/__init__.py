@@ -0,0 +1,3 @@
+"""
+内置基础数据
+"""
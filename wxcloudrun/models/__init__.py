@@ -14,6 +14,8 @@ from .invitation import Invitation
 from .wechat_token import WeChatAccessToken
 from .vaccine import Vaccine, VaccinationRecord
 from .vaccine_config import VaccineConfig
+from .daily_summary import BabyDailySummary
+from .live_event import LiveEvent
 
 __all__ = [
     "Base",
@@ -29,5 +31,7 @@ __all__ = [
     "JaundiceRecord",
     "Vaccine",
     "VaccinationRecord",
-    "VaccineConfig"
+    "VaccineConfig",
+    "BabyDailySummary",
+    "LiveEvent"
 ]
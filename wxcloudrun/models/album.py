@@ -1,14 +1,19 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, func
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, func
 from wxcloudrun.models import Base
 
 class AlbumRecord(Base):
     __tablename__ = 'album_records'
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    baby_id = Column(Integer, nullable=False, index=True)
+    baby_id = Column(Integer, nullable=False)
     user_id = Column(Integer, nullable=False, index=True)
     file_id = Column(String(255), nullable=False)
     media_type = Column(String(20), nullable=False, default='image')
     description = Column(Text, nullable=True)
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+
+    # 列表按 (baby_id, created_at) 排序分页
+    __table_args__ = (
+        Index('idx_baby_created_at', 'baby_id', 'created_at'),
+    )
@@ -115,4 +115,6 @@ class BabyFamily(Base):
     # 联合索引
     __table_args__ = (
         Index('idx_baby_user', 'baby_id', 'user_id'),
+        # 批量附加创建者信息：按 (user_id, baby_id) 过滤并取关系字段，覆盖索引无需回表（InnoDB 二级索引自带主键 id）
+        Index('idx_user_baby_relation', 'user_id', 'baby_id', 'relation', 'relation_display'),
     )
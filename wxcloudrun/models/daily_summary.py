@@ -0,0 +1,44 @@
+"""
+宝宝每日汇总模型
+"""
+from sqlalchemy import Column, Integer, Date, TIMESTAMP, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from wxcloudrun.core.database import Base
+
+
+class BabyDailySummary(Base):
+    """宝宝每日汇总表（由各记录的增删改增量维护，可通过 scripts/rebuild_daily_summary.py 重建）"""
+    __tablename__ = 'baby_daily_summary'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    baby_id = Column(Integer, ForeignKey('babies.id', ondelete='CASCADE'), nullable=False, comment='宝宝ID')
+    summary_date = Column(Date, nullable=False, comment='日期')
+
+    # 喂养（按 start_time 归属日期）
+    feed_count = Column(Integer, nullable=False, default=0, server_default='0', comment='喂养次数')
+    breast_left_seconds = Column(Integer, nullable=False, default=0, server_default='0', comment='母乳左侧时长(秒)')
+    breast_right_seconds = Column(Integer, nullable=False, default=0, server_default='0', comment='母乳右侧时长(秒)')
+    bottle_ml = Column(Integer, nullable=False, default=0, server_default='0', comment='奶瓶奶量(ml)')
+
+    # 睡眠（按 start_time 归属日期，时长与夜醒仅统计已完成记录）
+    sleep_count = Column(Integer, nullable=False, default=0, server_default='0', comment='睡眠记录数')
+    sleep_completed_count = Column(Integer, nullable=False, default=0, server_default='0', comment='已完成睡眠记录数')
+    sleep_minutes = Column(Integer, nullable=False, default=0, server_default='0', comment='睡眠时长(分钟)')
+    wake_count = Column(Integer, nullable=False, default=0, server_default='0', comment='夜醒次数')
+
+    # 排便/排尿（按 record_time 归属日期）
+    pee_count = Column(Integer, nullable=False, default=0, server_default='0', comment='仅排尿次数')
+    poop_count = Column(Integer, nullable=False, default=0, server_default='0', comment='仅排便次数')
+    both_count = Column(Integer, nullable=False, default=0, server_default='0', comment='排尿+排便次数')
+
+    # 吸奶（按 record_time 归属日期）
+    pumping_count = Column(Integer, nullable=False, default=0, server_default='0', comment='吸奶次数')
+    pumped_ml = Column(Integer, nullable=False, default=0, server_default='0', comment='吸奶总量(ml)')
+    pumped_left_ml = Column(Integer, nullable=False, default=0, server_default='0', comment='左侧吸奶量(ml)')
+    pumped_right_ml = Column(Integer, nullable=False, default=0, server_default='0', comment='右侧吸奶量(ml)')
+
+    updated_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), onupdate=func.now(), comment='更新时间')
+
+    __table_args__ = (
+        UniqueConstraint('baby_id', 'summary_date', name='uk_baby_date'),
+    )
@@ -1,11 +1,18 @@
 """
 喂养记录模型
 """
-from sqlalchemy import Column, Integer, String, TIMESTAMP, Text, Enum, ForeignKey, Index
+from sqlalchemy import Column, Integer, SmallInteger, String, TIMESTAMP, Text, JSON, Enum, ForeignKey, Index, Computed
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from wxcloudrun.core.database import Base
 
+# 兼容 MySQL 5.7（不支持 $[last] 路径）；不是数组时（JSON null 等）为 NULL
+SEQUENCE_COUNT_SQL = "CASE WHEN JSON_TYPE(feeding_sequence) = 'ARRAY' THEN JSON_LENGTH(feeding_sequence) END"
+SEQUENCE_LAST_SIDE_SQL = (
+    "CASE WHEN JSON_TYPE(feeding_sequence) = 'ARRAY' AND JSON_LENGTH(feeding_sequence) > 0 THEN "
+    "JSON_UNQUOTE(JSON_EXTRACT(feeding_sequence, CONCAT('$[', JSON_LENGTH(feeding_sequence) - 1, '].side'))) END"
+)
+
 
 class FeedingRecord(Base):
     """喂养记录表"""
@@ -23,7 +30,19 @@ class FeedingRecord(Base):
     )
 
     # 母乳喂养字段
-    feeding_sequence = Column(Text, comment='喂养序列JSON(母乳交替记录)')
+    # none_as_null：None 存为 SQL NULL 而不是 JSON null
+    feeding_sequence = Column(JSON(none_as_null=True), comment='喂养序列(母乳交替记录)')
+    # 由数据库根据 feeding_sequence 计算的生成列，查询最后一侧/分段数时无需解析 JSON
+    sequence_last_side = Column(
+        String(8),
+        Computed(SEQUENCE_LAST_SIDE_SQL, persisted=True),
+        comment='喂养序列最后一段的侧别(生成列)'
+    )
+    sequence_count = Column(
+        SmallInteger,
+        Computed(SEQUENCE_COUNT_SQL, persisted=True),
+        comment='喂养序列分段数(生成列)'
+    )
     breast_side = Column(
         Enum('left', 'right', 'both', 'unknown', name='breast_side_enum'),
         comment='哺乳侧(用于快速记录模式)'
@@ -1,7 +1,7 @@
 """
 正在进行的喂养记录模型
 """
-from sqlalchemy import Column, Integer, TIMESTAMP, Enum, ForeignKey
+from sqlalchemy import Column, BigInteger, Integer, TIMESTAMP, Enum, ForeignKey, Index
 from sqlalchemy.sql import func
 from wxcloudrun.core.database import Base
 
@@ -17,11 +17,28 @@ class FeedingOngoing(Base):
         Enum('left', 'right', 'paused', name='ongoing_side_enum'),
         nullable=False,
         default='paused',
-        comment='当前状态'
+        comment='开始计时时的状态（之后的切换记录在分段表中）'
     )
-    last_action_time = Column(TIMESTAMP, nullable=False, server_default=func.now(), comment='最后一次操作时间')
+    last_action_time = Column(TIMESTAMP, nullable=False, server_default=func.now(), comment='开始计时时的操作时间')
     
-    accumulated_left = Column(Integer, nullable=False, default=0, comment='左侧累计时长(秒)')
-    accumulated_right = Column(Integer, nullable=False, default=0, comment='右侧累计时长(秒)')
+    accumulated_left = Column(Integer, nullable=False, default=0, comment='左侧初始累计时长(秒)')
+    accumulated_right = Column(Integer, nullable=False, default=0, comment='右侧初始累计时长(秒)')
+    version = Column(Integer, nullable=False, default=0, server_default='0', comment='初始版本号（当前版本号 = 该值 + 分段数）')
     
     updated_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), onupdate=func.now(), comment='更新时间')
+
+
+class FeedingOngoingSegment(Base):
+    """母乳计时分段表（每次切换左右侧/暂停追加一行，结束计时后删除）"""
+    __tablename__ = 'feeding_ongoing_segments'
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    ongoing_id = Column(Integer, nullable=False, comment='所属计时ID')
+    baby_id = Column(Integer, ForeignKey('babies.id', ondelete='CASCADE'), nullable=False, comment='宝宝ID')
+    side = Column(Enum('left', 'right', 'paused', name='ongoing_segment_side_enum'), nullable=False, comment='切换后的状态')
+    action_time = Column(TIMESTAMP, nullable=False, comment='操作时间')
+
+    __table_args__ = (
+        Index('idx_ongoing_time', 'ongoing_id', 'action_time'),
+        Index('idx_baby', 'baby_id'),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, TIMESTAMP, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, TIMESTAMP, Enum, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from wxcloudrun.core.database import Base
@@ -17,4 +17,9 @@ class Invitation(Base):
     used_at = Column(TIMESTAMP, nullable=True)
     created_at = Column(TIMESTAMP, nullable=False, server_default=func.now())
 
-    baby = relationship('Baby')
\ No newline at end of file
+    baby = relationship('Baby')
+
+    # 查询宝宝当前有效的邀请码
+    __table_args__ = (
+        Index('idx_baby_status_expire', 'baby_id', 'status', 'expire_at'),
+    )
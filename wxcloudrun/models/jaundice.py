@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, DECIMAL, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, DECIMAL, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from wxcloudrun.core.database import Base
@@ -19,3 +19,8 @@ class JaundiceRecord(Base):
 
     # 关联
     created_by = relationship("User", foreign_keys=[user_id])
+
+    # 索引
+    __table_args__ = (
+        Index('idx_baby_record_date', 'baby_id', 'record_date'),
+    )
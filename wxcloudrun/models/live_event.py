@@ -0,0 +1,22 @@
+"""
+实时推送事件模型
+"""
+from sqlalchemy import Column, BigInteger, Integer, String, TIMESTAMP, JSON, Index
+from sqlalchemy.sql import func
+from wxcloudrun.core.database import Base
+
+
+class LiveEvent(Base):
+    """实时推送事件表（跨工作进程广播用的短期日志，定期清理）"""
+    __tablename__ = 'live_events'
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    baby_id = Column(Integer, nullable=False, comment='宝宝ID')
+    event = Column(String(32), nullable=False, comment='事件类型')
+    payload = Column(JSON, nullable=True, comment='事件数据')
+    origin = Column(String(64), nullable=False, comment='发布事件的进程标识')
+    created_at = Column(TIMESTAMP, nullable=False, server_default=func.now(), comment='创建时间')
+
+    __table_args__ = (
+        Index('idx_created_at', 'created_at'),
+    )
@@ -50,4 +50,6 @@ class SleepRecord(Base):
     # 索引
     __table_args__ = (
         Index('idx_baby_start_time', 'baby_id', 'start_time'),
+        # 查询进行中的睡眠（按入睡时间取最新）
+        Index('idx_baby_status_start_time', 'baby_id', 'status', 'start_time'),
     )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from wxcloudrun.core.database import Base
 
@@ -40,3 +40,8 @@ class VaccinationRecord(Base):
     
     # 关联
     vaccine = relationship("Vaccine")
+
+    # 索引
+    __table_args__ = (
+        Index('idx_baby_vaccine', 'baby_id', 'vaccine_id'),
+    )
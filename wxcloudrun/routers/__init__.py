@@ -1,28 +1,35 @@
 """
 API 路由模块
-"""
-from .auth import router as auth_router
-from .users import router as users_router
-from .babies import router as babies_router
-from .feeding import router as feeding_router
-from .diaper import router as diaper_router
-from .sleep import router as sleep_router
-from .growth import router as growth_router
-from .pumping import router as pumping_router
-from .invitations import router as invitations_router
-from .policies import router as policies_router
-from .home import router as home_router
-
-from .feeding_ongoing import router as feeding_ongoing_router
 
-from .jaundice import router as jaundice_router
+路由模块在首次被访问时才导入（见 wxcloudrun.core.lazy_routers），
+ROUTER_MODULES 登记了每个模块负责的路径前缀，顺序即注册顺序。
+"""
+import importlib
 
-from .user_preference import router as user_preference_router
-from .notifications import router as notifications_router
-from .vaccines import router as vaccines_router
-from .album import router as album_router
+ROUTER_MODULES: dict[str, tuple[str, ...]] = {
+    "wxcloudrun.routers.auth": ("/api/auth",),
+    "wxcloudrun.routers.users": ("/api/users",),
+    "wxcloudrun.routers.babies": ("/api/babies",),
+    "wxcloudrun.routers.feeding": ("/api/feeding",),
+    "wxcloudrun.routers.feeding_ongoing": ("/api/feeding/ongoing",),
+    "wxcloudrun.routers.diaper": ("/api/diaper",),
+    "wxcloudrun.routers.sleep": ("/api/sleep",),
+    "wxcloudrun.routers.growth": ("/api/growth",),
+    "wxcloudrun.routers.pumping": ("/api/pumping",),
+    "wxcloudrun.routers.jaundice": ("/api/jaundice",),
+    "wxcloudrun.routers.invitations": ("/api/invitations",),
+    "wxcloudrun.routers.policies": ("/api/policies",),
+    "wxcloudrun.routers.home": ("/api/home",),
+    "wxcloudrun.routers.user_preference": ("/api/users/me/preferences",),
+    "wxcloudrun.routers.notifications": ("/api/notifications",),
+    "wxcloudrun.routers.vaccines": ("/api/vaccines", "/api/babies/"),
+    "wxcloudrun.routers.album": ("/api/album",),
+    "wxcloudrun.routers.live": ("/api/live",),
+    "wxcloudrun.routers.sync": ("/api/sync",),
+}
 
 __all__ = [
+    "ROUTER_MODULES",
     "auth_router",
     "users_router",
     "babies_router",
@@ -40,4 +47,15 @@ __all__ = [
     "notifications_router",
     "vaccines_router",
     "album_router",
+    "live_router",
+    "sync_router",
 ]
+
+
+def __getattr__(name: str):
+    """兼容 from wxcloudrun.routers import xxx_router 的写法（按需导入）"""
+    if name.endswith("_router"):
+        module_name = f"{__name__}.{name[:-len('_router')]}"
+        if module_name in ROUTER_MODULES:
+            return importlib.import_module(module_name).router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,19 @@
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from wxcloudrun.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from wxcloudrun.core.database import get_db, get_async_db
 from wxcloudrun.schemas.album import AlbumRecordCreate, AlbumRecordResponse
 from wxcloudrun.crud import album as album_crud
-from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access
+from wxcloudrun.utils.deps import (
+    get_current_user_id,
+    get_current_user_id_async,
+    verify_baby_access,
+    verify_baby_access_async,
+    get_record_cursor,
+)
+from wxcloudrun.utils.pagination import split_page, next_cursor_headers
+from wxcloudrun.utils.serialization import model_list_response
 
 router = APIRouter(
     prefix="/api/album",
@@ -25,25 +34,24 @@ def create_album_record(
 @router.get("/baby/{baby_id}", response_model=List[AlbumRecordResponse])
 async def get_album_records(
     baby_id: int,
-    user_id: Annotated[int, Depends(get_current_user_id)],
-    db: Annotated[Session, Depends(get_db)],
+    user_id: Annotated[int, Depends(get_current_user_id_async)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+    cursor: Annotated[Optional[tuple], Depends(get_record_cursor)],
     skip: int = Query(0, ge=0, description="跳过记录数"),
     limit: int = Query(20, ge=1, le=100, description="返回记录数")
 ):
     """获取宝宝的相册记录列表"""
-    verify_baby_access(baby_id, user_id, db)
-    records = album_crud.get_album_records_by_baby(db, baby_id, skip, limit)
+    await verify_baby_access_async(baby_id, user_id, db)
+    records = await album_crud.get_album_records_by_baby_async(db, baby_id, skip, limit + 1, cursor)
+    records, next_cursor = split_page(records, limit, "created_at")
+    headers = next_cursor_headers(next_cursor)
     
-    # 获取临时链接
+    # 获取临时链接（命中缓存的不再请求微信）
     if records:
-        from wxcloudrun.utils.wechat import get_wechat_api
-        wx_api = get_wechat_api()
-        
-        file_list = [{"fileid": r.file_id, "max_age": 7200} for r in records]
+        from wxcloudrun.utils.wechat import get_temp_file_urls
+
         try:
-            download_list = await wx_api.batch_download_file(file_list)
-            # 构建 file_id -> url 的映射
-            url_map = {item["fileid"]: item["temp_file_url"] for item in download_list if item["status"] == 0}
+            url_map = await get_temp_file_urls([r.file_id for r in records])
         except Exception as e:
             print(f"Failed to get signed urls: {e}")
             url_map = {}
@@ -54,9 +62,9 @@ async def get_album_records(
             resp = AlbumRecordResponse.model_validate(r, from_attributes=True)
             resp.url = url_map.get(r.file_id)
             results.append(resp)
-        return results
+        return model_list_response(AlbumRecordResponse, results, headers=headers)
         
-    return []
+    return model_list_response(AlbumRecordResponse, [], headers=headers)
 
 @router.delete("/{record_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_album_record(
@@ -2,10 +2,11 @@
 认证和会话管理相关的 API 路由
 """
 from typing import Annotated
+from datetime import datetime
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from wxcloudrun.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from wxcloudrun.core.database import get_async_db
 from wxcloudrun.schemas.session import (
     CheckSessionRequest,
     CheckSessionResponse,
@@ -20,7 +21,7 @@ from fastapi import Header
 
 async def get_current_user_id(
     x_wx_openid: Annotated[str | None, Header()] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> int:
     """
     获取当前用户ID (Dependency)
@@ -35,7 +36,7 @@ async def get_current_user_id(
             detail="Missing X-WX-OPENID header"
         )
         
-    session = session_crud.get_session_by_openid(db, x_wx_openid)
+    session = await session_crud.get_session_by_openid_async(db, x_wx_openid)
     if not session:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -54,7 +55,7 @@ logger = logging.getLogger(__name__)
 @router.post("/check-session", response_model=CheckSessionResponse, status_code=status.HTTP_200_OK)
 async def check_session(
     request_data: CheckSessionRequest,
-    db: Annotated[Session, Depends(get_db)]
+    db: Annotated[AsyncSession, Depends(get_async_db)]
 ):
     """
     检验登录态
@@ -64,7 +65,7 @@ async def check_session(
     try:
         logger.info(f"/api/auth/check-session: openid={request_data.openid}")
         # 获取会话记录
-        db_session = session_crud.get_session_by_openid(db, request_data.openid)
+        db_session = await session_crud.get_session_by_openid_async(db, request_data.openid)
         
         if not db_session:
             logger.info("/api/auth/check-session: session not found")
@@ -74,7 +75,7 @@ async def check_session(
             )
         
         # 检查是否过期
-        is_valid = session_crud.is_session_valid(db, request_data.openid)
+        is_valid = db_session.expires_at > datetime.now()
         logger.info(f"/api/auth/check-session: valid={is_valid} expires_at={db_session.expires_at}")
         
         return CheckSessionResponse(
@@ -93,7 +94,7 @@ async def check_session(
 @router.post("/reset-session", response_model=ResetSessionResponse, status_code=status.HTTP_200_OK)
 async def reset_session(
     request_data: ResetSessionRequest,
-    db: Annotated[Session, Depends(get_db)]
+    db: Annotated[AsyncSession, Depends(get_async_db)]
 ):
     """
     重置登录态
@@ -106,7 +107,7 @@ async def reset_session(
     try:
         logger.info(f"/api/auth/reset-session: openid={request_data.openid}")
         # 获取当前会话
-        db_session = session_crud.get_session_by_openid(db, request_data.openid)
+        db_session = await session_crud.get_session_by_openid_async(db, request_data.openid)
         
         if not db_session:
             raise HTTPException(
@@ -131,7 +132,7 @@ async def reset_session(
             )
         
         # 更新数据库中的 session_key
-        updated_session = session_crud.update_session_key(
+        updated_session = await session_crud.update_session_key_async(
             db=db,
             openid=request_data.openid,
             new_session_key=new_session_key,
@@ -2,7 +2,8 @@
 宝宝管理相关的 API 路由
 """
 from typing import Annotated
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from wxcloudrun.core.database import get_db
 from wxcloudrun.schemas.baby import (
@@ -11,8 +12,7 @@ from wxcloudrun.schemas.baby import (
 )
 from wxcloudrun.schemas.invitation import InviteCodeResponse
 from wxcloudrun.crud import invitation as invitation_crud
-from wxcloudrun.utils.wechat import get_wechat_api, WeChatAPIError
-import base64
+from wxcloudrun.utils.wechat import get_wxacode_unlimit_cached, WeChatAPIError
 import logging
 
 logger = logging.getLogger(__name__)
@@ -174,36 +174,50 @@ def create_invite_code(
     }
 
 
-@router.get("/{baby_id}/invite-code/qrcode")
-def get_invite_qrcode(
-    baby_id: int,
-    user_id: Annotated[int, Depends(get_current_user_id)],
-    db: Annotated[Session, Depends(get_db)]
-):
-    """生成并返回小程序码（Base64 PNG）"""
-    verify_baby_access(baby_id, user_id, db)
-    inv = invitation_crud.get_active_invitation_by_baby(db, baby_id)
+async def _get_invite_qrcode_entry(baby_id: int, user_id: int, db: Session) -> tuple[str, dict]:
+    """校验权限并获取邀请码对应的小程序码（数据库操作放到线程池，避免阻塞事件循环）"""
+    await run_in_threadpool(verify_baby_access, baby_id, user_id, db)
+    inv = await run_in_threadpool(invitation_crud.get_active_invitation_by_baby, db, baby_id)
     if not inv:
         # 允许非管理员用户时，仅在无码的情况下返回404，不创建
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="邀请码不存在")
 
-    wechat = get_wechat_api()
     scene = f"code={inv.invite_code}"
     page = "pages/family/join"
     try:
         logger.info(f"qrcode.begin baby_id={baby_id} code={inv.invite_code}")
-        png_bytes = wechat.get_wxacode_unlimit.__wrapped__(wechat, scene=scene, page=page) if hasattr(wechat.get_wxacode_unlimit, "__wrapped__") else None
-        if png_bytes is None:
-            # 正常调用异步接口（FastAPI路由是同步函数，使用简单方式）
-            import anyio
-            png_bytes = anyio.run(wechat.get_wxacode_unlimit, scene, page)
+        entry = await get_wxacode_unlimit_cached(scene, page)
     except WeChatAPIError as e:
         logger.error(f"qrcode.error baby_id={baby_id} err={e.errmsg}")
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=f"微信接口错误: {e.errmsg}")
+    return inv.invite_code, entry
+
 
-    image_base64 = base64.b64encode(png_bytes).decode("ascii")
-    logger.info(f"qrcode.success baby_id={baby_id} size={len(image_base64)}")
+@router.get("/{baby_id}/invite-code/qrcode")
+async def get_invite_qrcode(
+    baby_id: int,
+    user_id: Annotated[int, Depends(get_current_user_id)],
+    db: Annotated[Session, Depends(get_db)]
+):
+    """生成并返回小程序码（Base64 PNG）"""
+    code, entry = await _get_invite_qrcode_entry(baby_id, user_id, db)
+    logger.info(f"qrcode.success baby_id={baby_id} size={len(entry['base64'])}")
     return {
-        "code": inv.invite_code,
-        "image_base64": image_base64
+        "code": code,
+        "image_base64": entry["base64"]
     }
+
+
+@router.get("/{baby_id}/invite-code/qrcode.png")
+async def get_invite_qrcode_png(
+    baby_id: int,
+    request: Request,
+    user_id: Annotated[int, Depends(get_current_user_id)],
+    db: Annotated[Session, Depends(get_db)]
+):
+    """返回小程序码原始 PNG，支持 ETag / If-None-Match 协商缓存"""
+    _, entry = await _get_invite_qrcode_entry(baby_id, user_id, db)
+    headers = {"ETag": entry["etag"], "Cache-Control": "private, max-age=86400"}
+    if request.headers.get("if-none-match") == entry["etag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=entry["png"], media_type="image/png", headers=headers)
@@ -1,14 +1,16 @@
 """
 排便/排尿记录相关的 API 路由
 """
-from typing import Annotated, Optional
+from typing import Annotated, Literal, Optional
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from wxcloudrun.core.database import get_db
 from wxcloudrun.schemas.diaper import DiaperRecordCreate, DiaperRecordUpdate, DiaperRecordResponse
 from wxcloudrun.crud import diaper as diaper_crud
-from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access
+from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access, get_record_cursor
+from wxcloudrun.utils.pagination import split_page, next_cursor_headers
+from wxcloudrun.utils.serialization import model_list_response
 
 router = APIRouter(
     prefix="/api/diaper",
@@ -33,6 +35,7 @@ def get_diaper_records(
     baby_id: int,
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[Session, Depends(get_db)],
+    cursor: Annotated[Optional[tuple], Depends(get_record_cursor)],
     skip: int = Query(0, ge=0, description="跳过记录数"),
     limit: int = Query(100, ge=1, le=500, description="返回记录数"),
     start_date: Optional[datetime] = Query(None, description="开始日期"),
@@ -41,9 +44,10 @@ def get_diaper_records(
     """获取宝宝的排便/排尿记录列表"""
     verify_baby_access(baby_id, user_id, db)
     records = diaper_crud.get_diaper_records_by_baby(
-        db, baby_id, skip, limit, start_date, end_date
+        db, baby_id, skip, limit + 1, start_date, end_date, cursor
     )
-    return [DiaperRecordResponse.model_validate(r, from_attributes=True) for r in records]
+    records, next_cursor = split_page(records, limit, "record_time")
+    return model_list_response(DiaperRecordResponse, records, headers=next_cursor_headers(next_cursor))
 
 
 @router.get("/{record_id}", response_model=DiaperRecordResponse)
@@ -106,8 +110,9 @@ def get_diaper_stats(
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[Session, Depends(get_db)],
     start_date: datetime = Query(..., description="开始日期"),
-    end_date: datetime = Query(..., description="结束日期")
+    end_date: datetime = Query(..., description="结束日期"),
+    group_by: Optional[Literal["day", "week", "month"]] = Query(None, description="按日/周/月分组返回序列")
 ):
     """获取指定日期范围的排便/排尿统计"""
     verify_baby_access(baby_id, user_id, db)
-    return diaper_crud.get_diaper_count_by_date(db, baby_id, start_date, end_date)
+    return diaper_crud.get_diaper_count_by_date(db, baby_id, start_date, end_date, group_by)
@@ -8,7 +8,9 @@ from sqlalchemy.orm import Session
 from wxcloudrun.core.database import get_db
 from wxcloudrun.schemas.feeding import FeedingRecordCreate, FeedingRecordUpdate, FeedingRecordResponse
 from wxcloudrun.crud import feeding as feeding_crud
-from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access
+from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access, get_record_cursor
+from wxcloudrun.utils.pagination import split_page, next_cursor_headers
+from wxcloudrun.utils.serialization import model_list_response
 
 router = APIRouter(
     prefix="/api/feeding",
@@ -33,6 +35,7 @@ def get_feeding_records(
     baby_id: int,
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[Session, Depends(get_db)],
+    cursor: Annotated[Optional[tuple], Depends(get_record_cursor)],
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
     start_date: Optional[datetime] = Query(None),
@@ -42,18 +45,24 @@ def get_feeding_records(
     order: Optional[str] = Query("desc")
 ):
     verify_baby_access(baby_id, user_id, db)
+    # 游标分页只支持默认的按开始时间排序
+    keyset = sort_by == "start_time"
+    if cursor and not keyset:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="游标分页仅支持按开始时间排序")
     records = feeding_crud.get_feeding_records_by_baby(
         db=db,
         baby_id=baby_id,
         skip=skip,
-        limit=limit,
+        limit=limit + 1 if keyset else limit,
         start_date=start_date,
         end_date=end_date,
         feeding_type=feeding_type,
         sort_by=sort_by,
         order=order,
+        cursor=cursor,
     )
-    return [FeedingRecordResponse.model_validate(r, from_attributes=True) for r in records]
+    records, next_cursor = split_page(records, limit if keyset else None, "start_time")
+    return model_list_response(FeedingRecordResponse, records, headers=next_cursor_headers(next_cursor))
 
 
 @router.get("/{record_id}", response_model=FeedingRecordResponse)
@@ -6,12 +6,13 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from wxcloudrun.core.database import get_db
-from wxcloudrun.models.feeding_ongoing import FeedingOngoing
+from wxcloudrun.core import live
 from wxcloudrun.models.feeding import FeedingRecord
 from wxcloudrun.schemas.feeding_ongoing import FeedingOngoingCreate, FeedingOngoingResponse
 from wxcloudrun.schemas.feeding import FeedingRecordResponse
 from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access
-from wxcloudrun.crud import feeding as feeding_crud
+from wxcloudrun.crud import feeding_ongoing as ongoing_crud
+from wxcloudrun.crud.creator import attach_creator_info
 
 router = APIRouter(
     prefix="/api/feeding/ongoing",
@@ -27,11 +28,11 @@ def get_ongoing_feeding(
     """获取正在进行的喂养状态"""
     verify_baby_access(baby_id, user_id, db)
     
-    ongoing = db.query(FeedingOngoing).filter(FeedingOngoing.baby_id == baby_id).first()
-    if not ongoing:
+    state = ongoing_crud.get_ongoing_state(db, baby_id)
+    if not state:
         return None
         
-    return FeedingOngoingResponse.model_validate(ongoing, from_attributes=True)
+    return FeedingOngoingResponse.model_validate(state)
 
 @router.post("/action", response_model=FeedingOngoingResponse)
 def update_ongoing_action(
@@ -41,46 +42,17 @@ def update_ongoing_action(
 ):
     """更新喂养状态（开始/暂停）"""
     verify_baby_access(action_data.baby_id, user_id, db)
-    
-    now = datetime.now()
-    ongoing = db.query(FeedingOngoing).filter(FeedingOngoing.baby_id == action_data.baby_id).first()
-    
-    if not ongoing:
-        # 如果不存在，且操作是开始，则创建
-        if action_data.action == 'pause':
-            raise HTTPException(status_code=400, detail="没有正在进行的喂养，无法暂停")
-            
-        ongoing = FeedingOngoing(
-            baby_id=action_data.baby_id,
-            start_time=now,
-            last_action_time=now,
-            current_side='left' if action_data.action == 'start_left' else 'right',
-            accumulated_left=0,
-            accumulated_right=0
-        )
-        db.add(ongoing)
-    else:
-        # 计算上一个阶段的时长并累加
-        if ongoing.current_side != 'paused':
-            duration = (now - ongoing.last_action_time).total_seconds()
-            if ongoing.current_side == 'left':
-                ongoing.accumulated_left += int(duration)
-            else:
-                ongoing.accumulated_right += int(duration)
-        
-        # 更新状态
-        if action_data.action == 'start_left':
-            ongoing.current_side = 'left'
-        elif action_data.action == 'start_right':
-            ongoing.current_side = 'right'
-        elif action_data.action == 'pause':
-            ongoing.current_side = 'paused'
-            
-        ongoing.last_action_time = now
-    
-    db.commit()
-    db.refresh(ongoing)
-    return FeedingOngoingResponse.model_validate(ongoing, from_attributes=True)
+
+    try:
+        state = ongoing_crud.apply_ongoing_action(db, action_data.baby_id, action_data.action)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ongoing_crud.OngoingConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    response = FeedingOngoingResponse.model_validate(state)
+    live.publish(db, action_data.baby_id, "feeding_ongoing", response.model_dump(mode="json"))
+    return response
 
 @router.post("/resume/{record_id}", response_model=FeedingOngoingResponse)
 def resume_feeding_from_record(
@@ -96,38 +68,24 @@ def resume_feeding_from_record(
 
     verify_baby_access(original_record.baby_id, user_id, db)
 
-    # 检查记录是否在1小时内
-    now = datetime.now()
+    # 检查记录是否在1小时内（last_action_time 为秒精度，舍去微秒与计时累加口径保持一致）
+    now = datetime.now().replace(microsecond=0)
     time_diff = (now - original_record.start_time).total_seconds() / 60
     if time_diff > 60:
         raise HTTPException(status_code=400, detail="只能恢复1小时内的记录")
 
     # 检查是否已有ongoing session
-    existing_ongoing = db.query(FeedingOngoing).filter(
-        FeedingOngoing.baby_id == original_record.baby_id
-    ).first()
+    existing_ongoing = ongoing_crud.get_ongoing(db, original_record.baby_id)
     if existing_ongoing:
         raise HTTPException(status_code=400, detail="已有正在进行的喂养，请先完成")
 
-    # 创建新的ongoing session，使用原记录的时长作为初始累计值
-    ongoing = FeedingOngoing(
-        baby_id=original_record.baby_id,
-        start_time=original_record.start_time,  # 保持原开始时间
-        last_action_time=now,  # 当前时间作为最后操作时间
-        current_side='paused',  # 初始为暂停状态
-        accumulated_left=original_record.duration_left or 0,
-        accumulated_right=original_record.duration_right or 0
-    )
-
-    db.add(ongoing)
-
-    # 删除原记录
-    db.delete(original_record)
+    # 恢复为暂停中的计时（保持原开始时间，原记录的喂养序列还原为分段），并删除原记录
+    baby_id = original_record.baby_id
+    state = ongoing_crud.resume_ongoing(db, original_record, now)
 
-    db.commit()
-    db.refresh(ongoing)
-
-    return FeedingOngoingResponse.model_validate(ongoing, from_attributes=True)
+    response = FeedingOngoingResponse.model_validate(state)
+    live.publish(db, baby_id, "feeding_ongoing", response.model_dump(mode="json"))
+    return response
 
 @router.post("/finish/{baby_id}", response_model=FeedingRecordResponse)
 def finish_ongoing_feeding(
@@ -137,60 +95,12 @@ def finish_ongoing_feeding(
 ):
     """结束喂养并保存记录"""
     verify_baby_access(baby_id, user_id, db)
-    
-    ongoing = db.query(FeedingOngoing).filter(FeedingOngoing.baby_id == baby_id).first()
-    if not ongoing:
+
+    new_record = ongoing_crud.finish_ongoing(db, baby_id, user_id)
+    if new_record is None:
         raise HTTPException(status_code=404, detail="没有正在进行的喂养")
-    
-    # 计算最后一段时长
-    now = datetime.now()
-    if ongoing.current_side != 'paused':
-        duration = (now - ongoing.last_action_time).total_seconds()
-        if ongoing.current_side == 'left':
-            ongoing.accumulated_left += int(duration)
-        else:
-            ongoing.accumulated_right += int(duration)
-            
-    # 创建正式记录
-    # 构造 feeding_sequence (简化版，因为我们只存了总时长，如果需要详细片段，需要更复杂的表结构)
-    # 这里为了兼容，我们构造两个大的片段
-    sequence = []
-    if ongoing.accumulated_left > 0:
-        sequence.append({
-            "side": "left",
-            "duration_seconds": ongoing.accumulated_left,
-            "start_time": ongoing.start_time # 近似值
-        })
-    if ongoing.accumulated_right > 0:
-        sequence.append({
-            "side": "right",
-            "duration_seconds": ongoing.accumulated_right,
-            "start_time": ongoing.start_time # 近似值
-        })
-        
-    # 序列化 sequence
-    import json
-    sequence_json = json.dumps(sequence, default=str)
-    
-    new_record = FeedingRecord(
-        baby_id=baby_id,
-        user_id=user_id,
-        feeding_type='breast',
-        start_time=ongoing.start_time,
-        end_time=now,
-        duration_left=ongoing.accumulated_left,
-        duration_right=ongoing.accumulated_right,
-        feeding_sequence=sequence_json,
-        notes="" 
-    )
-    
-    db.add(new_record)
-    db.delete(ongoing) # 删除临时状态
-    db.commit()
-    db.refresh(new_record)
-    
-    # 触发反序列化以便返回
-    feeding_crud._deserialize_feeding_sequence(new_record)
-    feeding_crud._attach_creator_info(db, new_record)
-    
+
+    attach_creator_info(db, [new_record])
+    live.publish(db, baby_id, "feeding_ongoing", None)
+
     return FeedingRecordResponse.model_validate(new_record, from_attributes=True)
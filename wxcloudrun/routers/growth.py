@@ -8,7 +8,9 @@ from sqlalchemy.orm import Session
 from wxcloudrun.core.database import get_db
 from wxcloudrun.schemas.growth import GrowthRecordCreate, GrowthRecordUpdate, GrowthRecordResponse
 from wxcloudrun.crud import growth as growth_crud
-from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access
+from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access, get_record_cursor
+from wxcloudrun.utils.pagination import split_page, next_cursor_headers
+from wxcloudrun.utils.serialization import model_list_response
 
 router = APIRouter(
     prefix="/api/growth",
@@ -33,6 +35,7 @@ def get_growth_records(
     baby_id: int,
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[Session, Depends(get_db)],
+    cursor: Annotated[Optional[tuple], Depends(get_record_cursor)],
     skip: int = Query(0, ge=0, description="跳过记录数"),
     limit: int = Query(100, ge=1, le=500, description="返回记录数"),
     start_date: Optional[datetime] = Query(None, description="开始日期"),
@@ -41,9 +44,10 @@ def get_growth_records(
     """获取宝宝的生长发育记录列表"""
     verify_baby_access(baby_id, user_id, db)
     records = growth_crud.get_growth_records_by_baby(
-        db, baby_id, skip, limit, start_date, end_date
+        db, baby_id, skip, limit + 1, start_date, end_date, cursor
     )
-    return [GrowthRecordResponse.model_validate(r, from_attributes=True) for r in records]
+    records, next_cursor = split_page(records, limit, "record_date")
+    return model_list_response(GrowthRecordResponse, records, headers=next_cursor_headers(next_cursor))
 
 
 @router.get("/{record_id}", response_model=GrowthRecordResponse)
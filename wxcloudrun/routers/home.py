@@ -3,22 +3,14 @@
 """
 from typing import Annotated, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from wxcloudrun.core.database import get_db
 from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access
-from wxcloudrun.crud import feeding as feeding_crud
-from wxcloudrun.crud import diaper as diaper_crud
-from wxcloudrun.crud import sleep as sleep_crud
-from wxcloudrun.crud import growth as growth_crud
-from wxcloudrun.crud import jaundice as jaundice_crud
-from wxcloudrun.crud import pumping as pumping_crud
-from wxcloudrun.schemas.feeding import FeedingRecordResponse
-from wxcloudrun.schemas.diaper import DiaperRecordResponse
-from wxcloudrun.schemas.sleep import SleepRecordResponse
-from wxcloudrun.schemas.growth import GrowthRecordResponse
-from wxcloudrun.schemas.jaundice import JaundiceRecordResponse
-from wxcloudrun.schemas.pumping import PumpingRecordResponse
+from wxcloudrun.utils.pagination import encode_cursor, decode_cursor
+from wxcloudrun.utils.serialization import model_response
+from wxcloudrun.crud import home as home_crud
+from wxcloudrun.schemas.home import HomeTimelineResponse
 
 router = APIRouter(
     prefix="/api/home",
@@ -26,73 +18,42 @@ router = APIRouter(
 )
 
 
-@router.get("/baby/{baby_id}", response_model=dict)
+@router.get("/baby/{baby_id}", response_model=HomeTimelineResponse)
 def get_home_aggregated_records(
     baby_id: int,
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[Session, Depends(get_db)],
     skip: int = Query(0, ge=0, description="跳过记录数"),
-    limit: int = Query(100, ge=1, le=500, description="返回记录数"),
+    limit: int = Query(100, ge=1, le=500, description="返回记录数（所有类型合计）"),
     start_date: Optional[datetime] = Query(None, description="开始日期"),
     end_date: Optional[datetime] = Query(None, description="结束日期"),
+    cursor: Optional[str] = Query(None, description="分页游标（上一页返回的 next_cursor）"),
 ):
+    """获取首页时间线（六类记录按时间合并分页）"""
     verify_baby_access(baby_id, user_id, db)
 
-    feeding_records = feeding_crud.get_feeding_records_by_baby(
-        db=db,
-        baby_id=baby_id,
-        skip=skip,
+    try:
+        decoded_cursor = decode_cursor(cursor) if cursor else None
+        if decoded_cursor and (
+            len(decoded_cursor) != 3
+            or decoded_cursor[1] not in home_crud.TIMELINE_SOURCES
+            or not isinstance(decoded_cursor[2], int)
+        ):
+            raise ValueError("无效的分页游标")
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    grouped, next_cursor = home_crud.get_home_timeline(
+        db,
+        baby_id,
         limit=limit,
+        skip=skip,
+        cursor=decoded_cursor,
         start_date=start_date,
         end_date=end_date,
-        feeding_type=None,
-        sort_by="start_time",
-        order="desc",
-    )
-
-    diaper_records = diaper_crud.get_diaper_records_by_baby(
-        db, baby_id, skip, limit, start_date, end_date
-    )
-
-    sleep_records = sleep_crud.get_sleep_records_by_baby(
-        db, baby_id, skip, limit, start_date, end_date
-    )
-
-    growth_records = growth_crud.get_growth_records_by_baby(
-        db, baby_id, skip, limit, start_date, end_date
-    )
-
-    jaundice_records = jaundice_crud.get_jaundice_records_by_baby(
-        db, baby_id, skip, limit, start_date, end_date
-    )
-
-    pumping_records = pumping_crud.get_pumping_records_by_baby(
-        db, baby_id, skip, limit, start_date, end_date
     )
 
-    return {
-        "feeding": [
-            FeedingRecordResponse.model_validate(r, from_attributes=True)
-            for r in feeding_records
-        ],
-        "diaper": [
-            DiaperRecordResponse.model_validate(r, from_attributes=True)
-            for r in diaper_records
-        ],
-        "sleep": [
-            SleepRecordResponse.model_validate(r, from_attributes=True)
-            for r in sleep_records
-        ],
-        "growth": [
-            GrowthRecordResponse.model_validate(r, from_attributes=True)
-            for r in growth_records
-        ],
-        "jaundice": [
-            JaundiceRecordResponse.model_validate(r, from_attributes=True)
-            for r in jaundice_records
-        ],
-        "pumping": [
-            PumpingRecordResponse.model_validate(r, from_attributes=True)
-            for r in pumping_records
-        ],
-    }
\ No newline at end of file
+    return model_response(HomeTimelineResponse, {
+        **grouped,
+        "next_cursor": encode_cursor(*next_cursor) if next_cursor else None,
+    })
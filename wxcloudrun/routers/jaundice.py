@@ -4,7 +4,9 @@ from sqlalchemy.orm import Session
 from wxcloudrun.core.database import get_db
 from wxcloudrun.schemas.jaundice import JaundiceRecordCreate, JaundiceRecordUpdate, JaundiceRecordResponse
 from wxcloudrun.crud import jaundice as jaundice_crud
-from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access
+from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access, get_record_cursor
+from wxcloudrun.utils.pagination import split_page, next_cursor_headers
+from wxcloudrun.utils.serialization import model_list_response
 
 router = APIRouter(
     prefix="/api/jaundice",
@@ -27,13 +29,15 @@ def get_jaundice_records(
     baby_id: int,
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[Session, Depends(get_db)],
+    cursor: Annotated[Optional[tuple], Depends(get_record_cursor)],
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500)
 ):
     """获取宝宝的黄疸记录列表"""
     verify_baby_access(baby_id, user_id, db)
-    records = jaundice_crud.get_jaundice_records_by_baby(db, baby_id, skip, limit)
-    return [JaundiceRecordResponse.model_validate(r, from_attributes=True) for r in records]
+    records = jaundice_crud.get_jaundice_records_by_baby(db, baby_id, skip, limit + 1, cursor=cursor)
+    records, next_cursor = split_page(records, limit, "record_date")
+    return model_list_response(JaundiceRecordResponse, records, headers=next_cursor_headers(next_cursor))
 
 @router.get("/baby/{baby_id}/latest", response_model=Optional[JaundiceRecordResponse])
 def get_latest_jaundice(
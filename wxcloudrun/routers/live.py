@@ -0,0 +1,85 @@
+"""
+实时推送相关的 API 路由
+"""
+import asyncio
+from typing import Annotated, Optional
+from fastapi import APIRouter, Header, HTTPException, WebSocket, WebSocketDisconnect, status
+from wxcloudrun.core.config import get_settings
+from wxcloudrun.core.database import SessionLocal
+from wxcloudrun.core.live import live_hub
+from wxcloudrun.schemas.feeding_ongoing import FeedingOngoingResponse
+from wxcloudrun.crud import feeding_ongoing as ongoing_crud
+from wxcloudrun.crud import sleep as sleep_crud
+from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access
+
+router = APIRouter(
+    prefix="/api/live",
+    tags=["实时推送"]
+)
+
+
+def _authorize(x_wx_openid: Optional[str], baby_id: int) -> None:
+    with SessionLocal() as db:
+        user_id = get_current_user_id(x_wx_openid, db)
+        verify_baby_access(baby_id, user_id, db)
+
+
+def _snapshot(baby_id: int) -> dict:
+    """宝宝当前的喂养计时与进行中的睡眠"""
+    with SessionLocal() as db:
+        ongoing = ongoing_crud.get_ongoing_state(db, baby_id)
+        if ongoing:
+            ongoing = FeedingOngoingResponse.model_validate(ongoing).model_dump(mode="json")
+        return {"feeding_ongoing": ongoing, "sleep_active": sleep_crud.get_active_sleep_state(db, baby_id)}
+
+
+async def _receive_until_disconnect(websocket: WebSocket) -> None:
+    """读取并丢弃客户端消息（如心跳），直到连接断开"""
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+
+
+@router.websocket("/baby/{baby_id}")
+async def baby_live_channel(
+    websocket: WebSocket,
+    baby_id: int,
+    x_wx_openid: Annotated[Optional[str], Header()] = None,
+):
+    """
+    订阅宝宝的实时状态
+
+    连接后先推送一条 snapshot（当前喂养计时与进行中的睡眠），之后每次状态变化推送：
+    - {"type": "feeding_ongoing", "baby_id": ..., "data": 喂养计时状态 | null（已结束）}
+    - {"type": "sleep_active", "baby_id": ..., "data": 进行中的睡眠 | null（已结束）}
+    空闲时每隔 live_heartbeat_seconds 秒推送 {"type": "ping"}
+    """
+    try:
+        await asyncio.to_thread(_authorize, x_wx_openid, baby_id)
+    except HTTPException as e:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(e.detail))
+        return
+
+    await websocket.accept()
+    heartbeat = get_settings().live_heartbeat_seconds
+    async with live_hub.subscribe(baby_id) as queue:
+        # 先订阅再读取快照，快照之后的变化都会进入队列
+        snapshot = await asyncio.to_thread(_snapshot, baby_id)
+        receiver = asyncio.create_task(_receive_until_disconnect(websocket))
+        try:
+            await websocket.send_json({"type": "snapshot", "baby_id": baby_id, "data": snapshot})
+            while not receiver.done():
+                getter = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait({getter, receiver}, timeout=heartbeat, return_when=asyncio.FIRST_COMPLETED)
+                if getter in done:
+                    await websocket.send_json(getter.result())
+                    continue
+                getter.cancel()
+                if not done:
+                    await websocket.send_json({"type": "ping"})
+        except WebSocketDisconnect:
+            pass
+        finally:
+            receiver.cancel()
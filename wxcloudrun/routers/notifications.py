@@ -3,9 +3,9 @@
 """
 from typing import Annotated, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Body
-from sqlalchemy.orm import Session
-from wxcloudrun.core.database import get_db
-from wxcloudrun.utils.deps import get_current_user_id
+from sqlalchemy.ext.asyncio import AsyncSession
+from wxcloudrun.core.database import get_async_db
+from wxcloudrun.utils.deps import get_current_user_id_async
 from wxcloudrun.utils.wechat import get_wechat_api
 from wxcloudrun.crud import user as users_crud
 import logging
@@ -19,8 +19,8 @@ logger = logging.getLogger(__name__)
 
 @router.post("/subscribe/send", status_code=status.HTTP_200_OK)
 async def send_subscribe_message(
-    user_id: Annotated[int, Depends(get_current_user_id)],
-    db: Annotated[Session, Depends(get_db)],
+    user_id: Annotated[int, Depends(get_current_user_id_async)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     payload: Dict[str, Any] = Body(...)
 ):
     """
@@ -41,7 +41,7 @@ async def send_subscribe_message(
         raise HTTPException(status_code=400, detail="缺少必要参数")
         
     # 获取用户 OpenID
-    user = users_crud.get_user(db, user_id)
+    user = await users_crud.get_user_async(db, user_id)
     if not user or not user.openid:
         raise HTTPException(status_code=404, detail="用户未找到或无OpenID")
         
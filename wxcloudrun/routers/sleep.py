@@ -1,11 +1,12 @@
 """
 睡眠记录相关的 API 路由
 """
-from typing import Annotated, Optional
+from typing import Annotated, Literal, Optional
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from wxcloudrun.core.database import get_db
+from wxcloudrun.core import live
 from wxcloudrun.schemas.sleep import (
     SleepRecordCreate,
     SleepRecordUpdate,
@@ -15,7 +16,9 @@ from wxcloudrun.schemas.sleep import (
     SleepAutoCloseUpdate,
 )
 from wxcloudrun.crud import sleep as sleep_crud
-from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access
+from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access, get_record_cursor
+from wxcloudrun.utils.pagination import split_page, next_cursor_headers
+from wxcloudrun.utils.serialization import model_list_response
 
 router = APIRouter(
     prefix="/api/sleep",
@@ -23,6 +26,17 @@ router = APIRouter(
 )
 
 
+def _publish_sleep_state(db: Session, baby_id: int) -> None:
+    """推送宝宝当前进行中的睡眠（没有时推送 null）"""
+    live.publish(db, baby_id, "sleep_active", sleep_crud.get_active_sleep_state(db, baby_id))
+
+
+def _published(db: Session, response: SleepRecordResponse) -> SleepRecordResponse:
+    """推送当前睡眠状态后原样返回响应"""
+    _publish_sleep_state(db, response.baby_id)
+    return response
+
+
 @router.post("/", response_model=SleepRecordResponse, status_code=status.HTTP_201_CREATED)
 def create_sleep_record(
     record: SleepRecordCreate,
@@ -31,7 +45,7 @@ def create_sleep_record(
 ):
     verify_baby_access(record.baby_id, user_id, db)
     created = sleep_crud.create_sleep_record(db, record, user_id)
-    return SleepRecordResponse.model_validate(created, from_attributes=True)
+    return _published(db, SleepRecordResponse.model_validate(created, from_attributes=True))
 
 
 @router.get("/baby/{baby_id}", response_model=list[SleepRecordResponse])
@@ -39,6 +53,7 @@ def get_sleep_records(
     baby_id: int,
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[Session, Depends(get_db)],
+    cursor: Annotated[Optional[tuple], Depends(get_record_cursor)],
     skip: int = Query(0, ge=0, description="跳过记录数"),
     limit: Optional[int] = Query(None, ge=1, le=500, description="返回记录数"),
     start_date: Optional[datetime] = Query(None, description="开始日期"),
@@ -48,10 +63,15 @@ def get_sleep_records(
 ):
     """获取宝宝的睡眠记录列表"""
     verify_baby_access(baby_id, user_id, db)
+    # 游标分页只支持默认的按开始时间排序（未传 limit 时一次返回全部，不分页）
+    keyset = sort_by == "start_time" and limit is not None
+    if cursor and sort_by != "start_time":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="游标分页仅支持按开始时间排序")
     records = sleep_crud.get_sleep_records_by_baby(
-        db, baby_id, skip, limit, start_date, end_date, sort_by, order
+        db, baby_id, skip, limit + 1 if keyset else limit, start_date, end_date, sort_by, order, cursor
     )
-    return [SleepRecordResponse.model_validate(r, from_attributes=True) for r in records]
+    records, next_cursor = split_page(records, limit if keyset else None, "start_time")
+    return model_list_response(SleepRecordResponse, records, headers=next_cursor_headers(next_cursor))
 
 @router.get("/baby/{baby_id}/active", response_model=SleepRecordResponse | None)
 def get_active_sleep_records(
@@ -96,7 +116,7 @@ def update_sleep_record(
     updated_record = sleep_crud.update_sleep_record(db, record_id, record)
     if not updated_record:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="更新失败")
-    return SleepRecordResponse.model_validate(updated_record, from_attributes=True)
+    return _published(db, SleepRecordResponse.model_validate(updated_record, from_attributes=True))
 
 
 @router.delete("/{record_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -110,11 +130,13 @@ def delete_sleep_record(
     if not db_record:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="记录不存在")
 
-    verify_baby_access(db_record.baby_id, user_id, db)
+    baby_id = db_record.baby_id
+    verify_baby_access(baby_id, user_id, db)
 
     success = sleep_crud.delete_sleep_record(db, record_id)
     if not success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="删除失败")
+    _publish_sleep_state(db, baby_id)
     return None
 
 
@@ -124,11 +146,12 @@ def get_sleep_stats(
     user_id: Annotated[int, Depends(get_current_user_id)],
     db: Annotated[Session, Depends(get_db)],
     start_date: datetime = Query(..., description="开始日期"),
-    end_date: datetime = Query(..., description="结束日期")
+    end_date: datetime = Query(..., description="结束日期"),
+    group_by: Optional[Literal["day", "week", "month"]] = Query(None, description="按日/周/月分组返回序列")
 ):
     """获取指定日期范围的睡眠统计"""
     verify_baby_access(baby_id, user_id, db)
-    return sleep_crud.get_sleep_stats_by_date(db, baby_id, start_date, end_date)
+    return sleep_crud.get_sleep_stats_by_date(db, baby_id, start_date, end_date, group_by)
 @router.post("/start", response_model=SleepRecordResponse, status_code=status.HTTP_201_CREATED)
 def start_sleep_record(
     payload: SleepStartCreate,
@@ -137,7 +160,7 @@ def start_sleep_record(
 ):
     verify_baby_access(payload.baby_id, user_id, db)
     created = sleep_crud.create_sleep_start(db, payload.baby_id, payload.start_time, user_id, payload.source or 'manual', payload.position)
-    return SleepRecordResponse.model_validate(created, from_attributes=True)
+    return _published(db, SleepRecordResponse.model_validate(created, from_attributes=True))
 
 @router.post("/start/", response_model=SleepRecordResponse, status_code=status.HTTP_201_CREATED)
 def start_sleep_record_slash(
@@ -147,7 +170,7 @@ def start_sleep_record_slash(
 ):
     verify_baby_access(payload.baby_id, user_id, db)
     created = sleep_crud.create_sleep_start(db, payload.baby_id, payload.start_time, user_id, payload.source or 'manual', payload.position)
-    return SleepRecordResponse.model_validate(created, from_attributes=True)
+    return _published(db, SleepRecordResponse.model_validate(created, from_attributes=True))
 
 @router.patch("/{record_id}/stop", response_model=SleepRecordResponse)
 def stop_sleep_record(
@@ -164,7 +187,7 @@ def stop_sleep_record(
         updated_record = sleep_crud.stop_sleep_record(db, record_id, payload.end_time)
         if not updated_record:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="更新失败")
-        return SleepRecordResponse.model_validate(updated_record, from_attributes=True)
+        return _published(db, SleepRecordResponse.model_validate(updated_record, from_attributes=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -183,7 +206,7 @@ def stop_sleep_record_slash(
         updated_record = sleep_crud.stop_sleep_record(db, record_id, payload.end_time)
         if not updated_record:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="更新失败")
-        return SleepRecordResponse.model_validate(updated_record, from_attributes=True)
+        return _published(db, SleepRecordResponse.model_validate(updated_record, from_attributes=True))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -201,7 +224,7 @@ def auto_close_sleep_record(
     updated_record = sleep_crud.auto_close_sleep_record(db, record_id, payload.auto_closed_at)
     if not updated_record:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="更新失败")
-    return SleepRecordResponse.model_validate(updated_record, from_attributes=True)
+    return _published(db, SleepRecordResponse.model_validate(updated_record, from_attributes=True))
 
 @router.patch("/{record_id}/auto-close/", response_model=SleepRecordResponse)
 def auto_close_sleep_record_slash(
@@ -217,4 +240,4 @@ def auto_close_sleep_record_slash(
     updated_record = sleep_crud.auto_close_sleep_record(db, record_id, payload.auto_closed_at)
     if not updated_record:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="更新失败")
-    return SleepRecordResponse.model_validate(updated_record, from_attributes=True)
+    return _published(db, SleepRecordResponse.model_validate(updated_record, from_attributes=True))
@@ -0,0 +1,37 @@
+"""
+离线批量同步相关的 API 路由
+"""
+from typing import Annotated
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from wxcloudrun.core.database import get_db
+from wxcloudrun.core import live
+from wxcloudrun.utils.deps import get_current_user_id, verify_baby_access
+from wxcloudrun.crud import sleep as sleep_crud
+from wxcloudrun.crud import sync as sync_crud
+from wxcloudrun.schemas.sync import SyncBatchRequest, SyncBatchResponse
+
+router = APIRouter(
+    prefix="/api/sync",
+    tags=["离线同步"]
+)
+
+
+@router.post("/batch", response_model=SyncBatchResponse)
+def sync_batch(
+    batch: SyncBatchRequest,
+    user_id: Annotated[int, Depends(get_current_user_id)],
+    db: Annotated[Session, Depends(get_db)]
+):
+    """
+    批量上传离线队列中的记录
+
+    支持喂养、排便/排尿、睡眠、生长、吸奶、黄疸记录的新建与更新，data 与对应类型的创建/更新接口请求体相同。
+    单条校验失败（invalid）或要更新的记录不存在（not_found）不影响其他条目，其余条目在同一事务中写入。
+    """
+    verify_baby_access(batch.baby_id, user_id, db)
+    results = sync_crud.apply_sync_batch(db, batch.baby_id, user_id, batch.items)
+    # 写入了睡眠记录时推送宝宝当前进行中的睡眠（同睡眠记录接口）
+    if any(r.type == 'sleep' and r.status in ('created', 'updated') for r in results):
+        live.publish(db, batch.baby_id, "sleep_active", sleep_crud.get_active_sleep_state(db, batch.baby_id))
+    return SyncBatchResponse(results=results)
@@ -5,7 +5,8 @@ from typing import Annotated
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from wxcloudrun.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from wxcloudrun.core.database import get_db, get_async_db
 from wxcloudrun.schemas.user import UserCreate, UserUpdate, UserResponse
 from wxcloudrun.schemas.session import LoginRequest, LoginResponse
 from wxcloudrun.crud import user as user_crud
@@ -24,7 +25,7 @@ logger = logging.getLogger(__name__)
 @router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
 async def login(
     login_data: LoginRequest,
-    db: Annotated[Session, Depends(get_db)]
+    db: Annotated[AsyncSession, Depends(get_async_db)]
 ):
     """
     小程序登录接口
@@ -56,7 +57,7 @@ async def login(
             )
         
         # 2. 查询或创建用户
-        db_user = user_crud.get_user_by_openid(db, openid)
+        db_user = await user_crud.get_user_by_openid_async(db, openid)
         is_new_user = False
         
         if not db_user:
@@ -65,14 +66,14 @@ async def login(
                 openid=openid,
                 nickname=None  # 昵称由用户后续填写
             )
-            db_user = user_crud.create_user(db, new_user)
+            db_user = await user_crud.create_user_async(db, new_user)
             is_new_user = True
             logger.info(f"/api/users/login: created new user id={db_user.id} openid={openid}")
         else:
             logger.info(f"/api/users/login: existing user id={db_user.id} openid={openid}")
         
         # 3. 创建或更新会话记录
-        db_session = session_crud.create_or_update_session(
+        db_session = await session_crud.create_or_update_session_async(
             db=db,
             user_id=db_user.id,
             openid=openid,
@@ -25,6 +25,7 @@ class FeedingOngoingResponse(BaseModel):
     last_action_time: datetime
     accumulated_left: int
     accumulated_right: int
+    version: int = Field(0, description="版本号（每次状态切换+1，可用于忽略过期的推送）")
     updated_at: datetime
     
     # 计算属性：服务器当前时间（用于客户端校准）
@@ -0,0 +1,22 @@
+"""
+首页聚合数据相关的 Pydantic Schema
+"""
+from typing import Optional
+from pydantic import BaseModel, Field
+from .feeding import FeedingRecordResponse
+from .diaper import DiaperRecordResponse
+from .sleep import SleepRecordResponse
+from .growth import GrowthRecordResponse
+from .jaundice import JaundiceRecordResponse
+from .pumping import PumpingRecordResponse
+
+
+class HomeTimelineResponse(BaseModel):
+    """首页时间线（按记录类型分组）"""
+    feeding: list[FeedingRecordResponse] = Field(default_factory=list, description="喂养记录")
+    diaper: list[DiaperRecordResponse] = Field(default_factory=list, description="尿布记录")
+    sleep: list[SleepRecordResponse] = Field(default_factory=list, description="睡眠记录")
+    growth: list[GrowthRecordResponse] = Field(default_factory=list, description="生长记录")
+    jaundice: list[JaundiceRecordResponse] = Field(default_factory=list, description="黄疸记录")
+    pumping: list[PumpingRecordResponse] = Field(default_factory=list, description="吸奶记录")
+    next_cursor: Optional[str] = Field(None, description="下一页游标，为空表示没有更多")
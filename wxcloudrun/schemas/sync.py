@@ -0,0 +1,40 @@
+"""
+离线批量同步相关的 Pydantic Schema
+"""
+from typing import Any, Literal, Optional
+from pydantic import BaseModel, Field
+
+# 单次批量同步的最大条数
+SYNC_BATCH_MAX_ITEMS = 100
+
+SyncRecordType = Literal['feeding', 'diaper', 'sleep', 'growth', 'pumping', 'jaundice']
+
+
+class SyncItem(BaseModel):
+    """离线队列中的一条待上传操作"""
+    client_id: Optional[str] = Field(None, max_length=64, description="客户端队列中的标识（原样返回，用于对应结果）")
+    type: SyncRecordType = Field(..., description="记录类型")
+    op: Literal['create', 'update'] = Field(..., description="操作类型")
+    record_id: Optional[int] = Field(None, description="更新时的记录ID")
+    data: dict[str, Any] = Field(..., description="记录内容（与对应类型的创建/更新接口请求体相同，无需 baby_id）")
+
+
+class SyncBatchRequest(BaseModel):
+    """批量同步请求"""
+    baby_id: int = Field(..., description="宝宝ID")
+    items: list[SyncItem] = Field(..., min_length=1, max_length=SYNC_BATCH_MAX_ITEMS, description="待上传的操作（按队列顺序）")
+
+
+class SyncItemResult(BaseModel):
+    """单条操作的结果"""
+    client_id: Optional[str] = Field(None, description="客户端队列中的标识")
+    type: SyncRecordType = Field(..., description="记录类型")
+    op: Literal['create', 'update'] = Field(..., description="操作类型")
+    status: Literal['created', 'updated', 'invalid', 'not_found'] = Field(..., description="处理结果")
+    id: Optional[int] = Field(None, description="记录ID")
+    error: Optional[str] = Field(None, description="失败原因")
+
+
+class SyncBatchResponse(BaseModel):
+    """批量同步结果（与请求中的 items 一一对应）"""
+    results: list[SyncItemResult] = Field(..., description="各条操作的结果")
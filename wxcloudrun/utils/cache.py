@@ -0,0 +1,102 @@
+"""
+进程内缓存工具
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+from wxcloudrun.core.config import get_settings
+
+
+class TTLCache:
+    """带过期时间与容量上限的线程安全 LRU 缓存
+
+    - 每个条目有独立的过期时间，过期后视为未命中
+    - 超出容量时淘汰最久未使用的条目
+    - 记录命中/未命中次数，便于观察缓存效果
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """读取缓存，未命中或已过期返回 default"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            expire_at, value = item
+            if expire_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """写入缓存，ttl 为空时使用默认过期时间；ttl<=0 表示不缓存"""
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """使某个条目失效"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """使所有满足条件的 key 失效"""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """命中统计"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+_settings = get_settings()
+
+# 登录态缓存：X-Wx-Openid -> (user_id, session expires_at)
+# 仅在本进程内有效，写操作（登录/重置/登出/删除用户）时主动失效，多进程间依赖 TTL 兜底
+auth_cache = TTLCache(
+    maxsize=_settings.auth_cache_maxsize,
+    ttl=_settings.auth_cache_ttl_seconds,
+)
+
+# 小程序码缓存：(scene, page, width) -> {png, etag, base64}
+# scene 中包含邀请码，内容由 key 唯一决定；签发新邀请码时清理该宝宝旧码对应的条目
+qrcode_cache = TTLCache(
+    maxsize=_settings.qrcode_cache_maxsize,
+    ttl=_settings.qrcode_cache_ttl_seconds,
+)
+
+# 云存储临时链接缓存：file_id -> temp_file_url，条目过期时间取链接有效期减去安全余量
+file_url_cache = TTLCache(
+    maxsize=_settings.file_url_cache_maxsize,
+    ttl=0,
+)
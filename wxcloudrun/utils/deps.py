@@ -2,13 +2,17 @@
 依赖注入函数
 用于 FastAPI 路由的依赖项
 """
-from typing import Annotated
-from fastapi import Depends, HTTPException, Header, status
+from typing import Annotated, Optional
+from datetime import datetime
+from fastapi import Depends, HTTPException, Header, Query, status
 from sqlalchemy.orm import Session
-from wxcloudrun.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from wxcloudrun.core.database import get_db, get_async_db
 from wxcloudrun.core.config import get_settings
 from wxcloudrun.crud import user as user_crud, baby as baby_crud
 from wxcloudrun.crud import session as session_crud
+from wxcloudrun.utils.cache import auth_cache
+from wxcloudrun.utils.pagination import decode_cursor, NEXT_CURSOR_HEADER
 
 
 def get_current_user_id(
@@ -18,6 +22,9 @@ def get_current_user_id(
     """
     从请求头获取当前用户ID
     微信小程序云托管会自动在请求头中注入 X-Wx-Openid
+
+    校验结果会在进程内缓存（openid -> (user_id, 会话过期时间)），
+    命中缓存且会话未过期时不再访问数据库
     """
     if not x_wx_openid:
         raise HTTPException(
@@ -25,6 +32,13 @@ def get_current_user_id(
             detail="未找到用户身份信息"
         )
 
+    cached = auth_cache.get(x_wx_openid)
+    if cached is not None:
+        user_id, expires_at = cached
+        if expires_at > datetime.now():
+            return user_id
+        auth_cache.pop(x_wx_openid)
+
     # 根据 openid 查询用户
     user = user_crud.get_user_by_openid(db, x_wx_openid)
     if not user:
@@ -34,12 +48,53 @@ def get_current_user_id(
         )
 
     # 校验登录态是否有效（未登录或过期统一返回 401）
-    if not session_crud.is_session_valid(db, x_wx_openid):
+    db_session = session_crud.get_session_by_openid(db, x_wx_openid)
+    if not db_session or db_session.expires_at <= datetime.now():
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="登录态已过期或未登录，请重新登录"
         )
 
+    auth_cache.set(x_wx_openid, (user.id, db_session.expires_at))
+    return user.id
+
+
+async def get_current_user_id_async(
+    x_wx_openid: Annotated[str, Header()] = None,
+    db: Annotated[AsyncSession, Depends(get_async_db)] = None
+) -> int:
+    """
+    从请求头获取当前用户ID（异步版本，供 async def 路由使用）
+    校验逻辑与缓存同 get_current_user_id
+    """
+    if not x_wx_openid:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="未找到用户身份信息"
+        )
+
+    cached = auth_cache.get(x_wx_openid)
+    if cached is not None:
+        user_id, expires_at = cached
+        if expires_at > datetime.now():
+            return user_id
+        auth_cache.pop(x_wx_openid)
+
+    user = await user_crud.get_user_by_openid_async(db, x_wx_openid)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="用户不存在，请先登录"
+        )
+
+    db_session = await session_crud.get_session_by_openid_async(db, x_wx_openid)
+    if not db_session or db_session.expires_at <= datetime.now():
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="登录态已过期或未登录，请重新登录"
+        )
+
+    auth_cache.set(x_wx_openid, (user.id, db_session.expires_at))
     return user.id
 
 
@@ -74,6 +129,17 @@ def verify_baby_access(
         )
 
 
+async def verify_baby_access_async(baby_id: int, user_id: int, db: AsyncSession) -> None:
+    """
+    验证用户是否有权限访问该宝宝的数据（异步）
+    """
+    if not await baby_crud.is_family_member_async(db, baby_id, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="您没有权限访问此宝宝的信息"
+        )
+
+
 def verify_baby_admin(
     baby_id: int,
     user_id: Annotated[int, Depends(get_current_user_id)],
@@ -89,6 +155,24 @@ def verify_baby_admin(
         )
 
 
+def get_record_cursor(
+    cursor: Annotated[
+        Optional[str],
+        Query(description=f"分页游标（上一页响应头 {NEXT_CURSOR_HEADER} 的值）"),
+    ] = None,
+) -> Optional[tuple]:
+    """解析记录列表的分页游标，返回 (排序时间, id)；游标不合法时返回 400"""
+    if not cursor:
+        return None
+    try:
+        decoded = decode_cursor(cursor)
+        if len(decoded) != 2 or not isinstance(decoded[1], int):
+            raise ValueError("无效的分页游标")
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return decoded
+
+
 def require_admin_token(x_admin_token: Annotated[str | None, Header(alias="X-Admin-Token")] = None) -> None:
     settings = get_settings()
     if not settings.admin_token or not x_admin_token or x_admin_token != settings.admin_token:
@@ -0,0 +1,65 @@
+"""
+游标（keyset）分页工具
+
+游标对客户端是不透明的字符串，内部为 [排序时间, 其它排序键...] 的 JSON，
+经 base64url 编码后返回给客户端，下一页原样带回即可。
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional
+from sqlalchemy import tuple_
+
+# 记录列表接口的响应体仍为数组（兼容旧客户端），下一页游标通过该响应头返回
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_time: datetime, *keys: Any) -> str:
+    """将排序时间与其它排序键编码为游标"""
+    payload = [sort_time.isoformat(), *keys]
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """解析游标，返回 (排序时间, 其它排序键...)
+
+    Raises:
+        ValueError: 游标格式不合法
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(payload, list) or len(payload) < 2:
+            raise ValueError
+        return (datetime.fromisoformat(payload[0]), *payload[1:])
+    except (ValueError, TypeError, UnicodeError, json.JSONDecodeError):
+        raise ValueError("无效的分页游标")
+
+
+def keyset_condition(sort_col, id_col, cursor: tuple, descending: bool = True):
+    """(排序时间, id) 游标条件：取排在游标之后的记录，可直接利用 (baby_id, 时间) 索引"""
+    cursor_time, cursor_id = cursor
+    if descending:
+        return tuple_(sort_col, id_col) < tuple_(cursor_time, cursor_id)
+    return tuple_(sort_col, id_col) > tuple_(cursor_time, cursor_id)
+
+
+def split_page(records: list, limit: Optional[int], sort_attr: str) -> tuple[list, Optional[str]]:
+    """拆分当前页与下一页游标
+
+    调用方按 limit + 1 查询，多出的一条仅用于判断是否还有下一页。
+
+    Returns:
+        (当前页记录, 下一页游标；没有更多数据时为 None)
+    """
+    if limit is None or len(records) <= limit:
+        return records, None
+    records = records[:limit]
+    last = records[-1]
+    return records, encode_cursor(getattr(last, sort_attr), last.id)
+
+
+def next_cursor_headers(next_cursor: Optional[str]) -> Optional[dict[str, str]]:
+    """下一页游标响应头"""
+    return {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
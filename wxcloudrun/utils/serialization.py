@@ -0,0 +1,48 @@
+"""
+响应序列化工具
+
+列表接口直接返回 ORM 对象时，FastAPI 会先逐条 model_validate、再按 response_model 整体重新校验、
+最后 jsonable_encoder 转换后才渲染 JSON。这里用预先构建并缓存的 TypeAdapter 一次完成
+「ORM -> 模型」的批量校验，并由 pydantic-core 直接序列化为 JSON 字节，返回 Response 跳过
+FastAPI 的二次校验。路由上的 response_model 仍保留，仅用于接口文档。
+"""
+from functools import lru_cache
+from typing import Any, Iterable, Optional
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+
+class PydanticJSONResponse(Response):
+    """已序列化好的 JSON 字节响应"""
+    media_type = "application/json"
+
+
+@lru_cache(maxsize=None)
+def get_adapter(tp: Any) -> TypeAdapter:
+    """获取（并缓存）类型对应的 TypeAdapter，构建 schema 的开销只在首次发生"""
+    return TypeAdapter(tp)
+
+
+def dump_json(tp: Any, data: Any) -> bytes:
+    """按类型 tp 校验 data（支持 ORM 对象）并序列化为 JSON 字节"""
+    adapter = get_adapter(tp)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True), by_alias=True)
+
+
+def model_response(
+    tp: Any,
+    data: Any,
+    status_code: int = status.HTTP_200_OK,
+    headers: Optional[dict[str, str]] = None,
+) -> PydanticJSONResponse:
+    """按类型 tp 序列化 data 并直接返回响应"""
+    return PydanticJSONResponse(content=dump_json(tp, data), status_code=status_code, headers=headers)
+
+
+def model_list_response(
+    model: type,
+    rows: Iterable[Any],
+    headers: Optional[dict[str, str]] = None,
+) -> PydanticJSONResponse:
+    """将一组 ORM 对象按 list[model] 序列化并直接返回响应"""
+    return model_response(list[model], rows if isinstance(rows, list) else list(rows), headers=headers)
@@ -1,12 +1,18 @@
 """
 微信 API 工具类
 """
-import httpx
+import asyncio
+import base64
+import hashlib
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 from wxcloudrun.core.config import get_settings
+from wxcloudrun.utils.cache import qrcode_cache, file_url_cache
+
+if TYPE_CHECKING:
+    import httpx
 
 
 class WeChatAPIError(Exception):
@@ -20,20 +26,114 @@ class WeChatAPIError(Exception):
  
 
 
+def _response_errcode(response: "httpx.Response") -> str:
+    """微信接口响应的 errcode（图片等非 JSON 成功响应记为 0），用于指标标签"""
+    if response.status_code >= 400:
+        return f"http_{response.status_code}"
+    if response.headers.get("Content-Type", "").startswith("image/"):
+        return "0"
+    try:
+        data = response.json()
+    except ValueError:
+        return "invalid_json"
+    return str(data.get("errcode", 0)) if isinstance(data, dict) else "invalid_json"
+
+
 class WeChatAPI:
-    """微信小程序 API 客户端"""
-    
-    BASE_URL = "https://api.weixin.qq.com"
+    """微信小程序 API 客户端
+
+    进程内复用同一个 httpx.AsyncClient（连接池 + keep-alive + HTTP/2），
+    由应用启动/关闭事件负责创建与释放。
+    """
     
     def __init__(self):
         settings = get_settings()
         self.appid = settings.wx_appid
         self.appsecret = settings.wx_appsecret
         self.verify = settings.ca_bundle_path or settings.http_verify
+        self.BASE_URL = settings.wx_api_base_url.rstrip("/")
+        self.settings = settings
         self.logger = logging.getLogger(__name__)
+        self._client: Optional["httpx.AsyncClient"] = None
+
+        # access_token 进程内缓存
+        self._token: Optional[str] = None
+        self._token_expires_at: datetime = datetime.min
+        self._token_lock = asyncio.Lock()
+        self._token_refresh_task: Optional[asyncio.Task] = None
         
         if not self.appid or not self.appsecret:
             raise ValueError("微信小程序 AppID 和 AppSecret 未配置")
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """获取共享的 HTTP 客户端（首次使用时创建，httpx 也在此时才导入以缩短冷启动）"""
+        if self._client is None or self._client.is_closed:
+            import httpx
+
+            settings = self.settings
+            self._client = httpx.AsyncClient(
+                verify=self.verify,
+                http2=settings.wx_http2,
+                limits=httpx.Limits(
+                    max_connections=settings.wx_http_max_connections,
+                    max_keepalive_connections=settings.wx_http_max_keepalive,
+                    keepalive_expiry=settings.wx_http_keepalive_expiry,
+                ),
+                timeout=httpx.Timeout(
+                    settings.wx_http_timeout,
+                    connect=settings.wx_http_connect_timeout,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """关闭共享的 HTTP 客户端"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    async def _request(self, api: str, method: str, url: str, idempotent: bool = True, **kwargs) -> "httpx.Response":
+        """
+        发送请求，超时与 5xx 时按指数退避重试；按接口名 api 记录耗时与 errcode 指标
+
+        非幂等请求（如发送订阅消息）只在连接未建立时重试，避免重复下发
+        """
+        if not self.settings.metrics_enabled:
+            return await self._request_with_retry(method, url, idempotent, **kwargs)
+
+        from wxcloudrun.core.metrics import observe_wechat_call
+
+        started = time.perf_counter()
+        try:
+            response = await self._request_with_retry(method, url, idempotent, **kwargs)
+        except Exception:
+            observe_wechat_call(api, time.perf_counter() - started, "exception")
+            raise
+        observe_wechat_call(api, time.perf_counter() - started, _response_errcode(response))
+        return response
+
+    async def _request_with_retry(self, method: str, url: str, idempotent: bool, **kwargs) -> "httpx.Response":
+        import httpx
+
+        retries = self.settings.wx_http_retries
+        backoff = self.settings.wx_http_retry_backoff
+        attempt = 0
+        while True:
+            try:
+                response = await self._get_client().request(method, url, **kwargs)
+                if response.status_code < 500 or not idempotent or attempt >= retries:
+                    return response
+                self.logger.warning(f"WeChatAPI._request: status={response.status_code} attempt={attempt + 1}, retrying")
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                if attempt >= retries:
+                    raise
+                self.logger.warning(f"WeChatAPI._request: {type(e).__name__} attempt={attempt + 1}, retrying")
+            except httpx.TimeoutException as e:
+                if not idempotent or attempt >= retries:
+                    raise
+                self.logger.warning(f"WeChatAPI._request: {type(e).__name__} attempt={attempt + 1}, retrying")
+            await asyncio.sleep(backoff * (2 ** attempt))
+            attempt += 1
     
     async def code2session(self, code: str) -> Dict[str, str]:
         """
@@ -61,9 +161,9 @@ class WeChatAPI:
         }
         
         self.logger.info("WeChatAPI.code2session: request begin")
-        async with httpx.AsyncClient(verify=self.verify) as client:
-            response = await client.get(url, params=params)
-            data = response.json()
+        # code 只能使用一次，仅在连接未建立时重试
+        response = await self._request("code2session", "GET", url, idempotent=False, params=params)
+        data = response.json()
         self.logger.info(f"WeChatAPI.code2session: response received errcode={data.get('errcode')} openid={data.get('openid')}")
         
         # 检查错误
@@ -107,9 +207,8 @@ class WeChatAPI:
         }
         
         try:
-            async with httpx.AsyncClient(verify=self.verify) as client:
-                response = await client.get(url, params=params)
-                data = response.json()
+            response = await self._request("checksession", "GET", url, params=params)
+            data = response.json()
             self.logger.info(f"WeChatAPI.check_session_key: response errcode={data.get('errcode')} openid={openid}")
             # errcode=0 表示有效，errcode=87009 表示无效
             return data.get("errcode") == 0
@@ -149,9 +248,8 @@ class WeChatAPI:
         }
         
         self.logger.info("WeChatAPI.reset_session_key: request begin")
-        async with httpx.AsyncClient(verify=self.verify) as client:
-            response = await client.post(url, params=params, json=data)
-            result = response.json()
+        response = await self._request("resetsessionkey", "POST", url, idempotent=False, params=params, json=data)
+        result = response.json()
         self.logger.info(f"WeChatAPI.reset_session_key: response errcode={result.get('errcode')} openid={result.get('openid')}")
         
         # 检查错误
@@ -164,24 +262,35 @@ class WeChatAPI:
             "session_key": result.get("session_key")
         }
     
-    async def _get_access_token(self) -> str:
-        """
-        获取接口调用凭证 access_token（数据库缓存）
-        """
+    def _load_token_from_db(self) -> Optional[tuple[str, datetime]]:
+        """从数据库读取未过期的 access_token（多进程共享的真实来源）"""
         from wxcloudrun.core.database import SessionLocal
-        from wxcloudrun.crud.wechat_token import get_token, upsert_token
+        from wxcloudrun.crud.wechat_token import get_token
 
-        # 1. 读缓存
         try:
             with SessionLocal() as db:
                 rec = get_token(db, self.appid)
                 if rec and rec.expires_at > datetime.utcnow():
-                    return rec.token
+                    return rec.token, rec.expires_at
         except Exception:
             # 数据库不可用或表未创建时，跳过DB缓存
             pass
+        return None
+
+    def _save_token_to_db(self, token: str, expires_at: datetime) -> None:
+        """写入数据库，供其他进程复用"""
+        from wxcloudrun.core.database import SessionLocal
+        from wxcloudrun.crud.wechat_token import upsert_token
 
-        # 2. 请求微信
+        try:
+            with SessionLocal() as db:
+                upsert_token(db, self.appid, token, expires_at)
+            self.logger.info("wechat.token: cached to db successfully")
+        except Exception:
+            self.logger.warning("wechat.token: cache to db failed, continue without db cache")
+
+    async def _fetch_access_token(self) -> tuple[str, datetime]:
+        """请求微信 /cgi-bin/token"""
         url = f"{self.BASE_URL}/cgi-bin/token"
         params = {
             "grant_type": "client_credential",
@@ -189,25 +298,61 @@ class WeChatAPI:
             "secret": self.appsecret
         }
         self.logger.info(f"wechat.token: request begin appid={self.appid}")
-        async with httpx.AsyncClient(verify=self.verify) as client:
-            response = await client.get(url, params=params)
-            data = response.json()
+        response = await self._request("token", "GET", url, params=params)
+        data = response.json()
         self.logger.info(f"wechat.token: response errcode={data.get('errcode')} expires_in={data.get('expires_in')}")
         if "errcode" in data and data["errcode"] != 0:
             raise WeChatAPIError(data["errcode"], data.get("errmsg", "未知错误"))
         token = data.get("access_token")
         expires_in = int(data.get("expires_in", 7200))
         expire_at_dt = datetime.utcnow() + timedelta(seconds=max(expires_in - 120, 300))
+        return token, expire_at_dt
+
+    async def _refresh_access_token(self) -> str:
+        """刷新 access_token（single-flight：同一进程内同时只有一个刷新在进行）"""
+        async with self._token_lock:
+            now = datetime.utcnow()
+            margin = timedelta(seconds=self.settings.wx_token_refresh_margin)
 
-        # 3. 写缓存
+            # 等锁期间可能已被其他协程刷新
+            if self._token and self._token_expires_at - now > margin:
+                return self._token
+
+            # 其他进程可能已经刷新并写入数据库
+            cached = await asyncio.to_thread(self._load_token_from_db)
+            if cached and cached[1] - now > margin:
+                self._token, self._token_expires_at = cached
+                return self._token
+
+            token, expires_at = await self._fetch_access_token()
+            self._token, self._token_expires_at = token, expires_at
+            await asyncio.to_thread(self._save_token_to_db, token, expires_at)
+            return token
+
+    async def _background_refresh_access_token(self) -> None:
         try:
-            with SessionLocal() as db:
-                upsert_token(db, self.appid, token, expire_at_dt)
-            self.logger.info("wechat.token: cached to db successfully")
+            await self._refresh_access_token()
         except Exception:
-            self.logger.warning("wechat.token: cache to db failed, continue without db cache")
+            self.logger.exception("wechat.token: background refresh failed")
+
+    async def _get_access_token(self) -> str:
+        """
+        获取接口调用凭证 access_token
+
+        两级缓存：进程内存 -> 数据库 -> 微信接口
+        距离过期不足 wx_token_refresh_margin 秒时在后台提前刷新，调用方继续使用当前 token；
+        已过期时所有调用方等待同一次刷新的结果
+        """
+        now = datetime.utcnow()
+        if self._token and self._token_expires_at > now:
+            margin = timedelta(seconds=self.settings.wx_token_refresh_margin)
+            if self._token_expires_at - now <= margin and (
+                self._token_refresh_task is None or self._token_refresh_task.done()
+            ):
+                self._token_refresh_task = asyncio.create_task(self._background_refresh_access_token())
+            return self._token
 
-        return token
+        return await self._refresh_access_token()
 
     async def get_wxacode_unlimit(self, scene: str, page: str, width: int = 430) -> bytes:
         """
@@ -232,13 +377,12 @@ class WeChatAPI:
             "check_path": False
         }
         self.logger.info(f"wechat.qrcode: request scene={scene} page={page}")
-        async with httpx.AsyncClient(verify=self.verify) as client:
-            resp = await client.post(url, json=payload)
-            content_type = resp.headers.get("Content-Type", "")
-            if content_type.startswith("image/"):
-                self.logger.info("wechat.qrcode: success image returned")
-                return resp.content
-            data = resp.json()
+        resp = await self._request("wxacode", "POST", url, json=payload)
+        content_type = resp.headers.get("Content-Type", "")
+        if content_type.startswith("image/"):
+            self.logger.info("wechat.qrcode: success image returned")
+            return resp.content
+        data = resp.json()
         self.logger.error(f"wechat.qrcode: error errcode={data.get('errcode')} errmsg={data.get('errmsg')}")
         raise WeChatAPIError(data.get("errcode", -1), data.get("errmsg", "获取小程序码失败"))
 
@@ -270,9 +414,8 @@ class WeChatAPI:
         }
         
         self.logger.info(f"wechat.subscribe_msg: request openid={openid} template_id={template_id}")
-        async with httpx.AsyncClient(verify=self.verify) as client:
-            resp = await client.post(url, json=payload)
-            result = resp.json()
+        resp = await self._request("subscribe", "POST", url, idempotent=False, json=payload)
+        result = resp.json()
             
         self.logger.info(f"wechat.subscribe_msg: response errcode={result.get('errcode')} errmsg={result.get('errmsg')}")
         
@@ -301,9 +444,8 @@ class WeChatAPI:
         }
         
         self.logger.info(f"wechat.batch_download_file: request count={len(file_list)}")
-        async with httpx.AsyncClient(verify=self.verify) as client:
-            resp = await client.post(url, json=payload)
-            result = resp.json()
+        resp = await self._request("batchdownloadfile", "POST", url, json=payload)
+        result = resp.json()
             
         self.logger.info(f"wechat.batch_download_file: response errcode={result.get('errcode')}")
         
@@ -323,3 +465,74 @@ def get_wechat_api() -> WeChatAPI:
         # 创建单例实例，复用内部配置与缓存逻辑
         globals()["_WX_API_INSTANCE"] = WeChatAPI()
     return _WX_API_INSTANCE
+
+
+async def close_wechat_client() -> None:
+    """应用关闭时释放共享 HTTP 客户端"""
+    if _WX_API_INSTANCE is not None:
+        await _WX_API_INSTANCE.aclose()
+
+
+async def get_wxacode_unlimit_cached(scene: str, page: str, width: int = 430) -> dict:
+    """
+    获取小程序码（带进程内 LRU 缓存）
+
+    Returns:
+        {"png": PNG 二进制, "etag": 强校验 ETag, "base64": PNG 的 Base64 编码}
+    """
+    key = (scene, page, width)
+    entry = qrcode_cache.get(key)
+    if entry is None:
+        png = await get_wechat_api().get_wxacode_unlimit(scene, page, width)
+        entry = {
+            "png": png,
+            "etag": f'"{hashlib.sha256(png).hexdigest()[:32]}"',
+            "base64": base64.b64encode(png).decode("ascii"),
+        }
+        qrcode_cache.set(key, entry)
+    return entry
+
+
+# batchDownloadFile 单次请求的文件数上限
+BATCH_DOWNLOAD_FILE_LIMIT = 50
+
+
+async def get_temp_file_urls(file_ids: list[str]) -> dict[str, str]:
+    """
+    获取云存储文件的临时下载链接（带进程内缓存）
+
+    只有未命中缓存的 file_id 会分批请求微信；缓存时长为链接有效期减去安全余量
+
+    Returns:
+        file_id -> temp_file_url，获取失败的文件不在结果中
+    """
+    settings = get_settings()
+    url_map: dict[str, str] = {}
+    missing: list[str] = []
+    for file_id in dict.fromkeys(file_ids):
+        url = file_url_cache.get(file_id)
+        if url is None:
+            missing.append(file_id)
+        else:
+            url_map[file_id] = url
+
+    if not missing:
+        return url_map
+
+    wx_api = get_wechat_api()
+    for i in range(0, len(missing), BATCH_DOWNLOAD_FILE_LIMIT):
+        chunk = missing[i:i + BATCH_DOWNLOAD_FILE_LIMIT]
+        download_list = await wx_api.batch_download_file(
+            [{"fileid": file_id, "max_age": settings.file_url_max_age} for file_id in chunk]
+        )
+        for item in download_list:
+            if item.get("status") != 0 or not item.get("temp_file_url"):
+                continue
+            max_age = int(item.get("max_age") or settings.file_url_max_age)
+            file_url_cache.set(
+                item["fileid"],
+                item["temp_file_url"],
+                ttl=max_age - settings.file_url_safety_margin,
+            )
+            url_map[item["fileid"]] = item["temp_file_url"]
+    return url_map